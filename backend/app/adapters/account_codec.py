@@ -0,0 +1,37 @@
+from typing import Dict, List
+from pydantic import TypeAdapter
+from app.schemas.account import Account
+
+# Built once: creating a TypeAdapter compiles the validator and serializer of the whole list
+ACCOUNT_LIST = TypeAdapter(List[Account])
+
+def accounts_from_revisions(revisions: List[Dict]) -> List[Account]:
+    """
+    Build the accounts of a list of vault document revisions in one batch.
+
+    The whole list is validated by a single call into pydantic-core instead of
+    constructing each model from Python, which is about twice as fast on large
+    pages. Vault metadata fields (`_id`, `_vault_md`) are ignored.
+
+    Args:
+        revisions (List[Dict]): The revisions returned by a vault search.
+
+    Returns:
+        List[Account]: The accounts, in the order of the revisions.
+
+    Raises:
+        pydantic.ValidationError: If a document is not a valid account.
+    """
+    return ACCOUNT_LIST.validate_python([revision.get("document", {}) for revision in revisions])
+
+def dump_accounts(accounts: List[Account]) -> bytes:
+    """
+    Serialize accounts to a JSON array without validating them again.
+
+    Args:
+        accounts (List[Account]): Accounts already validated.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    return ACCOUNT_LIST.dump_json(accounts)
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class AccountCounter:
+    """
+    In-memory account count kept close to the vault without a call per read.
+
+    The count is seeded from the vault, incremented locally after every
+    successful write and reconciled with the vault by a background task every
+    `max_staleness` seconds. Reads only go to the vault when the count was never
+    seeded or the last reconciliation is older than the staleness bound. Writes
+    counted while a reconciliation is running are added to the fetched count.
+
+    Attributes:
+        max_staleness (float): Maximum age, in seconds, of a served count.
+        value (Optional[int]): The current count, None until seeded.
+        reconciled_at (float): Monotonic time of the last reconciliation.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[int]], max_staleness: float = 30.0):
+        """
+        Initializes an unseeded counter.
+
+        Args:
+            fetch (Callable): Coroutine function returning the count stored in the vault.
+            max_staleness (float, optional): Maximum age of a served count, in seconds. Defaults to 30.0.
+        """
+        self._fetch = fetch
+        self.max_staleness = max_staleness
+        self.value: Optional[int] = None
+        self.reconciled_at = 0.0
+        self._written = 0
+        self._single_flight = SingleFlight()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the last reconciliation."""
+        return time.monotonic() - self.reconciled_at
+
+    async def get(self) -> int:
+        """
+        Return the account count, reconciling with the vault only when needed.
+
+        Returns:
+            int: The account count.
+        """
+        if self.value is None or self.age > self.max_staleness:
+            await self.reconcile()
+        return self.value
+
+    def increment(self, amount: int = 1):
+        """
+        Account for accounts written successfully since the last reconciliation.
+
+        Args:
+            amount (int, optional): Number of accounts written. Defaults to 1.
+        """
+        self._written += amount
+        if self.value is not None:
+            self.value += amount
+
+    async def reconcile(self):
+        """Replace the local count with the vault one. Concurrent calls share one vault request."""
+        await self._single_flight.do("reconcile", self._reconcile)
+
+    async def _reconcile(self):
+        written = self._written
+        count = await self._fetch()
+        self.value = count + self._written - written
+        self.reconciled_at = time.monotonic()
+
+    def start(self):
+        """Start the background reconciliation task."""
+        if self._loop_task is None:
+            self._loop_task = asyncio.get_running_loop().create_task(self._reconcile_forever())
+
+    async def _reconcile_forever(self):
+        while True:
+            await asyncio.sleep(self.max_staleness)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning("Account count reconciliation failed: %s", e)
+
+    async def close(self):
+        """Stop the background reconciliation task."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
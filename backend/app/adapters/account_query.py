@@ -0,0 +1,94 @@
+import math
+import re
+from typing import Any, Dict, List, Optional
+from app.immudb.query import field_comparison, order_by
+from app.schemas.account_filter import AccountFilter
+from app.schemas.account_sort import AccountSort
+
+# Vault fields of the sort orders; `created` is the vault write timestamp
+SORT_FIELDS = {
+    "amount": "amount",
+    "account_number": "account_number",
+    "created": "_vault_md.ts"
+}
+
+def build_account_query(filters: Optional[AccountFilter],
+                        sort: Optional[AccountSort] = None) -> Optional[Dict[str, Any]]:
+    """
+    Translate account filters and sort order into a vault search query.
+
+    Every filter becomes a field comparison of a single expression, so they are
+    all required to match. The name and IBAN filters are anchored regular
+    expressions (`LIKE`). The `amount` field is an INTEGER in the vault, so
+    fractional bounds are rounded inwards, which selects the same accounts.
+    The sort order becomes the `orderBy` of the query.
+
+    Args:
+        filters (Optional[AccountFilter]): The filters.
+        sort (Optional[AccountSort], optional): The sort order. Defaults to None
+            (the vault order).
+
+    Returns:
+        Optional[Dict[str, Any]]: The query, None when no filter nor sort order is set.
+    """
+    if (filters is None or filters.is_empty()) and sort is None:
+        return None
+
+    query: Dict[str, Any] = {}
+    if filters is not None and not filters.is_empty():
+        query["expressions"] = [{"fieldComparisons": _field_comparisons(filters)}]
+    if sort is not None:
+        query["orderBy"] = [order_by(SORT_FIELDS[sort.value.lstrip("-")], sort.value.startswith("-"))]
+    return query
+
+def _field_comparisons(filters: AccountFilter) -> List[Dict[str, Any]]:
+    comparisons = []
+    if filters.type is not None:
+        comparisons.append(field_comparison("type", "EQ", filters.type.value))
+    if filters.amount_min is not None:
+        comparisons.append(field_comparison("amount", "GE", math.ceil(filters.amount_min)))
+    if filters.amount_max is not None:
+        comparisons.append(field_comparison("amount", "LE", math.floor(filters.amount_max)))
+    if filters.account_name is not None:
+        comparisons.append(field_comparison("account_name", "LIKE", "^" + re.escape(filters.account_name)))
+    if filters.iban_country is not None:
+        comparisons.append(field_comparison("iban", "LIKE", "^" + filters.iban_country))
+    return comparisons
+
+def build_lookup_query(account_numbers: List[int]) -> Dict[str, Any]:
+    """
+    Build a vault search query matching accounts by number, served by the
+    unique `account_number` index.
+
+    The vault has no `IN` operator, so each number is an expression with an
+    exact match and the expressions are OR'ed.
+
+    Args:
+        account_numbers (List[int]): The account numbers.
+
+    Returns:
+        Dict[str, Any]: The query.
+    """
+    return {"expressions": [
+        {"fieldComparisons": [field_comparison("account_number", "EQ", account_number)]}
+        for account_number in account_numbers
+    ]}
+
+def query_cache_key(query: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """
+    Return a hashable key identifying a query built by `build_account_query`.
+
+    Args:
+        query (Optional[Dict[str, Any]]): The query.
+
+    Returns:
+        Optional[tuple]: The key, None for the unfiltered listing.
+    """
+    if not query:
+        return None
+    expressions = tuple(
+        tuple((c["field"], c["operator"], c["value"]) for c in expression["fieldComparisons"])
+        for expression in query.get("expressions", [])
+    )
+    sort_keys = tuple((key["field"], key["desc"]) for key in query.get("orderBy", []))
+    return expressions, sort_keys
@@ -0,0 +1,142 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Tuple
+
+class TTLCache:
+    """
+    Bounded in-memory cache with LRU eviction and per-entry time-to-live.
+
+    The cache is versioned: `invalidate()` drops every entry and bumps the
+    version, so values loaded while a write was happening are never stored.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept.
+        ttl (float): Seconds an entry stays valid.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required a load.
+        version (int): Incremented on every invalidation.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 5.0):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int, optional): Maximum number of entries kept. Defaults to 256.
+            ttl (float, optional): Seconds an entry stays valid. Defaults to 5.0.
+        """
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key, counting the hit or miss.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Tuple[bool, Any]: Whether a valid entry was found, and its value.
+        """
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+
+        self.misses += 1
+        return False, None
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable):
+        """
+        Remove a single entry, if present.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self._entries.pop(key, None)
+
+    def invalidate_keys(self, keys: Iterable[Hashable]):
+        """
+        Drop the entries of some keys and bump the cache version.
+
+        Other entries are kept; values being loaded while the keys were
+        written are not stored.
+
+        Args:
+            keys (Iterable[Hashable]): The keys written.
+        """
+        for key in keys:
+            self._entries.pop(key, None)
+        self.version += 1
+
+    def invalidate(self):
+        """Drop every entry and bump the cache version."""
+        self._entries.clear()
+        self.version += 1
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for a key, loading and storing it on a miss.
+
+        Errors raised by the loader are propagated and never cached.
+
+        Args:
+            key (Hashable): The cache key.
+            loader (Callable): Coroutine function producing the value on a miss.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+
+        version = self.version
+        value = await loader()
+
+        if version == self.version:
+            self.set(key, value)
+
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict[str, Any]: Size, hits, misses, hit ratio and version of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "version": self.version
+        }
@@ -0,0 +1,43 @@
+import base64
+import json
+from typing import Optional, Tuple
+
+def encode_cursor(search_id: Optional[str], page: int, count: int) -> str:
+    """
+    Encode the position of a paginated vault search into an opaque cursor.
+
+    Args:
+        search_id (Optional[str]): The vault `searchId` of the open search, if any.
+        page (int): The next page to fetch.
+        count (int): The page size of the search.
+
+    Returns:
+        str: A URL-safe cursor token.
+    """
+    raw = json.dumps({"s": search_id, "p": page, "n": count}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], int, int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor token.
+
+    Returns:
+        Tuple[Optional[str], int, int]: The vault `searchId`, the page and the page size.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        search_id, page, count = position["s"], int(position["p"]), int(position["n"])
+    except Exception:
+        raise ValueError("Invalid cursor.")
+
+    if (search_id is not None and not isinstance(search_id, str)) or page < 1 or count < 1:
+        raise ValueError("Invalid cursor.")
+
+    return search_id, page, count
@@ -1,7 +1,61 @@
+import asyncio
 import httpx
+import logging
+from typing import Any, Dict, Iterable, List, Optional
 from app.schemas.account import Account, account_schema
+from app.schemas.account_batch import AccountBatchResult
+from app.schemas.account_filter import AccountFilter
+from app.schemas.account_lookup import AccountLookupResult
+from app.schemas.account_page import AccountPage
+from app.schemas.account_sort import AccountSort
+from app.schemas.export_format import ExportFormat
 from app.immudb.client import Client
+from app.immudb.admission import AdmissionController
+from app.immudb.connection_pool import ConnectionPool
+from app.immudb.resilience import ResiliencePolicy, VaultUnavailableError
+from app.immudb.sandbox import FaultInjector, LatencyModel
+from app.settings import Settings
+from app.tracing import span
 from .immudb_adapter_response import ImmuDBAdapterResponse
+from .account_codec import accounts_from_revisions
+from .account_counter import AccountCounter
+from .account_export import encode_documents, export_header
+from .account_query import build_account_query, build_lookup_query, query_cache_key
+from .cursor import decode_cursor, encode_cursor
+from .cache import TTLCache
+from .schema_fingerprint import SchemaFingerprintCache
+from .schema_migration import create_indexes, missing_indexes
+from .single_flight import SingleFlight
+from .write_batcher import WriteBatcher
+
+logger = logging.getLogger(__name__)
+
+VAULT_ERROR_MESSAGES = {
+    400: "Vault: Request validation exception",
+    402: "Vault: Payment required",
+    403: "Vault: Forbidden",
+    404: "Vault: Not found",
+    409: "Vault: Conflict",
+    413: "Vault: Document too big",
+    429: "Vault: Too many requests",
+    500: "Vault: Internal server error",
+    503: "Vault: Service unavailable"
+}
+
+def vault_error_message(status_code: Optional[int]) -> str:
+    """
+    Translate a vault HTTP status code into the error message returned to clients.
+
+    Args:
+        status_code (Optional[int]): The vault HTTP status, or None when the vault
+            could not be reached.
+
+    Returns:
+        str: The error message.
+    """
+    if status_code is None:
+        return "Vault is unreachable."
+    return VAULT_ERROR_MESSAGES.get(status_code, "Vault unknown error.")
 
 class ImmuDBAdapter():
     """
@@ -32,25 +86,173 @@ class ImmuDBAdapter():
         self.base_url = base_url
         self.api_key = api_key
         self.client = None
+        self.write_batcher = None
+        self.account_counter = None
+        self.single_flight = SingleFlight()
+        self.write_generation = 0
+        self.ready = False
+        self.readiness_error = None
+        self._schema_task = None
+
+        settings = Settings()
+        self.schema_cache = None
+        if settings.IMMUDB_SCHEMA_CACHE_TTL > 0:
+            self.schema_cache = SchemaFingerprintCache(
+                settings.IMMUDB_SCHEMA_CACHE_PATH,
+                ttl=settings.IMMUDB_SCHEMA_CACHE_TTL
+            )
+
+        self.page_cache = None
+        if settings.IMMUDB_PAGE_CACHE_TTL > 0:
+            self.page_cache = TTLCache(
+                max_size=settings.IMMUDB_PAGE_CACHE_SIZE,
+                ttl=settings.IMMUDB_PAGE_CACHE_TTL
+            )
+
+        self.account_cache = None
+        if settings.IMMUDB_ACCOUNT_CACHE_TTL > 0:
+            self.account_cache = TTLCache(
+                max_size=settings.IMMUDB_ACCOUNT_CACHE_SIZE,
+                ttl=settings.IMMUDB_ACCOUNT_CACHE_TTL
+            )
 
     async def connect(self):
+        """
+        Create the vault client and verify (or create) the collection.
+
+        The adapter is marked as ready once the vault and the collection are verified.
+
+        Raises:
+            ConnectionError: If the vault or the collection is not available.
+        """
+        self.client = self._build_client()
+
+        if not self.sandbox:
+            await self.client.open()
+
+            await self._check_or_create_collection()
+
+        settings = Settings()
+        if settings.IMMUDB_WRITE_BATCHING:
+            self.write_batcher = WriteBatcher(
+                self._flush_account_batch,
+                max_batch_size=settings.IMMUDB_WRITE_BATCH_MAX_SIZE,
+                max_delay_ms=settings.IMMUDB_WRITE_BATCH_MAX_DELAY_MS
+            )
+
+        if settings.IMMUDB_COUNT_MAX_STALENESS > 0:
+            self.account_counter = AccountCounter(
+                self._fetch_account_count,
+                max_staleness=settings.IMMUDB_COUNT_MAX_STALENESS
+            )
+            self.account_counter.start()
+
+        self.ready = True
+        self.readiness_error = None
+
+    async def close(self):
+        """Flush pending writes and release the vault client and its pooled connections."""
+        self.ready = False
+        if self._schema_task is not None:
+            self._schema_task.cancel()
+            try:
+                await self._schema_task
+            except asyncio.CancelledError:
+                pass
+            self._schema_task = None
+        if self.account_counter is not None:
+            await self.account_counter.close()
+        if self.write_batcher is not None:
+            await self.write_batcher.close()
+        if self.client is not None:
+            await self.client.close()
+
+    def _build_client(self) -> Client:
+        """Build the sandbox or production vault client from the application settings."""
         if self.sandbox:
-            self.client = Client(
+            return Client(
                 "test_ledger", 
                 "http://example.com", 
                 "test_api_key", 
-                True
+                True,
+                latency=self._build_latency_model(),
+                faults=self._build_fault_injector()
             )
 
-        else:
-            self.client = Client(
-                self.ledger,
-                self.base_url,
-                self.api_key,
-                False
-            )
+        return Client(
+            self.ledger,
+            self.base_url,
+            self.api_key,
+            False,
+            pool=self._build_connection_pool(),
+            resilience=self._build_resilience_policy(),
+            admission=self._build_admission_controller()
+        )
 
-            await self._check_or_create_collection()
+    def _build_resilience_policy(self) -> ResiliencePolicy:
+        """Build the vault retry and circuit breaking policy from the application settings."""
+        settings = Settings()
+
+        return ResiliencePolicy(
+            max_attempts=settings.IMMUDB_VAULT_RETRY_ATTEMPTS,
+            base_delay=settings.IMMUDB_VAULT_RETRY_BASE_DELAY,
+            max_delay=settings.IMMUDB_VAULT_RETRY_MAX_DELAY,
+            failure_threshold=settings.IMMUDB_VAULT_BREAKER_THRESHOLD,
+            reset_timeout=settings.IMMUDB_VAULT_BREAKER_RESET_TIMEOUT
+        )
+
+    def _build_latency_model(self) -> LatencyModel:
+        """Build the simulated latency of the sandbox vault from the application settings."""
+        settings = Settings()
+        return LatencyModel(
+            mean=settings.IMMUDB_SANDBOX_LATENCY,
+            distribution=settings.IMMUDB_SANDBOX_LATENCY_DISTRIBUTION,
+            jitter=settings.IMMUDB_SANDBOX_LATENCY_JITTER,
+            seed=settings.IMMUDB_SANDBOX_SEED
+        )
+
+    def _build_fault_injector(self) -> FaultInjector:
+        """Build the injected failures of the sandbox vault from the application settings."""
+        settings = Settings()
+        return FaultInjector(
+            error_rate=settings.IMMUDB_SANDBOX_ERROR_RATE,
+            error_status=settings.IMMUDB_SANDBOX_ERROR_STATUS,
+            timeout_rate=settings.IMMUDB_SANDBOX_TIMEOUT_RATE,
+            seed=settings.IMMUDB_SANDBOX_SEED
+        )
+
+    def _build_admission_controller(self) -> AdmissionController:
+        """Build the vault outbound admission controller from the application settings."""
+        settings = Settings()
+
+        return AdmissionController(
+            max_concurrency=settings.IMMUDB_VAULT_MAX_CONCURRENCY,
+            operation_limits=settings.IMMUDB_VAULT_OPERATION_CONCURRENCY,
+            rate=settings.IMMUDB_VAULT_RATE_LIMIT,
+            burst=settings.IMMUDB_VAULT_RATE_BURST,
+            queue_timeout=settings.IMMUDB_VAULT_QUEUE_TIMEOUT
+        )
+
+    def _build_connection_pool(self) -> ConnectionPool:
+        """Build the vault connection pool from the application settings."""
+        settings = Settings()
+        write_timeout = settings.IMMUDB_VAULT_WRITE_TIMEOUT
+
+        return ConnectionPool(
+            max_connections=settings.IMMUDB_VAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.IMMUDB_VAULT_MAX_KEEPALIVE,
+            keepalive_expiry=settings.IMMUDB_VAULT_KEEPALIVE_EXPIRY,
+            http2=settings.IMMUDB_VAULT_HTTP2,
+            connect_timeout=settings.IMMUDB_VAULT_CONNECT_TIMEOUT,
+            timeout=settings.IMMUDB_VAULT_READ_TIMEOUT,
+            operation_timeouts={
+                "setData": write_timeout,
+                "setDataBulk": write_timeout,
+                "createCollection": write_timeout,
+                "deleteCollection": write_timeout,
+                "createIndex": write_timeout
+            }
+        )
 
     # ================================
     #  INIT VAULT SECTION
@@ -61,16 +263,26 @@ class ImmuDBAdapter():
         Check if the collection exists in the ledger and has the correct schema. 
         If not, attempt to create it.
 
+        When the schema was verified recently (see SchemaFingerprintCache) the vault
+        round trip is skipped and the verification runs again in the background.
+
         Raises:
             ConnectionError: If the collection cannot be accessed, the schema is incorrect, 
             or the collection cannot be created due to issues such as missing fields or schema mismatches.
         """
+        if self.schema_cache is not None and self.schema_cache.is_verified(
+                self.base_url, self.ledger, self.collection_name, account_schema):
+            self._schema_task = asyncio.get_running_loop().create_task(self._reverify_collection_schema())
+            return
+
         try:
             await self._check_collection_schema()
+            self._store_schema_fingerprint()
 
         except httpx.HTTPStatusError as http_err:
             if http_err.response.status_code == 404:
                 await self._create_collection()
+                self._store_schema_fingerprint()
             else:
                 raise ConnectionError(
                     f"Collection {self.collection_name} is not available in the vault."
@@ -81,17 +293,59 @@ class ImmuDBAdapter():
 
 
     async def _check_collection_schema(self):
-        """Checks if the collection exists and its schema is valid."""
+        """
+        Checks if the collection exists and its schema is valid.
+
+        Missing secondary indexes do not invalidate the schema: they are added
+        to the collection when IMMUDB_SCHEMA_MIGRATE is set, and only reported
+        otherwise. Missing unique indexes are schema errors.
+        """
         response = await self.client.getCollectionDetails(self.collection_name)
         
-        missing_fields, type_mismatches, account_number_unique = self._verify_fields(response, account_schema)
+        missing_fields, type_mismatches, missing = self._verify_fields(response, account_schema)
 
         if missing_fields:
             raise ConnectionError(f"Collection schema error: missing fields: {missing_fields}")
         if type_mismatches:
             raise ConnectionError(f"Collection schema error: type mismatches: {type_mismatches}")
-        if not account_number_unique:
-            raise ConnectionError("Collection schema error: the field account_number is not unique.")
+        for index in missing:
+            if index.get("isUnique"):
+                raise ConnectionError(f"Collection schema error: the field {', '.join(index['fields'])} is not unique.")
+
+        if missing:
+            if not Settings().IMMUDB_SCHEMA_MIGRATE:
+                logger.warning("Collection %s is missing the indexes %s",
+                               self.collection_name, [index["fields"] for index in missing])
+            elif await create_indexes(self.client, self.collection_name, missing):
+                response = await self.client.getCollectionDetails(self.collection_name)
+
+        return response
+
+    def _store_schema_fingerprint(self):
+        """Record a successful schema verification on disk, when enabled."""
+        if self.schema_cache is not None:
+            self.schema_cache.store(self.base_url, self.ledger, self.collection_name, account_schema)
+
+    async def _reverify_collection_schema(self):
+        """
+        Verify the collection schema in the background after a warm start.
+
+        On a mismatch the adapter is flagged as not ready and the fingerprint is
+        discarded, so the next start verifies the schema again before serving.
+        """
+        try:
+            await self._check_collection_schema()
+            self._store_schema_fingerprint()
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            self.ready = False
+            self.readiness_error = f"Collection schema verification failed: {str(e)}"
+            if self.schema_cache is not None:
+                self.schema_cache.discard(self.base_url, self.ledger, self.collection_name)
+            logger.error(self.readiness_error)
 
 
     async def _create_collection(self):
@@ -123,7 +377,7 @@ class ImmuDBAdapter():
             tuple: A tuple containing three elements:
                 - missing_fields (list): A list of fields missing from the collection schema.
                 - type_mismatches (list): A list of fields where the types in the schema do not match the model.
-                - account_number_unique (bool): Whether the account_number field is marked as unique in the schema.
+                - missing_indexes (list): The indexes of the model, unique or secondary, missing from the schema.
         """
         
         model_fields = model['fields']
@@ -144,16 +398,81 @@ class ImmuDBAdapter():
             else:
                 missing_fields.append(field_name)
         
-        # Check if account_number is unique
-        account_number_unique = any(
-            idx['fields'] == ['account_number'] and idx['isUnique'] for idx in json_data['indexes']
-        )
+        # Check if collection contain all indexes (account_number must be unique)
+        missing = missing_indexes(json_data, model)
+
+        return missing_fields, type_mismatches, missing
 
-        return missing_fields, type_mismatches, account_number_unique
+    async def migrate_schema(self, dry_run: bool = False) -> ImmuDBAdapterResponse:
+        """
+        Add the indexes of the account schema missing from the collection.
+
+        Can run on an adapter that is not connected, e.g. from the migration
+        command line (`python -m app.adapters.schema_migration`).
+
+        Args:
+            dry_run (bool, optional): Only list the missing indexes. Defaults to False.
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing the indexes created
+            (or missing, for a dry run) or an error message in case of failure.
+        """
+        try:
+            if self.client is None:
+                self.client = self._build_client()
+                await self.client.open()
+
+            details = await self.client.getCollectionDetails(self.collection_name)
+            missing = missing_indexes(details, account_schema)
+            if dry_run:
+                return ImmuDBAdapterResponse(data=missing)
+
+            created = await create_indexes(self.client, self.collection_name, missing)
+            if created and self.schema_cache is not None:
+                self.schema_cache.discard(self.base_url, self.ledger, self.collection_name)
+            return ImmuDBAdapterResponse(data=created)
+
+        except httpx.HTTPStatusError as http_err:
+            status_code = http_err.response.status_code
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=vault_error_message(status_code),
+                code=status_code
+            )
+
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
+        except httpx.RequestError:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error="Vault is unreachable.",
+                code=500
+            )
 
     # ================================
     #  API call section
     # ================================
+    async def _fetch_account_count(self) -> int:
+        """
+        Fetch the account count from the vault.
+
+        Raises:
+            ValueError: If the vault response does not contain a count.
+        """
+        count_data = await self.single_flight.do(
+            ("count", self.collection_name),
+            lambda: self.client.countCollection(self.collection_name)
+        )
+
+        if 'count' not in count_data:
+            raise ValueError("The response obtained from the vault is invalid.")
+        return count_data['count']
+
     async def count_accounts(self) -> ImmuDBAdapterResponse:
         """
         Count the number of accounts in the collection.
@@ -163,16 +482,19 @@ class ImmuDBAdapter():
             or an error message in case of failure.
         """
         try:
-            count_data = await self.client.countCollection(self.collection_name)
-            
-            if 'count' in count_data:
-                return ImmuDBAdapterResponse(data=count_data['count'])
+            if self.account_counter is not None:
+                count = await self.account_counter.get()
             else:
-                return ImmuDBAdapterResponse(
-                    status=False,
-                    error="Error: The response obtained from the vault is invalid.",
-                    code=500
-                )
+                count = await self._fetch_account_count()
+
+            return ImmuDBAdapterResponse(data=count)
+
+        except ValueError:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error="Error: The response obtained from the vault is invalid.",
+                code=500
+            )
         
         except httpx.HTTPStatusError as http_err:
             status_code = http_err.response.status_code
@@ -196,6 +518,13 @@ class ImmuDBAdapter():
                 code=status_code
             )
         
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
         except httpx.RequestError:
             return ImmuDBAdapterResponse(
                 status=False,
@@ -209,33 +538,66 @@ class ImmuDBAdapter():
                 code=500
             )
 
-    async def get_accounts(self, page: int, count: int) -> ImmuDBAdapterResponse:
+    async def _read_page(self, key, loader):
+        """
+        Serve a page through the page cache, when enabled. Concurrent misses for
+        the same key share a single vault request, unless an account was written
+        since that request started: the key includes the write generation, so a
+        read issued after a write never receives pre-write data.
+        """
+        shared_loader = lambda: self.single_flight.do(("page", self.write_generation) + key, loader)
+
+        if self.page_cache is None:
+            return await shared_loader()
+        return await self.page_cache.get_or_load(key, shared_loader)
+
+    async def _load_accounts(self, page: int, count: int, query: Optional[Dict[str, Any]] = None) -> List[Account]:
+        """Fetch a page of the accounts matching a query from the vault."""
+        accounts_data = await self.client.getData(self.collection_name, page, count, query=query)
+        with span("accounts.validate"):
+            return accounts_from_revisions(accounts_data.get("revisions", []))
+
+    def _on_accounts_written(self, written: int = 1, account_numbers: Iterable[int] = ()):
+        """
+        Update the cached reads after a successful write.
+
+        Args:
+            written (int, optional): Number of accounts written. Defaults to 1.
+            account_numbers (Iterable[int], optional): The numbers of the accounts
+                written, dropped from the account cache. Defaults to none.
+        """
+        self.write_generation += 1
+        if self.page_cache is not None:
+            self.page_cache.invalidate()
+        if self.account_cache is not None:
+            self.account_cache.invalidate_keys(account_numbers)
+        if self.account_counter is not None:
+            self.account_counter.increment(written)
+
+    async def get_accounts(self, page: int, count: int, filters: Optional[AccountFilter] = None,
+                           sort: Optional[AccountSort] = None) -> ImmuDBAdapterResponse:
         """
         Retrieve a paginated list of accounts from the collection.
 
+        The filters and the sort order are translated into a vault search query,
+        so only the matching accounts are transferred, already in order.
+
         Args:
             page (int): The page number to retrieve.
             count (int): The number of accounts to retrieve per page.
+            filters (Optional[AccountFilter], optional): Only return the matching accounts.
+                Defaults to None (every account).
+            sort (Optional[AccountSort], optional): The order of the accounts across
+                pages. Defaults to None (the vault order).
 
         Returns:
             ImmuDBAdapterResponse: A response object containing the list of accounts
             or an error message in case of failure.
         """
         try:
-            accounts_data = await self.client.getData(self.collection_name, page, count)
-            
-            accounts = []
-            for revision in accounts_data.get("revisions", []):
-                document = revision.get("document", {})
-                account = Account(
-                    account_number=document.get("account_number"),
-                    account_name=document.get("account_name"),
-                    iban=document.get("iban"),
-                    address=document.get("address"),
-                    amount=document.get("amount"),
-                    type=document.get("type")
-                )
-                accounts.append(account)
+            query = build_account_query(filters, sort)
+            accounts = await self._read_page((self.collection_name, page, count, query_cache_key(query)),
+                                             lambda: self._load_accounts(page, count, query))
 
             return ImmuDBAdapterResponse(data=accounts)
         
@@ -259,6 +621,96 @@ class ImmuDBAdapter():
                 code=status_code
             )
         
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
+        except httpx.RequestError:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error="Vault is unreachable.",
+                code=500
+            )
+        except Exception as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=f"Unexpected error with the vault: {str(e)}",
+                code=500
+            )
+
+    async def get_accounts_page(self, cursor: str, count: int, filters: Optional[AccountFilter] = None,
+                                sort: Optional[AccountSort] = None) -> ImmuDBAdapterResponse:
+        """
+        Retrieve a page of accounts using cursor-based pagination.
+
+        The vault search is kept open and its `searchId` is carried in the cursor,
+        so every following page continues the same search instead of re-running
+        it with a growing offset. If the vault has already expired the search,
+        it is restarted at the same position.
+
+        Args:
+            cursor (str): The cursor returned with the previous page, or an empty
+                string to start from the first page.
+            count (int): The number of accounts per page, used for the first page only.
+            filters (Optional[AccountFilter], optional): Only return the matching accounts.
+                The same filters must be passed with every cursor of the listing.
+                Defaults to None (every account).
+            sort (Optional[AccountSort], optional): The order of the accounts, passed
+                with every cursor like the filters. Defaults to None (the vault order).
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing an AccountPage
+            or an error message in case of failure.
+        """
+        search_id, page = None, 1
+        if cursor:
+            try:
+                search_id, page, count = decode_cursor(cursor)
+            except ValueError as e:
+                return ImmuDBAdapterResponse(status=False, error=str(e), code=400)
+
+        try:
+            query = build_account_query(filters, sort)
+            try:
+                accounts_data = await self.client.getData(
+                    self.collection_name, page, count, search_id=search_id, keep_open=True, query=query
+                )
+            except httpx.HTTPStatusError as http_err:
+                if search_id and http_err.response.status_code in (404, 410):
+                    accounts_data = await self.client.getData(
+                        self.collection_name, page, count, keep_open=True, query=query
+                    )
+                else:
+                    raise
+
+            revisions = accounts_data.get("revisions", [])
+            next_cursor = None
+            if len(revisions) >= count:
+                next_cursor = encode_cursor(accounts_data.get("searchId") or search_id, page + 1, count)
+
+            with span("accounts.validate"):
+                accounts = accounts_from_revisions(revisions)
+
+            return ImmuDBAdapterResponse(data=AccountPage(accounts=accounts, next_cursor=next_cursor))
+
+        except httpx.HTTPStatusError as http_err:
+            status_code = http_err.response.status_code
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=vault_error_message(status_code),
+                code=status_code
+            )
+
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
         except httpx.RequestError:
             return ImmuDBAdapterResponse(
                 status=False,
@@ -272,6 +724,245 @@ class ImmuDBAdapter():
                 code=500
             )
 
+    async def _load_account(self, account_number: int) -> Optional[Account]:
+        """Fetch one account from the vault with an exact-match search, None if it does not exist."""
+        accounts_data = await self.client.getData(self.collection_name, 1, 1, query=build_lookup_query([account_number]))
+        with span("accounts.validate"):
+            accounts = accounts_from_revisions(accounts_data.get("revisions", []))
+        return accounts[0] if accounts else None
+
+    async def get_account(self, account_number: int) -> ImmuDBAdapterResponse:
+        """
+        Retrieve one account by its account number.
+
+        The account is searched with an exact match on the unique `account_number`
+        index. Results, including accounts not found, are kept in the account
+        cache until they expire or the account is written; concurrent lookups of
+        the same account share a single vault request, unless an account was
+        written since that request started.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing the account, or an
+            error message (404 if the account does not exist).
+        """
+        loader = lambda: self.single_flight.do(("account", self.write_generation, account_number),
+                                               lambda: self._load_account(account_number))
+
+        try:
+            if self.account_cache is None:
+                account = await loader()
+            else:
+                account = await self.account_cache.get_or_load(account_number, loader)
+
+            if account is None:
+                return ImmuDBAdapterResponse(status=False, error="Account not found.", code=404)
+            return ImmuDBAdapterResponse(data=account)
+
+        except httpx.HTTPStatusError as http_err:
+            status_code = http_err.response.status_code
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=vault_error_message(status_code),
+                code=status_code
+            )
+
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
+        except httpx.RequestError:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error="Vault is unreachable.",
+                code=500
+            )
+        except Exception as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=f"Unexpected error with the vault: {str(e)}",
+                code=500
+            )
+
+    async def _load_accounts_by_number(self, account_numbers: List[int]) -> Dict[int, Optional[Account]]:
+        """
+        Fetch accounts by number with chunked OR'ed exact-match searches, run concurrently.
+
+        Returns:
+            Dict[int, Optional[Account]]: Every requested number, mapped to None when it does not exist.
+        """
+        settings = Settings()
+        chunk_size = max(1, settings.IMMUDB_LOOKUP_CHUNK_SIZE)
+        semaphore = asyncio.Semaphore(max(1, settings.IMMUDB_LOOKUP_CONCURRENCY))
+
+        async def load_chunk(chunk: List[int]) -> List[Account]:
+            async with semaphore:
+                accounts_data = await self.client.getData(
+                    self.collection_name, 1, len(chunk), query=build_lookup_query(chunk)
+                )
+            with span("accounts.validate"):
+                return accounts_from_revisions(accounts_data.get("revisions", []))
+
+        chunks = [account_numbers[i:i + chunk_size] for i in range(0, len(account_numbers), chunk_size)]
+        found: Dict[int, Optional[Account]] = dict.fromkeys(account_numbers)
+        for accounts in await asyncio.gather(*(load_chunk(chunk) for chunk in chunks)):
+            for account in accounts:
+                found[account.account_number] = account
+        return found
+
+    async def get_accounts_by_number(self, account_numbers: List[int]) -> ImmuDBAdapterResponse:
+        """
+        Retrieve many accounts by their account numbers.
+
+        Accounts in the account cache are served from it. The others are fetched
+        with one search per chunk of IMMUDB_LOOKUP_CHUNK_SIZE numbers, matching
+        any of them, with up to IMMUDB_LOOKUP_CONCURRENCY searches in parallel,
+        and stored in the cache.
+
+        Args:
+            account_numbers (List[int]): The account numbers; duplicates are looked up once.
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing one AccountLookupResult
+            per requested number, in request order, or an error message in case of failure.
+        """
+        results: Dict[int, Optional[Account]] = {}
+        misses = []
+        for account_number in dict.fromkeys(account_numbers):
+            found, account = (False, None) if self.account_cache is None else self.account_cache.get(account_number)
+            if found:
+                results[account_number] = account
+            else:
+                misses.append(account_number)
+
+        try:
+            if misses:
+                version = self.account_cache.version if self.account_cache is not None else None
+                loaded = await self._load_accounts_by_number(misses)
+                results.update(loaded)
+
+                if self.account_cache is not None and self.account_cache.version == version:
+                    for account_number, account in loaded.items():
+                        self.account_cache.set(account_number, account)
+
+            return ImmuDBAdapterResponse(data=[
+                AccountLookupResult(
+                    account_number=account_number,
+                    found=results[account_number] is not None,
+                    account=results[account_number]
+                )
+                for account_number in account_numbers
+            ])
+
+        except httpx.HTTPStatusError as http_err:
+            status_code = http_err.response.status_code
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=vault_error_message(status_code),
+                code=status_code
+            )
+
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
+        except httpx.RequestError:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error="Vault is unreachable.",
+                code=500
+            )
+        except Exception as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=f"Unexpected error with the vault: {str(e)}",
+                code=500
+            )
+
+    async def export_accounts(self, export_format: ExportFormat) -> ImmuDBAdapterResponse:
+        """
+        Export every account of the collection as a stream of text chunks.
+
+        Documents come from the client `iterDocuments`, which fetches pages in
+        parallel. The first page is fetched before returning, so that vault errors
+        can still be reported with a proper status code; the remaining pages are
+        fetched while the stream is consumed, keeping memory constant.
+
+        Args:
+            export_format (ExportFormat): The export format.
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing an async iterator of
+            encoded chunks, or an error message in case of failure.
+        """
+        settings = Settings()
+        page_size = settings.IMMUDB_EXPORT_PAGE_SIZE
+        documents = self.client.iterDocuments(
+            self.collection_name,
+            page_size=page_size,
+            concurrency=settings.IMMUDB_EXPORT_CONCURRENCY
+        )
+
+        try:
+            first_documents = [await documents.__anext__()]
+
+        except StopAsyncIteration:
+            first_documents = []
+
+        except httpx.HTTPStatusError as http_err:
+            status_code = http_err.response.status_code
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=vault_error_message(status_code),
+                code=status_code
+            )
+
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
+        except httpx.RequestError:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error="Vault is unreachable.",
+                code=500
+            )
+        except Exception as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=f"Unexpected error with the vault: {str(e)}",
+                code=500
+            )
+
+        async def stream():
+            try:
+                header = export_header(export_format)
+                if header:
+                    yield header
+                buffered = first_documents
+                async for document in documents:
+                    buffered.append(document)
+                    if len(buffered) >= page_size:
+                        yield encode_documents(buffered, export_format)
+                        buffered = []
+                if buffered:
+                    yield encode_documents(buffered, export_format)
+            finally:
+                await documents.aclose()
+
+        return ImmuDBAdapterResponse(data=stream())
+
     async def set_accounts(self, account: Account) -> ImmuDBAdapterResponse:
         """
         Set a new account in the collection.
@@ -284,8 +975,20 @@ class ImmuDBAdapter():
             or an error message in case of failure.
         """
         try:
-            result = await self.client.setData(self.collection_name, account.dict())
+            if self.write_batcher is not None:
+                result = await self.write_batcher.submit(account.dict())
+                if 'code' in result:
+                    code = result['code']
+                    return ImmuDBAdapterResponse(
+                        status=False,
+                        error=vault_error_message(code),
+                        code=code if code is not None else 500
+                    )
+            else:
+                result = await self.client.setData(self.collection_name, account.dict())
+
             if 'transactionId' in result:
+                self._on_accounts_written(account_numbers=[account.account_number])
                 return ImmuDBAdapterResponse(data=result['transactionId'])
             else:
                 return ImmuDBAdapterResponse(
@@ -318,6 +1021,13 @@ class ImmuDBAdapter():
                 code=status_code
             )
         
+        except VaultUnavailableError as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=str(e),
+                code=503
+            )
+
         except httpx.RequestError:
             return ImmuDBAdapterResponse(
                 status=False,
@@ -330,4 +1040,175 @@ class ImmuDBAdapter():
                 status=False,
                 error=f"Unexpected error with the vault: {str(e)}",
                 code=500
-            )
\ No newline at end of file
+            )
+
+    async def _flush_account_batch(self, documents: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Insert a batch of queued account documents in one bulk vault call.
+
+        The vault rejects a bulk insert as a whole, so when a batch is rejected
+        because of one of its documents (e.g. a duplicated account number) the
+        documents are retried one by one, giving every caller its own outcome.
+
+        Args:
+            documents (List[Dict]): The queued account documents.
+
+        Returns:
+            List[Dict[str, Any]]: One result per document, as returned by setDataBulk.
+        """
+        settings = Settings()
+        results = await self.client.setDataBulk(
+            self.collection_name,
+            documents,
+            chunk_size=settings.IMMUDB_WRITE_BATCH_MAX_SIZE,
+            max_chunk_bytes=settings.IMMUDB_VAULT_BULK_CHUNK_BYTES,
+            concurrency=settings.IMMUDB_VAULT_BULK_CONCURRENCY
+        )
+
+        return await self._isolate_rejected_documents(documents, results)
+
+    async def _isolate_rejected_documents(self, documents: List[Dict], results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Retry one by one the documents of bulk chunks rejected by the vault.
+
+        A chunk is rejected as a whole (400, 409 or 413) when any of its documents
+        is invalid, and its error is reported for every document of the chunk.
+        Retrying them alone gives the valid documents their own transaction and
+        every invalid one its own error. At most IMMUDB_VAULT_BULK_CONCURRENCY
+        retries are in flight at the same time, like the chunks of the bulk insert.
+
+        Args:
+            documents (List[Dict]): The documents sent with setDataBulk.
+            results (List[Dict[str, Any]]): The setDataBulk results, one per document.
+
+        Returns:
+            List[Dict[str, Any]]: The results, with the rejected documents replaced
+            by the outcome of their single insert.
+        """
+        if len(documents) > 1:
+            rejected = [i for i, result in enumerate(results) if result.get('code') in (400, 409, 413)]
+            semaphore = asyncio.Semaphore(max(1, Settings().IMMUDB_VAULT_BULK_CONCURRENCY))
+
+            async def retry(document: Dict) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._set_single_document(document)
+
+            isolated = await asyncio.gather(*(retry(documents[i]) for i in rejected))
+            for i, result in zip(rejected, isolated):
+                results[i] = result
+
+        return results
+
+    async def _set_single_document(self, document: Dict) -> Dict[str, Any]:
+        """Insert one document, returning a setDataBulk-like result instead of raising."""
+        try:
+            return await self.client.setData(self.collection_name, document)
+        except httpx.HTTPStatusError as http_err:
+            return {"error": str(http_err), "code": http_err.response.status_code}
+        except VaultUnavailableError as e:
+            return {"error": str(e), "code": 503}
+        except httpx.RequestError as req_err:
+            return {"error": str(req_err), "code": None}
+
+    async def set_accounts_bulk(self, accounts: List[Account]) -> ImmuDBAdapterResponse:
+        """
+        Set many new accounts in the collection using chunked, concurrent vault calls.
+
+        The vault inserts each chunk atomically; the accounts of a rejected chunk
+        are retried one by one, so every account gets its own outcome.
+
+        Args:
+            accounts (List[Account]): The accounts to be set.
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing one AccountBatchResult
+            per account, in input order, or an error message in case of failure.
+        """
+        settings = Settings()
+
+        try:
+            documents = [account.dict() for account in accounts]
+            results = await self.client.setDataBulk(
+                self.collection_name,
+                documents,
+                chunk_size=settings.IMMUDB_VAULT_BULK_CHUNK_SIZE,
+                max_chunk_bytes=settings.IMMUDB_VAULT_BULK_CHUNK_BYTES,
+                concurrency=settings.IMMUDB_VAULT_BULK_CONCURRENCY
+            )
+            results = await self._isolate_rejected_documents(documents, results)
+
+        except Exception as e:
+            return ImmuDBAdapterResponse(
+                status=False,
+                error=f"Unexpected error with the vault: {str(e)}",
+                code=500
+            )
+
+        batch_results = []
+        for index, (account, result) in enumerate(zip(accounts, results)):
+            if 'transactionId' in result:
+                batch_results.append(AccountBatchResult(
+                    index=index,
+                    account_number=account.account_number,
+                    transaction_id=result['transactionId'],
+                    document_id=result.get('documentId')
+                ))
+            else:
+                code = result.get('code')
+                batch_results.append(AccountBatchResult(
+                    index=index,
+                    account_number=account.account_number,
+                    error=vault_error_message(code),
+                    code=code if code is not None else 500
+                ))
+
+        written = [item.account_number for item in batch_results if item.transaction_id]
+        if written:
+            self._on_accounts_written(len(written), written)
+
+        return ImmuDBAdapterResponse(data=batch_results)
+
+    # ================================
+    #  Monitoring section
+    # ================================
+    def get_vault_stats(self) -> ImmuDBAdapterResponse:
+        """
+        Collect runtime statistics of the vault client and the adapter caches.
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing the statistics.
+        """
+        stats = {"client": self.client.getStats() if self.client is not None else {}}
+
+        if self.page_cache is not None:
+            stats["page_cache"] = self.page_cache.stats()
+        if self.account_cache is not None:
+            stats["account_cache"] = self.account_cache.stats()
+        if self.account_counter is not None:
+            stats["account_count"] = {"value": self.account_counter.value, "age": self.account_counter.age}
+        stats["single_flight"] = {
+            "executions": self.single_flight.executions,
+            "shared": self.single_flight.shared
+        }
+
+        return ImmuDBAdapterResponse(data=stats)
+
+    def get_readiness(self) -> ImmuDBAdapterResponse:
+        """
+        Report whether the vault and the collection have been verified.
+
+        Returns:
+            ImmuDBAdapterResponse: A response object containing the readiness details,
+            with a 503 code when the adapter is not ready.
+        """
+        readiness = {
+            "ready": self.ready,
+            "sandbox": self.sandbox,
+            "ledger": self.ledger,
+            "collection": self.collection_name,
+            "error": self.readiness_error
+        }
+
+        if self.ready:
+            return ImmuDBAdapterResponse(data=readiness)
+        return ImmuDBAdapterResponse(status=False, error=self.readiness_error or "Not ready.", code=503, data=readiness)
@@ -1,18 +1,30 @@
 # app/utils/immudb_singleton.py
 
+import asyncio
 from fastapi import HTTPException
 from app.adapters.immudb_adapter import ImmuDBAdapter
 
 class ImmuDBAdapterSingleton:
     """
     Singleton class to ensure a single instance of ImmuDBAdapter is used.
+
+    Creation is serialized by an asyncio lock, so concurrent callers never
+    build (and connect) more than one adapter.
     """
     _instance = None
+    _lock = None
+    last_error = None
 
     @classmethod
     async def get_instance(cls, sandbox, ledger, collection, base_url, api_key):
-        if cls._instance is None:
-            try:
+        if cls._instance is not None:
+            return cls._instance
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if cls._instance is None:
                 immudbAdapter = ImmuDBAdapter(
                     sandbox=sandbox,
                     ledger=ledger,
@@ -20,8 +32,29 @@ class ImmuDBAdapterSingleton:
                     base_url=base_url,
                     api_key=api_key
                 )
-                await immudbAdapter.connect()
+                try:
+                    await immudbAdapter.connect()
+                except Exception as e:
+                    await immudbAdapter.close()
+                    cls.last_error = str(e)
+                    raise HTTPException(status_code=500, detail=str(e))
                 cls._instance = immudbAdapter
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e))
+                cls.last_error = None
+        return cls._instance
+
+    @classmethod
+    def peek_instance(cls):
+        """
+        Return the adapter instance if it was already created, without creating it.
+        """
         return cls._instance
+
+    @classmethod
+    async def close_instance(cls):
+        """
+        Close the adapter instance, if any, releasing its vault connections.
+        """
+        if cls._instance is not None:
+            await cls._instance.close()
+            cls._instance = None
+        cls._lock = None
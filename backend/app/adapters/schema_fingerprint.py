@@ -0,0 +1,124 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+def fingerprint(data: Any) -> str:
+    """
+    Hash JSON-serializable data independently of key order.
+
+    Args:
+        data (Any): The data to hash.
+
+    Returns:
+        str: The hex SHA-256 digest.
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+class SchemaFingerprintCache:
+    """
+    Local-disk record of the collection schemas already verified against the vault.
+
+    Each entry is keyed by vault URL, ledger and collection and stores the
+    fingerprint of the expected schema and the time of the verification. An
+    entry is valid while the expected schema is unchanged and the verification
+    is younger than `ttl` seconds, so warm restarts can skip the schema round
+    trip. Changes made to the collection outside the application are only
+    detected by the next verification.
+
+    Attributes:
+        path (str): The JSON file holding the entries.
+        ttl (float): Seconds a verification stays valid.
+    """
+
+    def __init__(self, path: str, ttl: float = 3600.0):
+        """
+        Initializes the cache.
+
+        Args:
+            path (str): The JSON file holding the entries.
+            ttl (float, optional): Seconds a verification stays valid. Defaults to 3600.0.
+        """
+        self.path = path
+        self.ttl = ttl
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as file:
+                entries = json.load(file)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, Any]):
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".schema-", suffix=".json")
+            with os.fdopen(fd, "w") as file:
+                json.dump(entries, file)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Unable to persist the schema fingerprint to %s: %s", self.path, e)
+
+    @staticmethod
+    def _key(vault: str, ledger: str, collection: str) -> str:
+        return f"{vault.rstrip('/')}/ledger/{ledger}/collection/{collection}"
+
+    def is_verified(self, vault: str, ledger: str, collection: str, schema: Any) -> bool:
+        """
+        Whether the schema of a collection was verified recently.
+
+        Args:
+            vault (str): The base URL of the vault.
+            ledger (str): The ledger name.
+            collection (str): The collection name.
+            schema (Any): The expected collection schema.
+
+        Returns:
+            bool: True if a valid verification exists for this exact schema.
+        """
+        entry = self._load().get(self._key(vault, ledger, collection))
+        if not isinstance(entry, dict):
+            return False
+
+        return (
+            entry.get("schema") == fingerprint(schema)
+            and time.time() - entry.get("verified_at", 0) < self.ttl
+        )
+
+    def store(self, vault: str, ledger: str, collection: str, schema: Any):
+        """
+        Record a successful verification.
+
+        Args:
+            vault (str): The base URL of the vault.
+            ledger (str): The ledger name.
+            collection (str): The collection name.
+            schema (Any): The expected collection schema.
+        """
+        entries = self._load()
+        entries[self._key(vault, ledger, collection)] = {
+            "schema": fingerprint(schema),
+            "verified_at": time.time()
+        }
+        self._save(entries)
+
+    def discard(self, vault: str, ledger: str, collection: str):
+        """
+        Forget the verification of a collection.
+
+        Args:
+            vault (str): The base URL of the vault.
+            ledger (str): The ledger name.
+            collection (str): The collection name.
+        """
+        entries = self._load()
+        if entries.pop(self._key(vault, ledger, collection), None) is not None:
+            self._save(entries)
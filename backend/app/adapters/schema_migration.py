@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import logging
+from typing import Any, Dict, List
+import httpx
+
+logger = logging.getLogger(__name__)
+
+def missing_indexes(details: Dict[str, Any], schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    List the indexes declared by a schema that a collection does not have.
+
+    An index is present when the collection has an index on the same fields,
+    in the same order, with the same uniqueness.
+
+    Args:
+        details (Dict[str, Any]): The collection details returned by the vault.
+        schema (Dict[str, Any]): The expected schema (`fields` and `indexes`).
+
+    Returns:
+        List[Dict[str, Any]]: The missing indexes, in schema order.
+    """
+    existing = {
+        (tuple(index.get("fields", [])), bool(index.get("isUnique")))
+        for index in details.get("indexes", [])
+    }
+    return [
+        index for index in schema.get("indexes", [])
+        if (tuple(index["fields"]), bool(index.get("isUnique"))) not in existing
+    ]
+
+async def create_indexes(client, collection_name: str, indexes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Add indexes to an existing collection, one vault call per index.
+
+    An index reported as already existing (409) is skipped, so concurrent
+    migrations of several application instances do not fail each other.
+
+    Args:
+        client: The vault client.
+        collection_name (str): The name of the collection.
+        indexes (List[Dict[str, Any]]): The indexes to add (`fields` and `isUnique`).
+
+    Returns:
+        List[Dict[str, Any]]: The indexes created by this call.
+
+    Raises:
+        httpx.HTTPStatusError: If the vault rejects an index for another reason.
+    """
+    created = []
+    for index in indexes:
+        try:
+            await client.createIndex(collection_name, index["fields"], bool(index.get("isUnique")))
+        except httpx.HTTPStatusError as http_err:
+            if http_err.response.status_code != 409:
+                raise
+            continue
+        logger.info("Created index on %s of collection %s", index["fields"], collection_name)
+        created.append(index)
+    return created
+
+async def run(dry_run: bool) -> int:
+    # Imported here: the adapter itself imports this module
+    from app.adapters.immudb_adapter import ImmuDBAdapter
+    from app.settings import Settings
+
+    settings = Settings()
+    adapter = ImmuDBAdapter(
+        sandbox=settings.IMMUDB_VAULT_SANDBOX,
+        ledger=settings.IMMUDB_VAULT_LEDGER_NAME,
+        collection=settings.IMMUDB_VAULT_COLLECTION_NAME,
+        base_url=settings.IMMUDB_VAULT_BASEURL,
+        api_key=settings.IMMUDB_VAULT_API_KEY
+    )
+    try:
+        result = await adapter.migrate_schema(dry_run=dry_run)
+    finally:
+        await adapter.close()
+
+    if not result.status:
+        print(f"Migration failed: {result.error}")
+        return 1
+
+    action = "Missing" if dry_run else "Created"
+    for index in result.data:
+        print(f"{action} index on {index['fields']}{' (unique)' if index.get('isUnique') else ''}")
+    if not result.data:
+        print(f"Collection {settings.IMMUDB_VAULT_COLLECTION_NAME} is up to date.")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Add the missing indexes of account_schema to the vault collection.")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the missing indexes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(asyncio.run(run(args.dry_run)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into a single in-flight execution.
+
+    While a call for a key is running, any other call for the same key waits
+    for it and receives the same result or exception instead of starting a
+    new one. Once the call completes, the next call for the key starts fresh.
+
+    Attributes:
+        executions (int): Number of calls actually executed.
+        shared (int): Number of calls served by an execution already in flight.
+    """
+
+    def __init__(self):
+        """Initializes an empty single-flight group."""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.executions = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fn` for a key, or join the execution already in flight for it.
+
+        Cancelling one waiter does not cancel the shared execution.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable): Coroutine function performing the call.
+
+        Returns:
+            Any: The result of the shared execution.
+        """
+        call = self._calls.get(key)
+
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            self.executions += 1
+            call.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, call: asyncio.Future):
+        """Remove a completed call, retrieving its exception so it is never reported as unhandled."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            call.exception()
@@ -0,0 +1,42 @@
+import json
+import unittest
+from pydantic import ValidationError
+from app.adapters.account_codec import accounts_from_revisions, dump_accounts
+from app.schemas.account import Account
+from app.schemas.operation_type import OperationType
+
+def make_revision(account_number, **overrides):
+    document = {
+        "_id": "66fae08a0000000000000001",
+        "_vault_md": {"creator": "a:test", "ts": 1727717514},
+        "account_number": account_number,
+        "account_name": "Test Account",
+        "iban": "IT60X0542811101000000123456",
+        "address": "Via Roma 1",
+        "amount": 100,
+        "type": "sending"
+    }
+    document.update(overrides)
+    return {"document": document, "revision": "", "transactionId": ""}
+
+class TestAccountCodec(unittest.TestCase):
+
+    def test_accounts_from_revisions(self):
+        accounts = accounts_from_revisions([make_revision(1), make_revision(2, type="receiving")])
+
+        self.assertEqual([account.account_number for account in accounts], [1, 2])
+        self.assertIsInstance(accounts[0], Account)
+        self.assertEqual(accounts[1].type, OperationType.RECEIVING)
+        self.assertEqual(accounts[0].amount, 100.0)
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValidationError):
+            accounts_from_revisions([make_revision(1, iban="not an iban")])
+
+    def test_dump_accounts(self):
+        accounts = accounts_from_revisions([make_revision(1)])
+
+        self.assertEqual(json.loads(dump_accounts(accounts)), [accounts[0].model_dump(mode="json")])
+
+if __name__ == '__main__':
+    unittest.main()
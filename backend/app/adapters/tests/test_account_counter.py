@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+from app.adapters.account_counter import AccountCounter
+
+class TestAccountCounter(unittest.IsolatedAsyncioTestCase):
+
+    async def test_seeds_once_then_counts_locally(self):
+        fetch = AsyncMock(return_value=10)
+        counter = AccountCounter(fetch, max_staleness=60)
+
+        self.assertEqual(await counter.get(), 10)
+        counter.increment(2)
+        self.assertEqual(await counter.get(), 12)
+        fetch.assert_awaited_once()
+
+    async def test_reconciles_when_stale(self):
+        fetch = AsyncMock(side_effect=[10, 20])
+        counter = AccountCounter(fetch, max_staleness=60)
+        await counter.get()
+
+        with patch("app.adapters.account_counter.time.monotonic", return_value=counter.reconciled_at + 61):
+            self.assertEqual(await counter.get(), 20)
+
+    async def test_concurrent_reconciliations_share_one_fetch(self):
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return 5
+
+        mock_fetch = AsyncMock(side_effect=fetch)
+        counter = AccountCounter(mock_fetch)
+
+        results = await asyncio.gather(*(counter.get() for _ in range(5)))
+
+        self.assertEqual(results, [5] * 5)
+        mock_fetch.assert_awaited_once()
+
+    async def test_writes_during_reconciliation_are_kept(self):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def fetch():
+            started.set()
+            await release.wait()
+            return 10
+
+        counter = AccountCounter(AsyncMock(side_effect=fetch))
+        task = asyncio.create_task(counter.reconcile())
+        await started.wait()
+
+        counter.increment(3)
+        release.set()
+        await task
+
+        self.assertEqual(counter.value, 13)
+        counter.increment()
+        self.assertEqual(await counter.get(), 14)
+
+    async def test_background_reconciliation(self):
+        fetch = AsyncMock(return_value=3)
+        counter = AccountCounter(fetch, max_staleness=0.01)
+
+        counter.start()
+        await asyncio.sleep(0.05)
+        await counter.close()
+
+        self.assertEqual(counter.value, 3)
+        self.assertGreaterEqual(fetch.await_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
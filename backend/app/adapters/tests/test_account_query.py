@@ -0,0 +1,52 @@
+import unittest
+from app.adapters.account_query import build_account_query, query_cache_key
+from app.immudb.query import matches
+from app.schemas.account_filter import AccountFilter
+from app.schemas.account_sort import AccountSort
+
+class TestAccountQuery(unittest.TestCase):
+
+    def test_no_filters(self):
+        self.assertIsNone(build_account_query(None))
+        self.assertIsNone(build_account_query(AccountFilter()))
+        self.assertIsNone(query_cache_key(None))
+
+    def test_filters_are_and_ed(self):
+        query = build_account_query(AccountFilter(type="sending", amount_min=10.5, amount_max=99.9,
+                                                  account_name="Mario R.", iban_country="IT"))
+
+        self.assertEqual(query, {"expressions": [{"fieldComparisons": [
+            {"field": "type", "operator": "EQ", "value": "sending"},
+            {"field": "amount", "operator": "GE", "value": 11},
+            {"field": "amount", "operator": "LE", "value": 99},
+            {"field": "account_name", "operator": "LIKE", "value": r"^Mario\ R\."},
+            {"field": "iban", "operator": "LIKE", "value": "^IT"}
+        ]}]})
+
+        document = {"type": "sending", "amount": 50, "account_name": "Mario R. Rossi", "iban": "IT60X0542811101000000123456"}
+        self.assertTrue(matches(document, query))
+        self.assertFalse(matches({**document, "account_name": "Mario Rossi"}, query))
+        self.assertFalse(matches({**document, "amount": 100}, query))
+        self.assertFalse(matches({**document, "iban": "DE89370400440532013000"}, query))
+
+    def test_sort_order(self):
+        self.assertEqual(build_account_query(None, AccountSort.AMOUNT_DESC),
+                         {"orderBy": [{"field": "amount", "desc": True}]})
+        self.assertEqual(build_account_query(AccountFilter(type="sending"), AccountSort.CREATED), {
+            "expressions": [{"fieldComparisons": [{"field": "type", "operator": "EQ", "value": "sending"}]}],
+            "orderBy": [{"field": "_vault_md.ts", "desc": False}]
+        })
+
+    def test_cache_key_depends_on_the_filters(self):
+        sending = build_account_query(AccountFilter(type="sending"))
+        receiving = build_account_query(AccountFilter(type="receiving"))
+
+        self.assertEqual(query_cache_key(sending), query_cache_key(build_account_query(AccountFilter(type="sending"))))
+        self.assertNotEqual(query_cache_key(sending), query_cache_key(receiving))
+        hash(query_cache_key(sending))
+
+        self.assertNotEqual(query_cache_key(build_account_query(None, AccountSort.AMOUNT)),
+                            query_cache_key(build_account_query(None, AccountSort.AMOUNT_DESC)))
+
+if __name__ == '__main__':
+    unittest.main()
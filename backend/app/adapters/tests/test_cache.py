@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+from app.adapters.cache import TTLCache
+
+class TestTTLCache(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get_or_load_counts_hits_and_misses(self):
+        cache = TTLCache(max_size=2, ttl=60)
+        loader = AsyncMock(return_value="value")
+
+        self.assertEqual(await cache.get_or_load("a", loader), "value")
+        self.assertEqual(await cache.get_or_load("a", loader), "value")
+
+        loader.assert_awaited_once()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    async def test_lru_eviction(self):
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), (True, 1))
+        self.assertEqual(cache.get("b"), (False, None))
+
+    async def test_ttl_expiry(self):
+        cache = TTLCache(ttl=5)
+        with patch("app.adapters.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.adapters.cache.time.monotonic", return_value=106.0):
+            self.assertEqual(cache.get("a"), (False, None))
+
+    async def test_invalidate_keys(self):
+        cache = TTLCache(max_size=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate_keys(["a"])
+
+        self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual(cache.get("b"), (True, 2))
+        self.assertEqual(cache.version, 1)
+
+    async def test_invalidate_discards_concurrent_load(self):
+        cache = TTLCache(ttl=60)
+
+        async def loader():
+            cache.invalidate()
+            return "stale"
+
+        self.assertEqual(await cache.get_or_load("a", loader), "stale")
+        self.assertEqual(len(cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+from app.adapters.cursor import decode_cursor, encode_cursor
+
+class TestCursor(unittest.TestCase):
+
+    def test_round_trip(self):
+        cursor = encode_cursor("search-1", 3, 12)
+        self.assertEqual(decode_cursor(cursor), ("search-1", 3, 12))
+
+    def test_round_trip_without_search_id(self):
+        self.assertEqual(decode_cursor(encode_cursor(None, 2, 10)), (None, 2, 10))
+
+    def test_invalid_cursor(self):
+        for cursor in ("not-a-cursor", encode_cursor("s", 0, 10), encode_cursor("s", 1, -1)):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,268 @@
+import asyncio
+import httpx
+import unittest
+from unittest.mock import patch, ANY, AsyncMock, MagicMock
+from app.adapters.immudb_adapter import ImmuDBAdapter
+from app.adapters.write_batcher import WriteBatcher
+from app.schemas.account import Account
+from app.schemas.account_filter import AccountFilter
+from app.schemas.account_sort import AccountSort
+from app.settings import Settings
+
+def make_account(account_number: int, **overrides) -> Account:
+    fields = dict(
+        account_number=account_number,
+        account_name="Test Name",
+        iban="IT123456978213456789",
+        address="Test Address",
+        amount=10,
+        type="sending"
+    )
+    fields.update(overrides)
+    return Account(**fields)
+
+class TestImmuDBAdapter(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.adapter = ImmuDBAdapter(
+            sandbox=True,
+            ledger="test_ledger",
+            collection="test",
+            base_url="http://example.com",
+            api_key="test_api_key"
+        )
+        await self.adapter.connect()
+
+    async def asyncTearDown(self):
+        await self.adapter.close()
+
+    async def test_set_accounts_bulk(self):
+        accounts = [make_account(i) for i in range(3)]
+
+        result = await self.adapter.set_accounts_bulk(accounts)
+
+        self.assertTrue(result.status)
+        self.assertEqual([item.index for item in result.data], [0, 1, 2])
+        self.assertTrue(all(item.transaction_id for item in result.data))
+
+    async def test_set_accounts_bulk_item_errors(self):
+        conflict = {"error": "Conflict", "code": 409}
+        with patch.object(self.adapter.client, 'setDataBulk', AsyncMock()) as mock_bulk, \
+                patch.object(self.adapter, '_set_single_document', AsyncMock(return_value=conflict)) as mock_single:
+            mock_bulk.return_value = [
+                {"documentId": "a", "transactionId": "1"},
+                conflict,
+                {"error": "Timeout", "code": None}
+            ]
+
+            result = await self.adapter.set_accounts_bulk([make_account(i) for i in range(3)])
+
+        mock_single.assert_awaited_once()
+
+        self.assertEqual([item.code for item in result.data], [200, 409, 500])
+        self.assertEqual(result.data[1].error, "Vault: Conflict")
+        self.assertEqual(result.data[2].error, "Vault is unreachable.")
+
+    async def test_set_accounts_write_batching(self):
+        self.adapter.write_batcher = WriteBatcher(self.adapter._flush_account_batch, max_delay_ms=1)
+
+        results = await asyncio.gather(*(self.adapter.set_accounts(make_account(i)) for i in range(3)))
+
+        self.assertTrue(all(result.status for result in results))
+
+    async def test_write_batching_isolates_rejected_documents(self):
+        conflict = httpx.HTTPStatusError("Conflict", request=MagicMock(), response=MagicMock(status_code=409))
+        bulk = AsyncMock(return_value=[{"error": "Conflict", "code": 409}] * 2)
+        single = AsyncMock(side_effect=[{"transactionId": "7"}, conflict])
+
+        with patch.object(self.adapter.client, 'setDataBulk', bulk), \
+             patch.object(self.adapter.client, 'setData', single):
+            self.adapter.write_batcher = WriteBatcher(self.adapter._flush_account_batch, max_delay_ms=1)
+            first, second = await asyncio.gather(
+                self.adapter.set_accounts(make_account(1)),
+                self.adapter.set_accounts(make_account(1))
+            )
+
+        self.assertEqual(first.data, "7")
+        self.assertEqual(second.code, 409)
+
+    async def test_get_accounts_is_cached_until_a_write(self):
+        with patch.object(self.adapter.client, 'getData', wraps=self.adapter.client.getData) as mock_get:
+            await self.adapter.get_accounts(1, 12)
+            await self.adapter.get_accounts(1, 12)
+            self.assertEqual(mock_get.await_count, 1)
+
+            await self.adapter.set_accounts(make_account(1))
+            await self.adapter.get_accounts(1, 12)
+            self.assertEqual(mock_get.await_count, 2)
+
+    async def test_get_accounts_with_filters(self):
+        await self.adapter.set_accounts_bulk([
+            make_account(1, amount=500, type="receiving", account_name="Rossi Mario"),
+            make_account(2, amount=50, type="receiving", iban="DE89370400440532013000"),
+        ])
+
+        receiving = await self.adapter.get_accounts(1, 10, AccountFilter(type="receiving"))
+        large = await self.adapter.get_accounts(1, 10, AccountFilter(amount_min=100))
+        german = await self.adapter.get_accounts(1, 10, AccountFilter(iban_country="DE"))
+        named = await self.adapter.get_accounts_page("", 10, AccountFilter(account_name="Rossi"))
+
+        self.assertEqual([a.account_number for a in receiving.data], [1, 2])
+        self.assertEqual([a.account_number for a in large.data], [1])
+        self.assertEqual([a.account_number for a in german.data], [2])
+        self.assertEqual([a.account_number for a in named.data.accounts], [1])
+        self.assertEqual(len((await self.adapter.get_accounts(1, 10)).data), 4)
+
+    async def test_fractional_amounts(self):
+        rejected = await self.adapter.set_accounts(make_account(1, amount=10.5))
+        await self.adapter.set_accounts(make_account(2, amount=11))
+
+        above = await self.adapter.get_accounts(1, 10, AccountFilter(amount_min=10.2))
+        below = await self.adapter.get_accounts(1, 10, AccountFilter(amount_max=10.9))
+
+        self.assertEqual(rejected.code, 400)
+        self.assertEqual([a.account_number for a in above.data], [2])
+        self.assertEqual([a.account_number for a in below.data], [1234, 12345])
+
+    async def test_get_accounts_sorted(self):
+        await self.adapter.set_accounts_bulk([make_account(i, amount=i * 100) for i in range(1, 6)])
+
+        top = await self.adapter.get_accounts(1, 3, sort=AccountSort.AMOUNT_DESC)
+        first = await self.adapter.get_accounts_page("", 3, sort=AccountSort.ACCOUNT_NUMBER_DESC)
+        second = await self.adapter.get_accounts_page(first.data.next_cursor, 3, sort=AccountSort.ACCOUNT_NUMBER_DESC)
+
+        self.assertEqual([a.account_number for a in top.data], [5, 4, 3])
+        numbers = [a.account_number for a in first.data.accounts + second.data.accounts]
+        self.assertEqual(numbers, [12345, 1234, 5, 4, 3, 2])
+
+    async def test_get_account(self):
+        with patch.object(self.adapter.client, 'getData', wraps=self.adapter.client.getData) as mock_get:
+            found = await self.adapter.get_account(1234)
+            again = await self.adapter.get_account(1234)
+            missing = await self.adapter.get_account(1)
+
+            self.assertEqual(found.data.account_number, 1234)
+            self.assertIs(again.data, found.data)
+            self.assertEqual(missing.code, 404)
+            self.assertEqual(mock_get.await_count, 2)
+            self.assertEqual(mock_get.await_args.kwargs["query"], {"expressions": [
+                {"fieldComparisons": [{"field": "account_number", "operator": "EQ", "value": 1}]}
+            ]})
+
+            await self.adapter.set_accounts(make_account(1))
+            created = await self.adapter.get_account(1)
+            await self.adapter.get_account(1234)
+
+            self.assertEqual(created.data.account_number, 1)
+            self.assertEqual(mock_get.await_count, 3)
+
+    async def test_set_accounts_bulk_isolates_rejected_chunk(self):
+        await self.adapter.set_accounts(make_account(5))
+
+        result = await self.adapter.set_accounts_bulk([make_account(6), make_account(5)])
+
+        self.assertEqual([item.code for item in result.data], [200, 409])
+        self.assertTrue(result.data[0].transaction_id)
+        self.assertIsNone(result.data[1].transaction_id)
+        self.assertEqual((await self.adapter.get_account(6)).data.account_number, 6)
+
+    async def test_set_accounts_bulk_bounds_isolated_retries(self):
+        accounts = [make_account(i) for i in range(1, 21)]
+        await self.adapter.set_accounts_bulk(accounts)
+
+        set_data = self.adapter.client.setData
+        in_flight = peak = 0
+
+        async def tracked_set_data(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.001)
+                return await set_data(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        with patch.object(Settings(), "IMMUDB_VAULT_BULK_CONCURRENCY", 2), \
+                patch.object(self.adapter.client, 'setData', side_effect=tracked_set_data) as mock_set:
+            result = await self.adapter.set_accounts_bulk(accounts)
+
+        self.assertEqual(mock_set.await_count, 20)
+        self.assertLessEqual(peak, 2)
+        self.assertEqual([item.code for item in result.data], [409] * 20)
+
+    async def test_get_accounts_by_number(self):
+        await self.adapter.set_accounts_bulk([make_account(i) for i in range(1, 6)])
+
+        with patch.object(Settings(), "IMMUDB_LOOKUP_CHUNK_SIZE", 2), \
+                patch.object(self.adapter.client, 'getData', wraps=self.adapter.client.getData) as mock_get:
+            result = await self.adapter.get_accounts_by_number([5, 1234, 99, 5, 1, 2])
+            self.assertEqual(mock_get.await_count, 3)
+
+            cached = await self.adapter.get_accounts_by_number([1, 99])
+            single = await self.adapter.get_account(1234)
+            self.assertEqual(mock_get.await_count, 3)
+
+        self.assertEqual([item.account_number for item in result.data], [5, 1234, 99, 5, 1, 2])
+        self.assertEqual([item.found for item in result.data], [True, True, False, True, True, True])
+        self.assertEqual(result.data[1].account.account_number, 1234)
+        self.assertIsNone(result.data[2].account)
+        self.assertEqual([item.found for item in cached.data], [True, False])
+        self.assertEqual(single.data.account_number, 1234)
+
+    def slow_reads(self):
+        """Patch getData so reads hold their result until the returned event is set."""
+        get_data = self.adapter.client.getData
+        release = asyncio.Event()
+
+        async def slow_get_data(*args, **kwargs):
+            result = await get_data(*args, **kwargs)
+            await release.wait()
+            return result
+
+        return patch.object(self.adapter.client, 'getData', side_effect=slow_get_data), release
+
+    async def test_read_after_write_does_not_join_older_read(self):
+        patcher, release = self.slow_reads()
+        with patcher:
+            before_page = asyncio.create_task(self.adapter.get_accounts(1, 50))
+            before_account = asyncio.create_task(self.adapter.get_account(7))
+            await asyncio.sleep(0.01)
+
+            written = await self.adapter.set_accounts(make_account(7))
+            after_page = asyncio.create_task(self.adapter.get_accounts(1, 50))
+            after_account = asyncio.create_task(self.adapter.get_account(7))
+            await asyncio.sleep(0.01)
+            release.set()
+
+            await asyncio.gather(before_page, before_account)
+            self.assertTrue(written.status)
+            self.assertIn(7, [a.account_number for a in (await after_page).data])
+            self.assertEqual((await after_account).data.account_number, 7)
+
+    async def test_count_accounts_is_maintained_locally(self):
+        with patch.object(self.adapter.client, 'countCollection', wraps=self.adapter.client.countCollection) as mock_count:
+            first = await self.adapter.count_accounts()
+            await self.adapter.set_accounts(make_account(1))
+            second = await self.adapter.count_accounts()
+
+        self.assertEqual(second.data, first.data + 1)
+        mock_count.assert_awaited_once()
+
+    async def test_get_accounts_page_continues_search(self):
+        first = await self.adapter.get_accounts_page("", 2)
+        self.assertEqual(len(first.data.accounts), 2)
+        self.assertIsNotNone(first.data.next_cursor)
+
+        with patch.object(self.adapter.client, 'getData', wraps=self.adapter.client.getData) as mock_get:
+            await self.adapter.get_accounts_page(first.data.next_cursor, 2)
+
+        mock_get.assert_awaited_once_with("test", 2, 2, search_id=ANY, keep_open=True, query=None)
+        self.assertTrue(mock_get.await_args.kwargs["search_id"])
+
+    async def test_get_accounts_page_invalid_cursor(self):
+        result = await self.adapter.get_accounts_page("garbage", 2)
+        self.assertEqual(result.code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock
+from fastapi import HTTPException
+from app.adapters.immudb_adapter import ImmuDBAdapter
+from app.adapters.immudb_adapter_singleton import ImmuDBAdapterSingleton
+
+ADAPTER_ARGS = dict(sandbox=True, ledger="test_ledger", collection="test",
+                    base_url="http://example.com", api_key="test_api_key")
+
+class TestImmuDBAdapterSingleton(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self):
+        await ImmuDBAdapterSingleton.close_instance()
+
+    async def test_concurrent_callers_share_one_adapter(self):
+        with patch.object(ImmuDBAdapter, 'connect', autospec=True, side_effect=ImmuDBAdapter.connect) as mock_connect:
+            adapters = await asyncio.gather(*(ImmuDBAdapterSingleton.get_instance(**ADAPTER_ARGS) for _ in range(10)))
+
+        self.assertTrue(all(adapter is adapters[0] for adapter in adapters))
+        self.assertEqual(mock_connect.call_count, 1)
+        self.assertTrue(adapters[0].get_readiness().status)
+
+    async def test_failed_connection_is_reported(self):
+        with patch.object(ImmuDBAdapter, 'connect', AsyncMock(side_effect=ConnectionError("The vault is not available."))):
+            with self.assertRaises(HTTPException):
+                await ImmuDBAdapterSingleton.get_instance(**ADAPTER_ARGS)
+
+        self.assertIsNone(ImmuDBAdapterSingleton.peek_instance())
+        self.assertEqual(ImmuDBAdapterSingleton.last_error, "The vault is not available.")
+
+if __name__ == '__main__':
+    unittest.main()
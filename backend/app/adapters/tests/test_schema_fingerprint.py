@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, AsyncMock
+from app.adapters.immudb_adapter import ImmuDBAdapter
+from app.adapters.schema_fingerprint import SchemaFingerprintCache
+from app.immudb._production_client import _ProductionClient
+from app.schemas.account import account_schema
+
+VALID_DETAILS = {
+    "fields": account_schema["fields"],
+    "indexes": account_schema["indexes"]
+}
+
+VAULT = "http://example.com"
+
+class TestSchemaFingerprintCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SchemaFingerprintCache(os.path.join(self.directory.name, "schema.json"), ttl=60)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_store_and_verify(self):
+        self.assertFalse(self.cache.is_verified(VAULT, "ledger", "accounts", account_schema))
+
+        self.cache.store(VAULT, "ledger", "accounts", account_schema)
+
+        self.assertTrue(self.cache.is_verified(VAULT, "ledger", "accounts", account_schema))
+        self.assertFalse(self.cache.is_verified(VAULT, "ledger", "other", account_schema))
+        self.assertFalse(self.cache.is_verified(VAULT, "ledger", "accounts", {"fields": []}))
+        self.assertFalse(self.cache.is_verified("http://other.example.com", "ledger", "accounts", account_schema))
+
+    def test_expired_and_discarded_entries(self):
+        self.cache.store(VAULT, "ledger", "accounts", account_schema)
+
+        with patch("app.adapters.schema_fingerprint.time.time", return_value=1e12):
+            self.assertFalse(self.cache.is_verified(VAULT, "ledger", "accounts", account_schema))
+
+        self.cache.discard(VAULT, "ledger", "accounts")
+        self.assertFalse(self.cache.is_verified(VAULT, "ledger", "accounts", account_schema))
+
+class TestAdapterWarmStart(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.adapter = ImmuDBAdapter(False, "ledger", "accounts", VAULT, "key")
+        self.adapter.schema_cache = SchemaFingerprintCache(os.path.join(self.directory.name, "schema.json"))
+
+    async def asyncTearDown(self):
+        await self.adapter.close()
+        self.directory.cleanup()
+
+    async def test_warm_start_skips_then_reverifies(self):
+        self.adapter.schema_cache.store(VAULT, "ledger", "accounts", account_schema)
+
+        with patch.object(_ProductionClient, 'getCollectionDetails', AsyncMock(return_value=VALID_DETAILS)) as mock_details:
+            await self.adapter.connect()
+            self.assertTrue(self.adapter.ready)
+            mock_details.assert_not_awaited()
+
+            await self.adapter._schema_task
+            mock_details.assert_awaited_once()
+            self.assertTrue(self.adapter.ready)
+
+    async def test_background_mismatch_flips_readiness(self):
+        self.adapter.schema_cache.store(VAULT, "ledger", "accounts", account_schema)
+        invalid_details = {"fields": [], "indexes": []}
+
+        with patch.object(_ProductionClient, 'getCollectionDetails', AsyncMock(return_value=invalid_details)):
+            await self.adapter.connect()
+            await self.adapter._schema_task
+
+        self.assertFalse(self.adapter.ready)
+        self.assertFalse(self.adapter.get_readiness().status)
+        self.assertFalse(self.adapter.schema_cache.is_verified(VAULT, "ledger", "accounts", account_schema))
+
+    async def test_cold_start_stores_fingerprint(self):
+        with patch.object(_ProductionClient, 'getCollectionDetails', AsyncMock(return_value=VALID_DETAILS)):
+            await self.adapter.connect()
+
+        self.assertTrue(self.adapter.schema_cache.is_verified(VAULT, "ledger", "accounts", account_schema))
+
+    async def test_other_vault_is_verified_again(self):
+        self.adapter.schema_cache.store("http://other.example.com", "ledger", "accounts", account_schema)
+
+        with patch.object(_ProductionClient, 'getCollectionDetails', AsyncMock(return_value=VALID_DETAILS)) as mock_details:
+            await self.adapter.connect()
+
+        mock_details.assert_awaited_once()
+        self.assertIsNone(self.adapter._schema_task)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+from app.adapters.immudb_adapter import ImmuDBAdapter
+from app.adapters.schema_migration import missing_indexes
+from app.schemas.account import account_schema
+from app.settings import Settings
+
+SECONDARY_FIELDS = [["type"], ["amount"], ["iban"]]
+
+class TestSchemaMigration(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.adapter = ImmuDBAdapter(
+            sandbox=True,
+            ledger="test_ledger",
+            collection="test",
+            base_url="http://example.com",
+            api_key="test_api_key"
+        )
+        self.adapter.schema_cache = None
+        await self.adapter.connect()
+
+    async def asyncTearDown(self):
+        await self.adapter.close()
+
+    def test_missing_indexes(self):
+        details = {"indexes": [{"fields": ["account_number"], "isUnique": False}, {"fields": ["type"], "isUnique": False}]}
+
+        missing = missing_indexes(details, account_schema)
+
+        self.assertEqual([index["fields"] for index in missing], [["account_number"], ["amount"], ["iban"]])
+        self.assertEqual(missing_indexes({"indexes": account_schema["indexes"]}, account_schema), [])
+
+    async def test_migrate_schema(self):
+        dry_run = await self.adapter.migrate_schema(dry_run=True)
+        self.assertEqual([index["fields"] for index in dry_run.data], SECONDARY_FIELDS)
+
+        created = await self.adapter.migrate_schema()
+        again = await self.adapter.migrate_schema()
+
+        self.assertEqual([index["fields"] for index in created.data], SECONDARY_FIELDS)
+        self.assertEqual(again.data, [])
+        details = await self.adapter.client.getCollectionDetails("test")
+        self.assertEqual(self.adapter._verify_fields(details, account_schema), ([], [], []))
+
+    async def test_schema_check_migrates_at_startup(self):
+        with patch.object(self.adapter.client, 'createIndex', wraps=self.adapter.client.createIndex) as mock_create:
+            await self.adapter._check_collection_schema()
+            await self.adapter._check_collection_schema()
+
+        self.assertEqual([call.args[1] for call in mock_create.await_args_list], SECONDARY_FIELDS)
+
+    async def test_schema_check_without_migration(self):
+        with patch.object(Settings(), "IMMUDB_SCHEMA_MIGRATE", False), \
+                patch.object(self.adapter.client, 'createIndex') as mock_create, \
+                self.assertLogs("app.adapters.immudb_adapter", level="WARNING"):
+            await self.adapter._check_collection_schema()
+
+        mock_create.assert_not_called()
+
+    async def test_missing_unique_index_is_an_error(self):
+        details = {"fields": account_schema["fields"], "indexes": account_schema["indexes"][1:]}
+
+        with patch.object(self.adapter.client, 'getCollectionDetails', return_value=details):
+            with self.assertRaises(ConnectionError):
+                await self.adapter._check_collection_schema()
+
+if __name__ == '__main__':
+    unittest.main()
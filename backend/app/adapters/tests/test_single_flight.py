@@ -0,0 +1,49 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from app.adapters.single_flight import SingleFlight
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_share_one_execution(self):
+        async def call():
+            await asyncio.sleep(0.01)
+            return {"count": 2}
+
+        fn = AsyncMock(side_effect=call)
+        group = SingleFlight()
+
+        results = await asyncio.gather(*(group.do("count", fn) for _ in range(10)))
+
+        fn.assert_awaited_once()
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual((group.executions, group.shared), (1, 9))
+        self.assertEqual(len(group), 0)
+
+    async def test_error_is_shared_and_not_remembered(self):
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("down")
+
+        group = SingleFlight()
+        results = await asyncio.gather(group.do("k", call), group.do("k", call), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ConnectionError) for result in results))
+
+        fn = AsyncMock(return_value=1)
+        self.assertEqual(await group.do("k", fn), 1)
+
+    async def test_cancelled_waiter_does_not_cancel_execution(self):
+        async def call():
+            await asyncio.sleep(0.02)
+            return 1
+
+        group = SingleFlight()
+        first = asyncio.ensure_future(group.do("k", call))
+        second = asyncio.ensure_future(group.do("k", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+from app.adapters.write_batcher import WriteBatcher
+
+class TestWriteBatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_coalesces_concurrent_submits(self):
+        flush = AsyncMock(side_effect=lambda docs: [{"transactionId": str(d["n"])} for d in docs])
+        batcher = WriteBatcher(flush, max_batch_size=10, max_delay_ms=5)
+
+        results = await asyncio.gather(*(batcher.submit({"n": i}) for i in range(4)))
+
+        flush.assert_awaited_once()
+        self.assertEqual([r["transactionId"] for r in results], ["0", "1", "2", "3"])
+
+    async def test_flushes_when_batch_is_full(self):
+        flush = AsyncMock(side_effect=lambda docs: [{"transactionId": "1"} for _ in docs])
+        batcher = WriteBatcher(flush, max_batch_size=2, max_delay_ms=10000)
+
+        await asyncio.wait_for(asyncio.gather(*(batcher.submit({"n": i}) for i in range(4))), timeout=1)
+
+        self.assertEqual(flush.await_count, 2)
+
+    async def test_flush_error_reaches_every_caller(self):
+        flush = AsyncMock(side_effect=ConnectionError("down"))
+        batcher = WriteBatcher(flush, max_batch_size=10, max_delay_ms=1)
+
+        results = await asyncio.gather(batcher.submit({}), batcher.submit({}), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+
+if __name__ == '__main__':
+    unittest.main()
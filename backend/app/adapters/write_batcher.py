@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+class WriteBatcher:
+    """
+    Write-behind queue coalescing concurrent single-document inserts.
+
+    Submitted documents are buffered in memory and flushed as one bulk insert
+    when `max_batch_size` documents are pending or `max_delay_ms` milliseconds
+    have passed since the first pending document, whichever comes first. Each
+    caller awaits its own result.
+    """
+
+    def __init__(self,
+                 flush: Callable[[List[Dict]], Awaitable[List[Dict[str, Any]]]],
+                 max_batch_size: int = 100,
+                 max_delay_ms: float = 5.0):
+        """
+        Initializes the batcher.
+
+        Args:
+            flush (Callable): Coroutine function inserting a list of documents and
+                returning one result per document, in the same order.
+            max_batch_size (int, optional): Documents that trigger an immediate flush. Defaults to 100.
+            max_delay_ms (float, optional): Maximum time a document waits in the queue. Defaults to 5.0.
+        """
+        self._flush = flush
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_delay = max(0.0, max_delay_ms) / 1000
+        self._pending: List[Tuple[Dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    async def submit(self, document: Dict) -> Dict[str, Any]:
+        """
+        Queue a document for insertion and wait for its result.
+
+        Args:
+            document (Dict): The document to insert.
+
+        Returns:
+            Dict[str, Any]: The result of this document, as returned by the flush function.
+
+        Raises:
+            Exception: Any error raised by the flush function for the whole batch.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((document, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._schedule_flush)
+
+        return await future
+
+    def _schedule_flush(self):
+        """Hand the pending documents over to a background flush task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Dict, asyncio.Future]]):
+        """Flush a batch and resolve the future of every document in it."""
+        try:
+            results = await self._flush([document for document, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+        for _, future in batch[len(results):]:
+            if not future.done():
+                future.set_exception(RuntimeError("The vault returned fewer results than documents."))
+
+    async def close(self):
+        """Flush every pending document and wait for in-flight batches."""
+        self._schedule_flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
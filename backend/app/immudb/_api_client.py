@@ -1,5 +1,7 @@
-from typing import Any, Dict, Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List
 from abc import ABC, abstractmethod
+from ._instrumentation import default_hooks
+from .hooks import ClientHook
 
 class _ApiClient(ABC):
     """
@@ -13,6 +15,7 @@ class _ApiClient(ABC):
         ledger (str): The name of the ledger associated with the client.
         base_url (str): The base URL of the API.
         api_key (str): The API key used for authentication.
+        hooks (List[ClientHook]): Callbacks run around every call (metrics and tracing by default).
     """
 
     def __init__(self, ledger: str, base_url: str, api_key: str):
@@ -27,6 +30,41 @@ class _ApiClient(ABC):
         self.ledger = ledger
         self.base_url = base_url
         self.api_key = api_key
+        self.hooks: List[ClientHook] = default_hooks()
+
+    def add_hook(self, hook: ClientHook):
+        """
+        Run `hook` around every call of the client.
+
+        Args:
+            hook (ClientHook): The hook, e.g. a profiler or a custom tracer.
+        """
+        self.hooks.append(hook)
+
+    async def open(self):
+        """
+        Open the long-lived resources (e.g. connection pools) used by the client.
+
+        Implementations without such resources can keep this default no-op.
+        """
+        pass
+
+    async def close(self):
+        """
+        Release the long-lived resources opened by the client.
+
+        Implementations without such resources can keep this default no-op.
+        """
+        pass
+
+    def getStats(self) -> Dict[str, Any]:
+        """
+        Return runtime statistics of the client, for monitoring.
+
+        Returns:
+            Dict[str, Any]: The statistics. The default implementation has none.
+        """
+        return {}
 
     @abstractmethod
     async def getCollectionDetails(self, collection_name: str):
@@ -84,7 +122,24 @@ class _ApiClient(ABC):
         pass
 
     @abstractmethod
-    async def getData(self, collection_name: str, page:int, count: int):
+    async def createIndex(self, collection_name: str, fields: List[str], is_unique: bool = False) -> bool:
+        """
+        Add an index to an existing collection.
+
+        Args:
+            collection_name (str): The name of the collection.
+            fields (List[str]): The indexed fields.
+            is_unique (bool, optional): Whether the index rejects duplicate values. Defaults to False.
+
+        Returns:
+            bool: True if the index was created successfully, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def getData(self, collection_name: str, page:int, count: int,
+                      search_id: Optional[str] = None, keep_open: bool = False,
+                      query: Optional[Dict[str, Any]] = None):
         """
         Retrieve data from a collection, paginated by page and count.
 
@@ -92,6 +147,14 @@ class _ApiClient(ABC):
             collection_name (str): The name of the collection to retrieve data from.
             page (int): The page number of the data to retrieve.
             count (int): The number of items to retrieve per page.
+            search_id (Optional[str], optional): The `searchId` of a search kept open by a
+                previous call, to continue it instead of starting a new one. Defaults to None.
+            keep_open (bool, optional): Ask the vault to keep the search open, so that its
+                `searchId` can be used to fetch the next pages. Defaults to False.
+            query (Optional[Dict[str, Any]], optional): The vault search query, with
+                `expressions` OR'ed together, each AND-ing its `fieldComparisons`,
+                and the `orderBy` sort keys (see `app.immudb.query`). Ignored when
+                continuing a search. Defaults to None (every document, in insertion order).
 
         Returns:
             Any: The retrieved data. The structure of the returned data depends on the
@@ -99,6 +162,28 @@ class _ApiClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def iterDocuments(self, collection_name: str, page_size: int = 100, concurrency: int = 4,
+                      adaptive: bool = False) -> AsyncIterator[Dict]:
+        """
+        Iterate over every document of a collection, fetching pages in parallel.
+
+        The search is kept open and continued by `searchId`; up to `concurrency`
+        pages are requested at the same time and documents are yielded in order.
+        Iteration stops cleanly after the last page.
+
+        Args:
+            collection_name (str): The name of the collection to iterate over.
+            page_size (int, optional): The number of documents per request. Defaults to 100.
+            concurrency (int, optional): Maximum number of page requests in flight. Defaults to 4.
+            adaptive (bool, optional): Grow or shrink the page size according to the observed
+                request latency. Defaults to False.
+
+        Returns:
+            AsyncIterator[Dict]: An async iterator over the documents.
+        """
+        pass
+
     @abstractmethod
     async def setData(self, collection_name: str, data: Any):
         """
@@ -112,4 +197,29 @@ class _ApiClient(ABC):
             Any: The result of the operation. The return type depends on the API
             implementation.
         """
+        pass
+
+    @abstractmethod
+    async def setDataBulk(self, collection_name: str, documents: List[Dict],
+                          chunk_size: int = 100, max_chunk_bytes: int = 1048576,
+                          concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        Insert many documents in a specific collection with as few calls as possible.
+
+        Documents are split into chunks bounded by `chunk_size` documents and
+        `max_chunk_bytes` serialized bytes; each chunk is inserted with a single
+        vault call and up to `concurrency` chunks are in flight at the same time.
+
+        Args:
+            collection_name (str): The name of the collection to insert data in.
+            documents (List[Dict]): The documents to insert.
+            chunk_size (int, optional): Maximum documents per vault call. Defaults to 100.
+            max_chunk_bytes (int, optional): Maximum serialized bytes per vault call. Defaults to 1 MiB.
+            concurrency (int, optional): Maximum concurrent vault calls. Defaults to 4.
+
+        Returns:
+            List[Dict[str, Any]]: One result per document, in input order. Successful items
+            contain `documentId` and `transactionId`; failed items contain `error` and
+            `code` (the vault HTTP status, or None when the vault was unreachable).
+        """
         pass
\ No newline at end of file
@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+import httpx
+from app import json_backend
+from .resilience import VaultUnavailableError
+
+def chunk_documents(documents: List[Dict], max_documents: int, max_bytes: int) -> List[List[Dict]]:
+    """
+    Split documents into chunks bounded both in number of documents and in
+    serialized size.
+
+    A single document bigger than `max_bytes` is placed in a chunk on its own,
+    so that the vault can reject it without affecting the others.
+
+    Args:
+        documents (List[Dict]): The documents to split.
+        max_documents (int): Maximum number of documents per chunk.
+        max_bytes (int): Maximum serialized size (in bytes) of a chunk.
+
+    Returns:
+        List[List[Dict]]: The chunks, preserving the original document order.
+    """
+    chunks = []
+    current = []
+    current_bytes = 0
+
+    for document in documents:
+        size = len(json_backend.dumps(document))
+
+        if current and (len(current) >= max_documents or current_bytes + size > max_bytes):
+            chunks.append(current)
+            current = []
+            current_bytes = 0
+
+        current.append(document)
+        current_bytes += size
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+async def run_chunks(chunks: List[List[Dict]],
+                     insert: Callable[[List[Dict]], Awaitable[Dict[str, Any]]],
+                     concurrency: int) -> List[Dict[str, Any]]:
+    """
+    Insert chunks with bounded concurrency and expand the outcome per document.
+
+    Args:
+        chunks (List[List[Dict]]): The chunks to insert, as built by `chunk_documents`.
+        insert (Callable): Coroutine function inserting one chunk and returning the
+            vault response (`documentIds` and `transactionId`).
+        concurrency (int): Maximum number of chunks in flight at the same time.
+
+    Returns:
+        List[Dict[str, Any]]: One result per document, in the original order. Successful
+        items contain `documentId` and `transactionId`; failed items contain `error`
+        and `code` (the vault HTTP status, or None when the vault was unreachable).
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def insert_chunk(chunk: List[Dict]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                response = await insert(chunk)
+            except httpx.HTTPStatusError as http_err:
+                return [{"error": str(http_err), "code": http_err.response.status_code}] * len(chunk)
+            except VaultUnavailableError as e:
+                return [{"error": str(e), "code": 503}] * len(chunk)
+            except httpx.RequestError as req_err:
+                return [{"error": str(req_err), "code": None}] * len(chunk)
+
+        document_ids = response.get("documentIds", [])
+        transaction_id = response.get("transactionId")
+        return [
+            {
+                "documentId": document_ids[i] if i < len(document_ids) else None,
+                "transactionId": transaction_id
+            }
+            for i in range(len(chunk))
+        ]
+
+    chunk_results = await asyncio.gather(*(insert_chunk(chunk) for chunk in chunks))
+    return [dict(result) for results in chunk_results for result in results]
@@ -0,0 +1,104 @@
+import functools
+import logging
+from typing import Awaitable, Callable, List, TypeVar
+from app.metrics import REGISTRY
+from app.tracing import current_trace
+from .hooks import ClientHook, VaultCall, _current_call
+
+logger = logging.getLogger(__name__)
+
+VAULT_CALL_SECONDS = REGISTRY.histogram(
+    "vault_call_duration_seconds",
+    "Duration of vault client calls, retries included.",
+    ("operation", "outcome", "status")
+)
+
+VAULT_IN_FLIGHT = REGISTRY.gauge(
+    "vault_calls_in_flight",
+    "Vault client calls currently running.",
+    ("operation",)
+)
+
+class MetricsHook(ClientHook):
+    """Record every vault call in the Prometheus metrics."""
+
+    def before_call(self, call: VaultCall):
+        VAULT_IN_FLIGHT.inc(operation=call.operation)
+
+    def after_call(self, call: VaultCall):
+        self._observe(call)
+
+    def on_error(self, call: VaultCall, error: BaseException):
+        self._observe(call)
+
+    def _observe(self, call: VaultCall):
+        status = str(call.status) if call.outcome in ("success", "error") else ""
+        VAULT_CALL_SECONDS.observe(call.duration, operation=call.operation, outcome=call.outcome, status=status)
+        VAULT_IN_FLIGHT.dec(operation=call.operation)
+
+class TracingHook(ClientHook):
+    """Add every vault call as a span of the current request trace, when it is sampled."""
+
+    def after_call(self, call: VaultCall):
+        self._span(call)
+
+    def on_error(self, call: VaultCall, error: BaseException):
+        self._span(call)
+
+    def _span(self, call: VaultCall):
+        trace = current_trace()
+        if trace is not None:
+            trace.add_span(
+                f"vault.{call.operation}", call.started_at, call.duration,
+                outcome=call.outcome, status=call.status, attempts=call.attempts,
+                request_bytes=call.request_bytes, response_bytes=call.response_bytes
+            )
+
+def default_hooks() -> List[ClientHook]:
+    """Return the hooks installed on every new client."""
+    return [MetricsHook(), TracingHook()]
+
+def _run_hooks(hooks: List[ClientHook], callback: str, *args):
+    for hook in hooks:
+        try:
+            getattr(hook, callback)(*args)
+        except Exception:
+            logger.exception("Vault client hook %r failed in %s", hook, callback)
+
+F = TypeVar("F", bound=Callable[..., Awaitable])
+
+def instrumented(method: F) -> F:
+    """
+    Run the client hooks around a vault client method.
+
+    The `VaultCall` describing the call is bound to the context while the
+    method runs, so the implementation can record payload sizes, statuses and
+    attempts on it (see `hooks.current_call()`).
+
+    Args:
+        method (Callable): The async client method; its name is the operation.
+
+    Returns:
+        Callable: The instrumented method.
+    """
+    operation = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        call = VaultCall(operation)
+        token = _current_call.set(call)
+        _run_hooks(self.hooks, "before_call", call)
+        try:
+            result = await method(self, *args, **kwargs)
+        except BaseException as e:
+            call.finish(e)
+            _run_hooks(self.hooks, "on_error", call, e)
+            raise
+        finally:
+            _current_call.reset(token)
+
+        call.finish()
+        _run_hooks(self.hooks, "after_call", call)
+        return result
+
+    return wrapper
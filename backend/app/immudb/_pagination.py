@@ -0,0 +1,94 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+MIN_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+TARGET_PAGE_LATENCY = 0.5
+
+FetchPage = Callable[[int, int, Optional[str], bool], Awaitable[Dict[str, Any]]]
+
+async def iter_documents(fetch_page: FetchPage, page_size: int, concurrency: int,
+                         adaptive: bool = False) -> AsyncIterator[Dict]:
+    """
+    Iterate over every document of a search, fetching several pages in parallel.
+
+    The first page opens a search kept alive by the vault; the following pages
+    continue it by `searchId`, with at most `concurrency` requests in flight.
+    Documents are yielded in order and iteration stops at the first short page.
+
+    With `adaptive`, the page size of the pages not yet requested doubles when a
+    page comes back in less than half of `TARGET_PAGE_LATENCY` and halves when
+    it takes longer, within `MIN_PAGE_SIZE` and `MAX_PAGE_SIZE`.
+
+    Args:
+        fetch_page (FetchPage): Coroutine function `(page, count, search_id, keep_open)`
+            returning a vault search response.
+        page_size (int): The initial number of documents per request.
+        concurrency (int): Maximum number of requests in flight.
+        adaptive (bool, optional): Adapt the page size to the observed latency. Defaults to False.
+
+    Yields:
+        Dict: The documents, in search order.
+    """
+    size = max(1, page_size)
+    concurrency = max(1, concurrency)
+
+    async def timed_fetch(page: int, count: int, search_id: Optional[str], keep_open: bool):
+        started = time.monotonic()
+        response = await fetch_page(page, count, search_id, keep_open)
+        return response, time.monotonic() - started
+
+    def adapt(count: int, latency: float) -> int:
+        if not adaptive:
+            return count
+        if latency < TARGET_PAGE_LATENCY / 2:
+            return min(MAX_PAGE_SIZE, count * 2)
+        if latency > TARGET_PAGE_LATENCY:
+            return max(MIN_PAGE_SIZE, count // 2)
+        return count
+
+    response, latency = await timed_fetch(1, size, None, True)
+    search_id = response.get("searchId") or None
+    revisions = response.get("revisions", [])
+
+    for revision in revisions:
+        yield revision.get("document", {})
+
+    if len(revisions) < size:
+        return
+
+    # Offset of the first document not requested yet
+    next_offset = size
+    size = adapt(size, latency)
+    in_flight = deque()
+
+    def schedule():
+        nonlocal next_offset
+        page = next_offset // size + 1
+        skip = next_offset % size
+        task = asyncio.ensure_future(timed_fetch(page, size, search_id, True))
+        in_flight.append((task, size, skip))
+        next_offset = page * size
+
+    try:
+        while True:
+            while len(in_flight) < concurrency:
+                schedule()
+
+            task, count, skip = in_flight.popleft()
+            response, latency = await task
+            revisions = response.get("revisions", [])
+
+            for revision in revisions[skip:]:
+                yield revision.get("document", {})
+
+            if len(revisions) < count:
+                return
+
+            size = adapt(size, latency)
+
+    finally:
+        for task, _, _ in in_flight:
+            task.cancel()
@@ -1,119 +1,288 @@
 import httpx
-import json
-from typing import Any, Dict
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+from app import json_backend
+from app.tracing import current_trace, span
 from ._api_client import _ApiClient
+from ._bulk import chunk_documents, run_chunks
+from ._instrumentation import instrumented
+from ._pagination import iter_documents
+from .admission import AdmissionController, parse_retry_after
+from .connection_pool import ConnectionPool
+from .hooks import current_call
+from .resilience import ResiliencePolicy, VaultUnavailableError
 
 class _ProductionClient(_ApiClient):
     """
     Concrete implementation of the _ApiClient abstract base class.
+
+    Every call goes through a shared `ConnectionPool`, so connections to the
+    vault are reused across requests.
     """
 
-    def __init__(self, ledger: str, base_url: str, api_key: str):
-        """Inherits docstring from _ApiClient."""
+    def __init__(self, ledger: str, base_url: str, api_key: str, pool: Optional[ConnectionPool] = None,
+                 resilience: Optional[ResiliencePolicy] = None, admission: Optional[AdmissionController] = None):
+        """
+        Inherits docstring from _ApiClient.
+
+        Args:
+            pool (ConnectionPool, optional): The connection pool used for vault calls.
+                A pool with default settings is created when omitted.
+            resilience (ResiliencePolicy, optional): The retry and circuit breaking policy.
+                A policy with default settings is created when omitted.
+            admission (AdmissionController, optional): The outbound concurrency and rate limiter.
+                A controller with default settings is created when omitted.
+        """
         super().__init__(ledger, base_url, api_key)
+        self.pool = pool if pool is not None else ConnectionPool()
+        self.resilience = resilience if resilience is not None else ResiliencePolicy()
+        self.admission = admission if admission is not None else AdmissionController()
 
-    async def getCollectionDetails(self, collection_name: str):
+    async def open(self):
         """Inherits docstring from _ApiClient."""
-        url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}"
-        headers = {
+        await self.pool.open()
+
+    async def close(self):
+        """Inherits docstring from _ApiClient."""
+        await self.pool.close()
+
+    def _headers(self) -> Dict[str, str]:
+        """Build the headers sent with every vault request."""
+        return {
             'accept': 'application/json',
             'X-API-Key': self.api_key,
             'Content-Type': 'application/json'
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
+    def _decode(self, response: httpx.Response) -> Any:
+        """Parse the JSON body of a vault response with the fast JSON backend."""
+        content = response.content
+        call = current_call()
+        if call is not None:
+            call.response_bytes += len(content)
+
+        with span("vault.decode"):
+            return json_backend.loads(content)
+
+    async def _send(self, operation: str, method: str, url: str, payload: Any = None, **kwargs) -> httpx.Response:
+        """
+        Send a request through the pooled HTTP client, applying the resilience policy.
+
+        Each attempt waits to be admitted by the admission controller. Failed
+        attempts are retried according to the policy, and every outcome is
+        recorded by the circuit breaker of the operation. Transport errors and
+        5xx responses count as failures; other responses count as successes,
+        except 429 responses, which throttle admissions for the `Retry-After`
+        delay and are retried for any operation. A half-open probe that ends
+        without a verdict (429, refused admission, cancellation) releases the
+        probe slot of the breaker.
+
+        The request size, the attempts and the last status are recorded on the
+        current `VaultCall`; encoding, admission queueing, network time and
+        backoff are recorded as spans of the current trace.
+
+        Args:
+            operation (str): The client method name, used to pick the timeout and breaker.
+            method (str): The lowercase HTTP method (e.g. "get", "post").
+            url (str): The request URL.
+            payload (Any, optional): The JSON request body, encoded once with the fast
+                JSON backend and reused across attempts. Defaults to None (no body).
+            **kwargs: Extra arguments forwarded to httpx.
+
+        Returns:
+            httpx.Response: The vault response.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker of the operation is open.
+            AdmissionTimeoutError: If the call could not be admitted in time.
+            httpx.RequestError: If the vault could not be reached.
+        """
+        breaker = self.resilience.breaker(operation)
+        call = current_call()
+        attempt = 0
+        if payload is not None:
+            with span("vault.encode"):
+                kwargs["content"] = json_backend.dumps(payload)
+            if call is not None:
+                call.request_bytes += len(kwargs["content"])
+
+        while True:
+            probe = breaker.before_call()
+            attempt += 1
+            if call is not None:
+                call.attempts += 1
+
+            try:
+                queued_at = time.perf_counter()
+                async with self.admission.admit(operation):
+                    trace = current_trace()
+                    if trace is not None:
+                        trace.add_span("vault.queue", queued_at, time.perf_counter() - queued_at)
+
+                    client = self.pool.get_client()
+                    send = getattr(client, method)
+                    with span("vault.network", operation=operation, attempt=attempt):
+                        response = await send(url, headers=self._headers(), timeout=self.pool.timeout_for(operation), **kwargs)
+
+            except VaultUnavailableError:
+                if probe:
+                    breaker.release_probe()
+                raise
+
+            except httpx.RequestError as req_err:
+                breaker.record_failure()
+                if not self.resilience.can_retry(operation, attempt, error=req_err):
+                    raise
+                with span("vault.backoff"):
+                    await self.resilience.backoff(attempt)
+                continue
+
+            except BaseException:
+                if probe:
+                    breaker.release_probe()
+                raise
+
+            if call is not None:
+                call.status = response.status_code
+
+            if response.status_code == 429:
+                if probe:
+                    breaker.release_probe()
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.admission.throttle(retry_after if retry_after is not None else self.resilience.max_delay)
+                if attempt < self.resilience.max_attempts:
+                    continue
+            elif response.status_code >= 500:
+                breaker.record_failure()
+                if self.resilience.can_retry(operation, attempt, status_code=response.status_code):
+                    with span("vault.backoff"):
+                        await self.resilience.backoff(attempt)
+                    continue
+            else:
+                breaker.record_success()
+
+            return response
+
+    def getStats(self) -> Dict[str, Any]:
+        """Inherits docstring from _ApiClient."""
+        return {
+            "circuit_breakers": self.resilience.states(),
+            "admission": self.admission.stats(),
+            "connection_pool": self.pool.stats()
+        }
+
+    @instrumented
+    async def getCollectionDetails(self, collection_name: str):
+        """Inherits docstring from _ApiClient."""
+        url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}"
+        response = await self._send("getCollectionDetails", "get", url)
 
         if response.status_code == 200:
-            return response.json()
+            return self._decode(response)
         else:
             raise response.raise_for_status()
 
+    @instrumented
     async def countCollection(self, collection_name: str):
         """Inherits docstring from _ApiClient."""
         url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}/documents/count"
-        headers = {
-            'accept': 'application/json',
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json={})
+        response = await self._send("countCollection", "post", url, payload={})
 
         if response.status_code == 200:
-            return response.json()
+            return self._decode(response)
         else:
             response.raise_for_status()
 
+    @instrumented
     async def createCollection(self, collection_name: str, collection_schema: Any) -> bool:
         """Inherits docstring from _ApiClient."""
         url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}"
-        headers = {
-            'accept': 'application/json',
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, headers=headers, json=collection_schema)
+        response = await self._send("createCollection", "put", url, payload=collection_schema)
 
         if response.status_code == 200:
             return True
         else:
             response.raise_for_status()
 
+    @instrumented
     async def deleteCollection(self, collection_name: str) -> bool:
         """Inherits docstring from _ApiClient."""
         url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}"
-        headers = {
-            'accept': 'application/json',
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        response = await self._send("deleteCollection", "delete", url)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=headers)
+        if response.status_code == 200:
+            return True
+        else:
+            response.raise_for_status()
+
+    @instrumented
+    async def createIndex(self, collection_name: str, fields: List[str], is_unique: bool = False) -> bool:
+        """Inherits docstring from _ApiClient."""
+        url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}/index"
+        response = await self._send("createIndex", "put", url, payload={"fields": fields, "isUnique": is_unique})
 
         if response.status_code == 200:
             return True
         else:
             response.raise_for_status()
 
-    async def getData(self, collection_name: str, page: int, count: int):
+    @instrumented
+    async def getData(self, collection_name: str, page: int, count: int,
+                      search_id: Optional[str] = None, keep_open: bool = False,
+                      query: Optional[Dict[str, Any]] = None):
         """Inherits docstring from _ApiClient."""
         url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}/documents/search"
         payload = {
             "page": page,
             "perPage": count
         }
-        headers = {
-            'accept': 'application/json',
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload)
+        if search_id:
+            payload["searchId"] = search_id
+        if keep_open:
+            payload["keepOpen"] = True
+        if query:
+            payload["query"] = query
+        response = await self._send("getData", "post", url, payload=payload)
 
         if response.status_code == 200:
-            return response.json()
+            return self._decode(response)
         else:
             response.raise_for_status()
 
+    def iterDocuments(self, collection_name: str, page_size: int = 100, concurrency: int = 4,
+                      adaptive: bool = False) -> AsyncIterator[Dict]:
+        """Inherits docstring from _ApiClient."""
+
+        def fetch_page(page: int, count: int, search_id: Optional[str], keep_open: bool):
+            return self.getData(collection_name, page, count, search_id=search_id, keep_open=keep_open)
+
+        return iter_documents(fetch_page, page_size, concurrency, adaptive)
+
+    @instrumented
     async def setData(self, collection_name: str, data: Dict):
         """Inherits docstring from _ApiClient."""
         url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}/document"
-        headers = {
-            'accept': 'application/json',
-            'X-API-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, headers=headers, json=data)
+        response = await self._send("setData", "put", url, payload=data)
 
         if response.status_code == 200:
-            return response.json()
+            return self._decode(response)
         else:
             response.raise_for_status()
+
+    @instrumented
+    async def setDataBulk(self, collection_name: str, documents: List[Dict],
+                          chunk_size: int = 100, max_chunk_bytes: int = 1048576,
+                          concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Inherits docstring from _ApiClient."""
+        url = f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}/documents"
+
+        async def insert(chunk: List[Dict]):
+            response = await self._send("setDataBulk", "put", url, payload={"documents": chunk})
+
+            if response.status_code == 200:
+                return self._decode(response)
+            else:
+                response.raise_for_status()
+
+        chunks = chunk_documents(documents, chunk_size, max_chunk_bytes)
+        return await run_chunks(chunks, insert, concurrency)
@@ -1,111 +1,153 @@
-import asyncio
-from typing import Any
+import httpx
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from ._api_client import _ApiClient
+from ._bulk import chunk_documents, run_chunks
+from ._instrumentation import instrumented
+from ._pagination import iter_documents
+from .sandbox import FaultInjector, LatencyModel, SandboxError, SandboxStore
 
 class _SandboxClient(_ApiClient):
     """
     Concrete (sandboxed) implementation of the _ApiClient abstract base class.
+
+    Documents live in an in-memory `SandboxStore`, so writes are visible to
+    the following reads and unique indexes are enforced. Every call waits for
+    a delay drawn from a `LatencyModel` and may fail through a `FaultInjector`;
+    store errors are raised as `httpx.HTTPStatusError`, like the vault does.
     """
 
-    def __init__(self, ledger: str, base_url: str, api_key: str):
-        """Inherits docstring from _ApiClient."""
+    def __init__(self, ledger: str, base_url: str, api_key: str, store: Optional[SandboxStore] = None,
+                 latency: Optional[LatencyModel] = None, faults: Optional[FaultInjector] = None):
+        """
+        Inherits docstring from _ApiClient.
+
+        Args:
+            store (SandboxStore, optional): The document store. A store seeded with
+                sample accounts is created when omitted.
+            latency (LatencyModel, optional): The simulated latency. Defaults to a fixed 0.1s.
+            faults (FaultInjector, optional): The injected failures. Defaults to none.
+        """
         super().__init__(ledger, base_url, api_key)
+        self.store = store if store is not None else SandboxStore()
+        self.latency = latency if latency is not None else LatencyModel()
+        self.faults = faults if faults is not None else FaultInjector()
+
+    async def _call(self, operation: str, method: str, url: str, action: Callable[[], Any]) -> Any:
+        """
+        Simulate a vault call: wait, maybe fail, then run `action` on the store.
+
+        Args:
+            operation (str): The client method name.
+            method (str): The HTTP method of the simulated request.
+            url (str): The URL of the simulated request.
+            action (Callable): The store operation.
+
+        Returns:
+            Any: The result of `action`.
+
+        Raises:
+            httpx.HTTPStatusError: If the store rejects the call or an error is injected.
+            httpx.ReadTimeout: If a timeout is injected.
+        """
+        await self.latency.wait()
+        request = httpx.Request(method, url)
+        self.faults.inject(operation, request)
+
+        try:
+            return action()
+        except SandboxError as e:
+            response = httpx.Response(e.status_code, request=request)
+            raise httpx.HTTPStatusError(e.message, request=request, response=response)
+
+    def _url(self, collection_name: str, path: str = "") -> str:
+        return f"{self.base_url}/ledger/{self.ledger}/collection/{collection_name}{path}"
+
+    def getStats(self) -> Dict[str, Any]:
+        """Inherits docstring from _ApiClient."""
+        return {"sandbox": self.faults.stats()}
 
+    @instrumented
     async def getCollectionDetails(self, collection_name: str):
         """Inherits docstring from _ApiClient."""
-        # Simulate a delay for asynchronous behavior
-        await asyncio.sleep(0.1)
-
-        # Standard account collection, with unique account_number
-        response = {
-            "fields": [
-                {"name": "_id", "type": "STRING"},
-                {"name": "_vault_md.ts", "type": "INTEGER"},
-                {"name": "account_number", "type": "INTEGER"},
-                {"name": "account_name", "type": "STRING"},
-                {"name": "iban", "type": "STRING"},
-                {"name": "address", "type": "STRING"},
-                {"name": "amount", "type": "INTEGER"},
-                {"name": "type", "type": "STRING"}
-            ],
-            "idFieldName": "_id",
-            "indexes": [
-                {"fields": ["_id"], "isUnique": True},
-                {"fields": ["_vault_md.ts"], "isUnique": False},
-                {"fields": ["account_number"], "isUnique": True}
-            ],
-            "name": "test"
-        }
-        return response
+        return await self._call(
+            "getCollectionDetails", "GET", self._url(collection_name),
+            lambda: self.store.collection_details(collection_name)
+        )
 
+    @instrumented
     async def countCollection(self, collection_name: str):
         """Inherits docstring from _ApiClient."""
-        await asyncio.sleep(0.1)
-
-        response = {"collection": "test", "count": 2}
-        return response
+        return await self._call(
+            "countCollection", "POST", self._url(collection_name, "/documents/count"),
+            lambda: self.store.count(collection_name)
+        )
 
+    @instrumented
     async def createCollection(self, collection_name: str, collection_schema: Any) -> bool:
         """Inherits docstring from _ApiClient."""
-        await asyncio.sleep(0.1)
+        await self._call(
+            "createCollection", "PUT", self._url(collection_name),
+            lambda: self.store.create_collection(collection_name, collection_schema)
+        )
         return True
 
+    @instrumented
     async def deleteCollection(self, collection_name: str) -> bool:
         """Inherits docstring from _ApiClient."""
-        await asyncio.sleep(0.1)
+        await self._call(
+            "deleteCollection", "DELETE", self._url(collection_name),
+            lambda: self.store.delete_collection(collection_name)
+        )
+        return True
+
+    @instrumented
+    async def createIndex(self, collection_name: str, fields: List[str], is_unique: bool = False) -> bool:
+        """Inherits docstring from _ApiClient."""
+        await self._call(
+            "createIndex", "PUT", self._url(collection_name, "/index"),
+            lambda: self.store.create_index(collection_name, {"fields": fields, "isUnique": is_unique})
+        )
         return True
 
-    async def getData(self, collection_name: str, page: int, count: int):
+    @instrumented
+    async def getData(self, collection_name: str, page: int, count: int,
+                      search_id: Optional[str] = None, keep_open: bool = False,
+                      query: Optional[Dict[str, Any]] = None):
+        """Inherits docstring from _ApiClient."""
+        return await self._call(
+            "getData", "POST", self._url(collection_name, "/documents/search"),
+            lambda: self.store.search(collection_name, page, count, search_id=search_id,
+                                      keep_open=keep_open, query=query)
+        )
+
+    def iterDocuments(self, collection_name: str, page_size: int = 100, concurrency: int = 4,
+                      adaptive: bool = False) -> AsyncIterator[Dict]:
         """Inherits docstring from _ApiClient."""
-        await asyncio.sleep(0.1)
-
-        # Sample account records
-        response = {
-            "page": 1,
-            "perPage": 100,
-            "revisions": [
-                {
-                    "document": {
-                        "_id": "66fae08a000000000000002053d8d0a5",
-                        "_vault_md": {
-                            "creator": "a:b595b399-3f5e-4a86-a76e-d1883b4fa3ee",
-                            "ts": 1727717514
-                        },
-                        "account_name": "Test Name",
-                        "account_number": 1234,
-                        "address": "Test Address 2",
-                        "amount": 10,
-                        "iban": "IT123456978213456789",
-                        "type": "sending"
-                    },
-                    "revision": "",
-                    "transactionId": ""
-                },
-                {
-                    "document": {
-                        "_id": "66faee65000000000000002153d8d0a7",
-                        "_vault_md": {
-                            "creator": "a:b595b399-3f5e-4a86-a76e-d1883b4fa3ee",
-                            "ts": 1727721061
-                        },
-                        "account_name": "Test Name",
-                        "account_number": 12345,
-                        "address": "Test Address 2",
-                        "amount": 10,
-                        "iban": "IT123456978213456789",
-                        "type": "sending"
-                    },
-                    "revision": "",
-                    "transactionId": ""
-                }
-            ],
-            "searchId": ""
-        }
-        return response
 
+        def fetch_page(page: int, count: int, search_id: Optional[str], keep_open: bool):
+            return self.getData(collection_name, page, count, search_id=search_id, keep_open=keep_open)
+
+        return iter_documents(fetch_page, page_size, concurrency, adaptive)
+
+    @instrumented
     async def setData(self, collection_name: str, data: Any):
         """Inherits docstring from _ApiClient."""
-        await asyncio.sleep(0.1)
+        return await self._call(
+            "setData", "PUT", self._url(collection_name, "/document"),
+            lambda: self.store.insert(collection_name, data)
+        )
+
+    @instrumented
+    async def setDataBulk(self, collection_name: str, documents: List[Dict],
+                          chunk_size: int = 100, max_chunk_bytes: int = 1048576,
+                          concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Inherits docstring from _ApiClient."""
+
+        async def insert(chunk: List[Dict]):
+            return await self._call(
+                "setDataBulk", "PUT", self._url(collection_name, "/documents"),
+                lambda: self.store.insert_many(collection_name, chunk)
+            )
 
-        response = {"documentId": "66fbb6f5000000000000002353d8d0af", "transactionId": "36"}
-        return response
+        chunks = chunk_documents(documents, chunk_size, max_chunk_bytes)
+        return await run_chunks(chunks, insert, concurrency)
@@ -0,0 +1,238 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from .resilience import VaultUnavailableError
+
+class AdmissionTimeoutError(VaultUnavailableError):
+    """Raised when a vault call waited in the admission queue past its deadline."""
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header value.
+
+    Args:
+        value (Optional[str]): The header value, in seconds or as an HTTP date.
+
+    Returns:
+        Optional[float]: The delay in seconds, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    """
+    Token bucket rate limiter with reservations and an optional pause.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        burst (int): Maximum tokens the bucket can hold.
+        paused_until (float): Monotonic time before which no token is granted.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            burst (int): Maximum tokens the bucket can hold.
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.paused_until = 0.0
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """
+        Reserve a token if it becomes available within `max_wait` seconds.
+
+        Args:
+            max_wait (float): Maximum acceptable wait, in seconds.
+
+        Returns:
+            Optional[float]: The seconds to wait before using the token, or None
+            if the token would not be available in time (nothing is reserved).
+        """
+        now = time.monotonic()
+        self._refill(now)
+
+        wait = max(0.0, -(self._tokens - 1) / self.rate, self.paused_until - now)
+        if wait > max_wait:
+            return None
+
+        self._tokens -= 1
+        return wait
+
+    def pause(self, seconds: float):
+        """
+        Grant no token for the next `seconds` seconds.
+
+        Args:
+            seconds (float): The pause duration.
+        """
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+class AdmissionController:
+    """
+    Outbound admission layer in front of the vault.
+
+    Every call must obtain a rate limit token and a slot under both the global
+    and the per-operation concurrency caps. Calls that cannot be admitted
+    within `queue_timeout` seconds fail with AdmissionTimeoutError instead of
+    piling up. `throttle()` pauses admissions, e.g. after a 429 from the vault.
+
+    Attributes:
+        max_concurrency (int): Maximum vault calls in flight.
+        operation_limits (Dict[str, int]): Maximum calls in flight per operation.
+        queue_timeout (float): Maximum seconds a call waits to be admitted.
+        bucket (Optional[TokenBucket]): The rate limiter, None when the rate is unlimited.
+    """
+
+    def __init__(self, max_concurrency: int = 50, operation_limits: Optional[Dict[str, int]] = None,
+                 rate: float = 0.0, burst: int = 20, queue_timeout: float = 5.0):
+        """
+        Initializes the controller.
+
+        Args:
+            max_concurrency (int, optional): Maximum vault calls in flight. Defaults to 50.
+            operation_limits (Dict[str, int], optional): Maximum calls in flight per operation. Defaults to None.
+            rate (float, optional): Calls per second allowed, 0 for unlimited. Defaults to 0.0.
+            burst (int, optional): Calls allowed in a burst above the rate. Defaults to 20.
+            queue_timeout (float, optional): Maximum seconds a call waits to be admitted. Defaults to 5.0.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.operation_limits = operation_limits or {}
+        self.queue_timeout = queue_timeout
+        self.bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self._paused_until = 0.0
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._operations = {
+            operation: asyncio.Semaphore(max(1, limit)) for operation, limit in self.operation_limits.items()
+        }
+
+        self.queued = 0
+        self.max_queued = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def throttle(self, seconds: float):
+        """
+        Pause every admission for `seconds` seconds.
+
+        Args:
+            seconds (float): The pause duration, e.g. from a `Retry-After` header.
+        """
+        self.throttled += 1
+        if self.bucket is not None:
+            self.bucket.pause(seconds)
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def _wait_for_token(self, deadline: float):
+        now = time.monotonic()
+        if self.bucket is not None:
+            wait = self.bucket.reserve(deadline - now)
+        else:
+            wait = max(0.0, self._paused_until - now)
+            if wait > deadline - now:
+                wait = None
+
+        if wait is None:
+            raise AdmissionTimeoutError("Vault: too many pending requests, try again later.")
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _acquire(self, semaphore: asyncio.Semaphore, deadline: float):
+        try:
+            await asyncio.wait_for(semaphore.acquire(), max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            raise AdmissionTimeoutError("Vault: too many pending requests, try again later.")
+
+    @asynccontextmanager
+    async def admit(self, operation: str):
+        """
+        Wait until a call of `operation` may be sent to the vault.
+
+        Args:
+            operation (str): The client method name.
+
+        Raises:
+            AdmissionTimeoutError: If the call could not be admitted within `queue_timeout`.
+        """
+        started = time.monotonic()
+        deadline = started + self.queue_timeout
+        operation_semaphore = self._operations.get(operation)
+        acquired = []
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await self._wait_for_token(deadline)
+            # Per-operation slot first, so a capped operation never holds a global slot while queued
+            if operation_semaphore is not None:
+                await self._acquire(operation_semaphore, deadline)
+                acquired.append(operation_semaphore)
+            await self._acquire(self._global, deadline)
+            acquired.append(self._global)
+
+        except BaseException:
+            self.rejected += 1
+            for semaphore in acquired:
+                semaphore.release()
+            raise
+
+        finally:
+            self.queued -= 1
+
+        wait = time.monotonic() - started
+        self.admitted += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.in_flight += 1
+
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            for semaphore in acquired:
+                semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the admission counters, for monitoring.
+
+        Returns:
+            Dict[str, Any]: Queue depth, in-flight calls and wait times.
+        """
+        return {
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "in_flight": self.in_flight,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "average_wait": self.total_wait / self.admitted if self.admitted else 0.0,
+            "max_wait": self.max_wait
+        }
@@ -1,15 +1,26 @@
+from typing import Optional
 from ._production_client import _ProductionClient
 from ._sandbox_client import _SandboxClient
 from ._api_client import _ApiClient
+from .admission import AdmissionController
+from .connection_pool import ConnectionPool
+from .resilience import ResiliencePolicy
+from .sandbox import FaultInjector, LatencyModel, SandboxStore
 
 class Client:
     _instance: _ApiClient = None
 
-    def __new__(cls, ledger: str, base_url: str, api_key: str, sandbox: bool = False) -> _ApiClient:
+    def __new__(cls, ledger: str, base_url: str, api_key: str, sandbox: bool = False,
+                pool: Optional[ConnectionPool] = None,
+                resilience: Optional[ResiliencePolicy] = None,
+                admission: Optional[AdmissionController] = None,
+                store: Optional[SandboxStore] = None,
+                latency: Optional[LatencyModel] = None,
+                faults: Optional[FaultInjector] = None) -> _ApiClient:
 
         if sandbox:
-            cls._instance = _SandboxClient(ledger, base_url, api_key)
+            cls._instance = _SandboxClient(ledger, base_url, api_key, store, latency, faults)
         else:
-            cls._instance = _ProductionClient(ledger, base_url, api_key)
+            cls._instance = _ProductionClient(ledger, base_url, api_key, pool, resilience, admission)
 
-        return cls._instance
\ No newline at end of file
+        return cls._instance
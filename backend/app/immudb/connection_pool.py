@@ -0,0 +1,142 @@
+import importlib.util
+import logging
+from typing import Any, Dict, Optional
+import httpx
+
+logger = logging.getLogger(__name__)
+
+class ConnectionPool:
+    """
+    Long-lived HTTP connection pool shared by every call of a vault client.
+
+    The pool owns a single `httpx.AsyncClient`, so TCP and TLS connections are
+    kept alive and reused across requests instead of being re-established for
+    each vault call. The underlying client is created on `open()` (or lazily on
+    first use) and released on `close()`.
+
+    Attributes:
+        max_connections (int): Maximum number of concurrent connections.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive.
+        keepalive_expiry (float): Seconds an idle connection is kept before being closed.
+        http2 (bool): Whether HTTP/2 is enabled (requires the optional `h2` package).
+        connect_timeout (float): Seconds allowed to establish a connection.
+        timeout (float): Default seconds allowed for a vault operation.
+        operation_timeouts (Dict[str, float]): Per-operation overrides of `timeout`,
+            keyed by client method name (e.g. "setData").
+        transport (Optional[httpx.AsyncBaseTransport]): Custom transport, e.g. an
+            `httpx.ASGITransport` serving the fake vault in-process.
+    """
+
+    def __init__(self,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 30.0,
+                 http2: bool = False,
+                 connect_timeout: float = 5.0,
+                 timeout: float = 10.0,
+                 operation_timeouts: Optional[Dict[str, float]] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initializes the pool configuration. No connection is opened here.
+
+        Args:
+            max_connections (int, optional): Maximum number of concurrent connections. Defaults to 100.
+            max_keepalive_connections (int, optional): Maximum number of idle keep-alive connections. Defaults to 20.
+            keepalive_expiry (float, optional): Idle connection lifetime in seconds. Defaults to 30.0.
+            http2 (bool, optional): Enable HTTP/2 when the `h2` package is installed. Defaults to False.
+            connect_timeout (float, optional): Connection timeout in seconds. Defaults to 5.0.
+            timeout (float, optional): Default operation timeout in seconds. Defaults to 10.0.
+            operation_timeouts (Dict[str, float], optional): Per-operation timeout overrides. Defaults to None.
+            transport (httpx.AsyncBaseTransport, optional): Custom transport. Defaults to None (network).
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
+        self.operation_timeouts = operation_timeouts or {}
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the underlying HTTP client is currently open."""
+        return self._client is not None and not self._client.is_closed
+
+    async def open(self) -> httpx.AsyncClient:
+        """
+        Open the pool, creating the shared HTTP client if needed.
+
+        Returns:
+            httpx.AsyncClient: The shared HTTP client.
+        """
+        return self.get_client()
+
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: The shared HTTP client.
+        """
+        if not self.is_open:
+            http2 = self.http2
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1.")
+                http2 = False
+
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                http2=http2,
+                transport=self.transport
+            )
+        return self._client
+
+    def timeout_for(self, operation: str) -> httpx.Timeout:
+        """
+        Return the timeout to apply to a given operation.
+
+        Args:
+            operation (str): The client method name (e.g. "getData").
+
+        Returns:
+            httpx.Timeout: The operation timeout, or the pool default.
+        """
+        return httpx.Timeout(
+            self.operation_timeouts.get(operation, self.timeout),
+            connect=self.connect_timeout
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the usage of the pooled connections, for monitoring.
+
+        Returns:
+            Dict[str, Any]: Open, active and idle connections, and the connection limit.
+        """
+        connections = []
+        if self.is_open:
+            # httpx does not expose its connection pool: read it defensively
+            pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "open": self.is_open,
+            "connections": len(connections),
+            "active": len(connections) - idle,
+            "idle": idle,
+            "max_connections": self.max_connections
+        }
+
+    async def close(self):
+        """Close every pooled connection. The pool can be reopened afterwards."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
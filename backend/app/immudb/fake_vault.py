@@ -0,0 +1,196 @@
+"""
+Standalone fake of the immudb Vault REST API, for end-to-end tests and benchmarks.
+
+The fake serves the endpoints used by `_ProductionClient` on top of an
+in-memory `SandboxStore`, with simulated latency, injected failures and
+throttling, so the production client (connection pool, timeouts, retries,
+serialization) can be exercised over real sockets without any network.
+
+Usage, from the backend directory:
+
+    python -m app.immudb.fake_vault --port 8181 --documents 10000 --latency 0.005 \\
+        --error-rate 0.01 --rate-limit 500
+
+then point the backend to it with `IMMUD_DB_URL=http://127.0.0.1:8181`.
+"""
+
+import argparse
+import asyncio
+import random
+from typing import Dict, List, Optional
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import ClientDisconnect, Request
+from starlette.responses import Response
+from starlette.routing import Route
+from app import json_backend
+from .admission import TokenBucket
+from .sandbox import FaultInjector, LatencyModel, SandboxError, SandboxStore
+
+COLLECTION_PATH = "/ledger/{ledger}/collection/{collection}"
+
+def generate_accounts(count: int, seed: Optional[int] = None) -> List[Dict]:
+    """
+    Generate valid account documents.
+
+    Args:
+        count (int): The number of accounts.
+        seed (int, optional): Seed of the random generator. Defaults to None.
+
+    Returns:
+        List[Dict]: The documents, with account numbers from 1 to `count`.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "account_number": number,
+            "account_name": f"Account {number}",
+            "iban": f"IT{rng.randint(10, 99)}X{rng.randint(10 ** 21, 10 ** 22 - 1)}",
+            "address": f"Via Roma {number}, Milano",
+            "amount": rng.randint(1, 100000),
+            "type": "sending" if number % 2 else "receiving"
+        }
+        for number in range(1, count + 1)
+    ]
+
+def _json(data, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(json_backend.dumps(data), status_code=status_code, headers=headers,
+                    media_type="application/json")
+
+def create_app(store: Optional[SandboxStore] = None, latency: Optional[LatencyModel] = None,
+               faults: Optional[FaultInjector] = None, rate_limit: float = 0.0, burst: int = 20,
+               api_key: Optional[str] = None, timeout_delay: float = 30.0) -> Starlette:
+    """
+    Build the fake vault ASGI application.
+
+    Args:
+        store (SandboxStore, optional): The document store. Defaults to a seeded store.
+        latency (LatencyModel, optional): The simulated latency. Defaults to none.
+        faults (FaultInjector, optional): The injected failures. Defaults to none.
+        rate_limit (float, optional): Requests per second served before answering 429,
+            0 for unlimited. Defaults to 0.0.
+        burst (int, optional): Requests allowed in a burst above the rate. Defaults to 20.
+        api_key (str, optional): The expected `X-API-Key`, None to accept any. Defaults to None.
+        timeout_delay (float, optional): Seconds an injected timeout holds the request,
+            so the client read timeout fires. Defaults to 30.0.
+
+    Returns:
+        Starlette: The application. Its `state.stats` counts the requests per operation and status.
+    """
+    store = store if store is not None else SandboxStore()
+    latency = latency if latency is not None else LatencyModel(distribution="none")
+    faults = faults if faults is not None else FaultInjector()
+    bucket = TokenBucket(rate_limit, burst) if rate_limit > 0 else None
+    stats: Dict[str, int] = {}
+
+    def endpoint(operation: str, action):
+        async def handle(request: Request) -> Response:
+            response = await serve(operation, request, action)
+            key = f"{operation} {response.status_code}"
+            stats[key] = stats.get(key, 0) + 1
+            return response
+
+        return handle
+
+    async def serve(operation: str, request: Request, action) -> Response:
+        if api_key is not None and request.headers.get("X-API-Key") != api_key:
+            return _json({"error": "Invalid API key"}, 403)
+
+        if bucket is not None and bucket.reserve(0) is None:
+            retry_after = max(0.001, 1 / rate_limit)
+            return _json({"error": "Too many requests"}, 429, {"Retry-After": f"{retry_after:.3f}"})
+
+        try:
+            body = await request.body()
+        except ClientDisconnect:
+            # The client gave up (e.g. a cancelled prefetch): nobody reads the response
+            return Response(status_code=499)
+
+        await latency.wait()
+        try:
+            faults.inject(operation, httpx.Request(request.method, str(request.url)))
+        except httpx.HTTPStatusError as e:
+            return _json({"error": str(e)}, e.response.status_code)
+        except httpx.TimeoutException:
+            await asyncio.sleep(timeout_delay)
+            return _json({"error": "Injected timeout"}, 504)
+
+        try:
+            payload = json_backend.loads(body) if body else {}
+        except ValueError:
+            return _json({"error": "Invalid JSON body"}, 400)
+
+        try:
+            return _json(action(request.path_params["collection"], payload))
+        except SandboxError as e:
+            return _json({"error": e.message}, e.status_code)
+
+    def search(collection: str, payload: Dict) -> Dict:
+        return store.search(
+            collection,
+            payload.get("page", 1),
+            payload.get("perPage", 100),
+            search_id=payload.get("searchId") or None,
+            keep_open=payload.get("keepOpen", False),
+            query=payload.get("query")
+        )
+
+    def create(collection: str, payload: Dict) -> Dict:
+        store.create_collection(collection, payload)
+        return {}
+
+    def delete(collection: str, payload: Dict) -> Dict:
+        store.delete_collection(collection)
+        return {}
+
+    def create_index(collection: str, payload: Dict) -> Dict:
+        store.create_index(collection, payload)
+        return {}
+
+    routes = [
+        Route(COLLECTION_PATH, endpoint("getCollectionDetails", lambda c, p: store.collection_details(c)), methods=["GET"]),
+        Route(COLLECTION_PATH, endpoint("createCollection", create), methods=["PUT"]),
+        Route(COLLECTION_PATH, endpoint("deleteCollection", delete), methods=["DELETE"]),
+        Route(COLLECTION_PATH + "/index", endpoint("createIndex", create_index), methods=["PUT"]),
+        Route(COLLECTION_PATH + "/documents/count", endpoint("countCollection", lambda c, p: store.count(c)), methods=["POST"]),
+        Route(COLLECTION_PATH + "/documents/search", endpoint("getData", search), methods=["POST"]),
+        Route(COLLECTION_PATH + "/document", endpoint("setData", store.insert), methods=["PUT"]),
+        Route(COLLECTION_PATH + "/documents", endpoint("setDataBulk", lambda c, p: store.insert_many(c, p.get("documents", []))), methods=["PUT"]),
+    ]
+
+    app = Starlette(routes=routes)
+    app.state.store = store
+    app.state.stats = stats
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake immudb Vault REST API.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8181, help="Port to bind")
+    parser.add_argument("--documents", type=int, default=1000, help="Accounts seeded in every collection")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean latency per request, in seconds")
+    parser.add_argument("--distribution", default="fixed", choices=LatencyModel.DISTRIBUTIONS, help="Latency distribution")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Latency spread (uniform) or sigma (lognormal)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an HTTP error")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of injected errors")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Probability of a hanging request")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second before answering 429 (0 is unlimited)")
+    parser.add_argument("--burst", type=int, default=20, help="Requests allowed in a burst above the rate limit")
+    parser.add_argument("--api-key", default=None, help="Expected X-API-Key (any key is accepted when omitted)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the data, latency and failure draws")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(
+        store=SandboxStore(seed_documents=generate_accounts(args.documents, args.seed)),
+        latency=LatencyModel(args.latency, args.distribution, args.jitter, args.seed),
+        faults=FaultInjector(args.error_rate, args.error_status, args.timeout_rate, seed=args.seed),
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        api_key=args.api_key
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
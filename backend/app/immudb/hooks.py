@@ -0,0 +1,83 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+import httpx
+from .resilience import VaultUnavailableError
+
+_current_call: ContextVar[Optional["VaultCall"]] = ContextVar("current_vault_call", default=None)
+
+class VaultCall:
+    """
+    One call of a vault client method, as seen by the client hooks.
+
+    Implementations fill in what they know while the call runs (the production
+    client records the payload sizes, the HTTP status and the attempts).
+
+    Attributes:
+        operation (str): The client method name.
+        started_at (float): Monotonic start time (`time.perf_counter()`).
+        duration (Optional[float]): Seconds spent in the call, set when it ends.
+        outcome (Optional[str]): success, error (HTTP error), rejected (circuit
+            breaker or admission queue), unreachable or exception.
+        status (Optional[int]): The last HTTP status received.
+        request_bytes (int): Bytes of request bodies sent.
+        response_bytes (int): Bytes of response bodies parsed.
+        attempts (int): HTTP requests sent, retries included.
+    """
+
+    __slots__ = ("operation", "started_at", "duration", "outcome", "status",
+                 "request_bytes", "response_bytes", "attempts")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.started_at = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.outcome: Optional[str] = None
+        self.status: Optional[int] = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.attempts = 0
+
+    def finish(self, error: Optional[BaseException] = None):
+        """
+        Set the duration and the outcome of the call.
+
+        Args:
+            error (BaseException, optional): The exception raised by the call, if any.
+        """
+        self.duration = time.perf_counter() - self.started_at
+        if error is None:
+            self.outcome = "success"
+            if self.status is None:
+                self.status = 200
+        elif isinstance(error, httpx.HTTPStatusError):
+            self.outcome = "error"
+            self.status = error.response.status_code
+        elif isinstance(error, VaultUnavailableError):
+            self.outcome = "rejected"
+        elif isinstance(error, httpx.RequestError):
+            self.outcome = "unreachable"
+        else:
+            self.outcome = "exception"
+
+def current_call() -> Optional[VaultCall]:
+    """Return the vault call running in the current context, if any."""
+    return _current_call.get()
+
+class ClientHook:
+    """
+    Callbacks run around every vault client call.
+
+    Subclasses override the callbacks they need; hooks are added with
+    `_ApiClient.add_hook()`. Exceptions raised by a hook are logged and never
+    affect the call.
+    """
+
+    def before_call(self, call: VaultCall):
+        """Called before the call starts."""
+
+    def after_call(self, call: VaultCall):
+        """Called after a successful call, with its duration and outcome set."""
+
+    def on_error(self, call: VaultCall, error: BaseException):
+        """Called after a failed call, with its duration and outcome set, before `error` propagates."""
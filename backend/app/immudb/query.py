@@ -0,0 +1,132 @@
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# Comparison operators of the vault search queries
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "EQ": lambda field, value: field == value,
+    "NE": lambda field, value: field != value,
+    "LT": lambda field, value: field < value,
+    "LE": lambda field, value: field <= value,
+    "GT": lambda field, value: field > value,
+    "GE": lambda field, value: field >= value,
+    "LIKE": lambda field, value: re.search(value, field) is not None,
+    "NOT_LIKE": lambda field, value: re.search(value, field) is None
+}
+
+def field_comparison(field: str, operator: str, value: Any) -> Dict[str, Any]:
+    """
+    Build one field comparison of a vault search query.
+
+    Args:
+        field (str): The compared field, dotted for nested fields (e.g. "_vault_md.ts").
+        operator (str): One of OPERATORS. `LIKE` and `NOT_LIKE` take a regular expression.
+        value (Any): The value compared with the field.
+
+    Returns:
+        Dict[str, Any]: The field comparison.
+    """
+    return {"field": field, "operator": operator, "value": value}
+
+def order_by(field: str, desc: bool = False) -> Dict[str, Any]:
+    """
+    Build one sort key of a vault search query.
+
+    Args:
+        field (str): The sorted field, dotted for nested fields (e.g. "_vault_md.ts").
+        desc (bool, optional): Sort in descending order. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: The sort key, to be listed in the `orderBy` of the query.
+    """
+    return {"field": field, "desc": desc}
+
+def get_field(document: Dict, field: str) -> Any:
+    """
+    Read a possibly nested field of a document.
+
+    Args:
+        document (Dict): The document.
+        field (str): The dotted field name.
+
+    Returns:
+        Any: The field value, None when it is missing.
+    """
+    value: Any = document
+    for part in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def _compare(document: Dict, comparison: Dict[str, Any]) -> bool:
+    operator = OPERATORS.get(comparison.get("operator"))
+    if operator is None:
+        raise ValueError(f"Unknown operator {comparison.get('operator')!r}")
+
+    field = get_field(document, comparison.get("field", ""))
+    value = comparison.get("value")
+    if field is None:
+        return comparison["operator"] in ("NE", "NOT_LIKE")
+    if comparison["operator"] in ("LIKE", "NOT_LIKE"):
+        return operator(str(field), str(value))
+    try:
+        return operator(field, value)
+    except TypeError:
+        raise ValueError(f"Cannot compare {comparison.get('field')!r} with {value!r}")
+
+def matches(document: Dict, query: Optional[Dict[str, Any]]) -> bool:
+    """
+    Evaluate a vault search query on a document, like the vault does.
+
+    The expressions of the query are OR'ed and the field comparisons of an
+    expression are AND'ed. A query without expressions matches every document.
+
+    Args:
+        document (Dict): The document.
+        query (Optional[Dict[str, Any]]): The query, None matches every document.
+
+    Returns:
+        bool: Whether the document matches.
+
+    Raises:
+        ValueError: If the query uses an unknown operator or compares incompatible types.
+    """
+    expressions: List[Dict] = (query or {}).get("expressions") or []
+    if not expressions:
+        return True
+    return any(
+        all(_compare(document, comparison) for comparison in expression.get("fieldComparisons", []))
+        for expression in expressions
+    )
+
+def sort_documents(documents: List[Dict], query: Optional[Dict[str, Any]]) -> List[Dict]:
+    """
+    Sort documents by the `orderBy` keys of a vault search query, like the vault does.
+
+    The first key has the highest priority; documents missing a field sort
+    before the others in ascending order. Ties keep their insertion order.
+
+    Args:
+        documents (List[Dict]): The documents.
+        query (Optional[Dict[str, Any]]): The query, None keeps the insertion order.
+
+    Returns:
+        List[Dict]: The sorted documents.
+
+    Raises:
+        ValueError: If a sorted field holds values of incompatible types.
+    """
+    def sort_key(field: str):
+        def key(document: Dict):
+            value = get_field(document, field)
+            return (False, 0) if value is None else (True, value)
+        return key
+
+    documents = list(documents)
+    for key in reversed((query or {}).get("orderBy") or []):
+        field = key.get("field", "")
+        try:
+            documents.sort(key=sort_key(field), reverse=bool(key.get("desc")))
+        except TypeError:
+            raise ValueError(f"Cannot sort by {field!r}")
+    return documents
@@ -0,0 +1,203 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+import httpx
+
+# Operations that can be retried safely on any transport error or 5xx response
+IDEMPOTENT_OPERATIONS = {"getCollectionDetails", "countCollection", "getData"}
+
+# Transport errors raised before the request reached the vault: safe to retry for any operation
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+RETRYABLE_STATUS_CODES = {500, 502, 503, 504}
+
+class VaultUnavailableError(httpx.RequestError):
+    """Raised when a vault call is refused locally to protect a degraded vault."""
+
+class CircuitOpenError(VaultUnavailableError):
+    """Raised when the circuit breaker of an operation is open."""
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding one vault operation.
+
+    The breaker opens after `failure_threshold` consecutive failures and then
+    fails fast for `reset_timeout` seconds. After that it is half-open: a single
+    probe call is let through, closing the breaker on success or re-opening it
+    on failure. A probe without a verdict (e.g. throttled by the vault) is
+    released, so the next call probes again.
+
+    Attributes:
+        name (str): The guarded operation.
+        failure_threshold (int): Consecutive failures that open the breaker.
+        reset_timeout (float): Seconds the breaker stays open before probing.
+        failures (int): Current number of consecutive failures.
+        opened_at (Optional[float]): Monotonic time the breaker opened, None when closed.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initializes a closed breaker.
+
+        Args:
+            name (str): The guarded operation.
+            failure_threshold (int, optional): Consecutive failures that open the breaker. Defaults to 5.
+            reset_timeout (float, optional): Seconds the breaker stays open before probing. Defaults to 30.0.
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """The current state: closed, open or half_open."""
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_call(self) -> bool:
+        """
+        Check whether a call may proceed.
+
+        Returns:
+            bool: True if the call is the probe of a half-open breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe already running.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return False
+
+        now = time.monotonic()
+        if state == self.HALF_OPEN:
+            if self._probe_started_at is None or now - self._probe_started_at >= self.reset_timeout:
+                self._probe_started_at = now
+                return True
+
+        raise CircuitOpenError(f"Vault: {self.name} is temporarily unavailable (circuit open).")
+
+    def record_success(self):
+        """Record a successful call, closing the breaker."""
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started_at = None
+
+    def record_failure(self):
+        """Record a failed call, opening the breaker past the threshold or after a failed probe."""
+        self.failures += 1
+        self._probe_started_at = None
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def release_probe(self):
+        """Free the probe slot of a half-open breaker without recording an outcome."""
+        self._probe_started_at = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the breaker state for monitoring.
+
+        Returns:
+            Dict[str, Any]: State and consecutive failures of the breaker.
+        """
+        return {"state": self.state, "failures": self.failures}
+
+class ResiliencePolicy:
+    """
+    Retry and circuit breaking policy of a vault client.
+
+    Retries use capped exponential backoff with full jitter. Idempotent reads
+    are retried on transport errors and 5xx responses; other operations only
+    when the request never left the client. Each operation has its own breaker.
+
+    Attributes:
+        max_attempts (int): Maximum attempts per call, including the first one.
+        base_delay (float): Backoff delay of the first retry, in seconds.
+        max_delay (float): Upper bound of the backoff delay, in seconds.
+        failure_threshold (int): Consecutive failures that open a breaker.
+        reset_timeout (float): Seconds a breaker stays open before probing.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.1, max_delay: float = 2.0,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initializes the policy.
+
+        Args:
+            max_attempts (int, optional): Maximum attempts per call. Defaults to 3.
+            base_delay (float, optional): Backoff delay of the first retry, in seconds. Defaults to 0.1.
+            max_delay (float, optional): Upper bound of the backoff delay, in seconds. Defaults to 2.0.
+            failure_threshold (int, optional): Consecutive failures that open a breaker. Defaults to 5.
+            reset_timeout (float, optional): Seconds a breaker stays open before probing. Defaults to 30.0.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, operation: str) -> CircuitBreaker:
+        """
+        Return the breaker of an operation, creating it on first use.
+
+        Args:
+            operation (str): The client method name.
+
+        Returns:
+            CircuitBreaker: The breaker of the operation.
+        """
+        breaker = self._breakers.get(operation)
+        if breaker is None:
+            breaker = CircuitBreaker(operation, self.failure_threshold, self.reset_timeout)
+            self._breakers[operation] = breaker
+        return breaker
+
+    def can_retry(self, operation: str, attempt: int, error: Optional[Exception] = None,
+                  status_code: Optional[int] = None) -> bool:
+        """
+        Whether a failed attempt may be retried.
+
+        Args:
+            operation (str): The client method name.
+            attempt (int): The number of attempts already made.
+            error (Exception, optional): The transport error of the attempt, if any.
+            status_code (int, optional): The HTTP status of the attempt, if any.
+
+        Returns:
+            bool: True if another attempt is allowed.
+        """
+        if attempt >= self.max_attempts or isinstance(error, VaultUnavailableError):
+            return False
+        if error is not None:
+            return operation in IDEMPOTENT_OPERATIONS or isinstance(error, UNSENT_REQUEST_ERRORS)
+        return operation in IDEMPOTENT_OPERATIONS and status_code in RETRYABLE_STATUS_CODES
+
+    async def backoff(self, attempt: int):
+        """
+        Sleep before the next attempt, with capped exponential backoff and full jitter.
+
+        Args:
+            attempt (int): The number of attempts already made.
+        """
+        await asyncio.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))))
+
+    def states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the state of every breaker, for monitoring.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The breaker snapshots, keyed by operation.
+        """
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
@@ -0,0 +1,490 @@
+import asyncio
+import copy
+import itertools
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+import httpx
+from .query import matches, sort_documents
+
+# Collection created on first use when the sandbox store auto-creates collections
+DEFAULT_COLLECTION_SCHEMA = {
+    "fields": [
+        {"name": "account_number", "type": "INTEGER"},
+        {"name": "account_name", "type": "STRING"},
+        {"name": "iban", "type": "STRING"},
+        {"name": "address", "type": "STRING"},
+        {"name": "amount", "type": "INTEGER"},
+        {"name": "type", "type": "STRING"}
+    ],
+    "indexes": [
+        {"fields": ["account_number"], "isUnique": True}
+    ]
+}
+
+# Documents stored in every auto-created collection
+SEED_DOCUMENTS = [
+    {
+        "_id": "66fae08a000000000000002053d8d0a5",
+        "_vault_md": {
+            "creator": "a:b595b399-3f5e-4a86-a76e-d1883b4fa3ee",
+            "ts": 1727717514
+        },
+        "account_name": "Test Name",
+        "account_number": 1234,
+        "address": "Test Address 2",
+        "amount": 10,
+        "iban": "IT123456978213456789",
+        "type": "sending"
+    },
+    {
+        "_id": "66faee65000000000000002153d8d0a7",
+        "_vault_md": {
+            "creator": "a:b595b399-3f5e-4a86-a76e-d1883b4fa3ee",
+            "ts": 1727721061
+        },
+        "account_name": "Test Name",
+        "account_number": 12345,
+        "address": "Test Address 2",
+        "amount": 10,
+        "iban": "IT123456978213456789",
+        "type": "sending"
+    }
+]
+
+# Fields and indexes the vault adds to every collection
+SYSTEM_FIELDS = [{"name": "_id", "type": "STRING"}, {"name": "_vault_md.ts", "type": "INTEGER"}]
+SYSTEM_INDEXES = [{"fields": ["_id"], "isUnique": True}, {"fields": ["_vault_md.ts"], "isUnique": False}]
+
+# Values accepted by the vault field types
+FIELD_TYPES = {
+    "INTEGER": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "DOUBLE": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "STRING": lambda value: isinstance(value, str),
+    "BOOLEAN": lambda value: isinstance(value, bool)
+}
+
+class SandboxError(Exception):
+    """
+    Error returned by the sandbox store, mirroring a vault HTTP error.
+
+    Attributes:
+        status_code (int): The HTTP status the vault would return.
+        message (str): The error description.
+    """
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+class LatencyModel:
+    """
+    Simulated latency of a vault call.
+
+    Distributions:
+        none: no delay.
+        fixed: always `mean` seconds.
+        uniform: uniform between `mean * (1 - jitter)` and `mean * (1 + jitter)`.
+        exponential: exponential with the given mean.
+        lognormal: log-normal with the given mean and `jitter` as sigma, for long tails.
+
+    Attributes:
+        mean (float): The mean delay, in seconds.
+        distribution (str): The distribution name.
+        jitter (float): The spread of the uniform and lognormal distributions.
+    """
+
+    DISTRIBUTIONS = ("none", "fixed", "uniform", "exponential", "lognormal")
+
+    def __init__(self, mean: float = 0.1, distribution: str = "fixed", jitter: float = 0.5,
+                 seed: Optional[int] = None):
+        """
+        Initializes the model.
+
+        Args:
+            mean (float, optional): The mean delay, in seconds. Defaults to 0.1.
+            distribution (str, optional): One of DISTRIBUTIONS. Defaults to "fixed".
+            jitter (float, optional): The spread of the uniform and lognormal distributions. Defaults to 0.5.
+            seed (int, optional): Seed of the random generator, for reproducible runs. Defaults to None.
+
+        Raises:
+            ValueError: If the distribution is unknown.
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.mean = max(0.0, mean)
+        self.distribution = distribution
+        self.jitter = max(0.0, jitter)
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        """
+        Draw a delay.
+
+        Returns:
+            float: The delay, in seconds.
+        """
+        if self.distribution == "none" or self.mean == 0:
+            return 0.0
+        if self.distribution == "uniform":
+            spread = min(1.0, self.jitter)
+            return self._random.uniform(self.mean * (1 - spread), self.mean * (1 + spread))
+        if self.distribution == "exponential":
+            return self._random.expovariate(1 / self.mean)
+        if self.distribution == "lognormal":
+            sigma = self.jitter
+            return self._random.lognormvariate(math.log(self.mean) - sigma ** 2 / 2, sigma)
+        return self.mean
+
+    async def wait(self):
+        """Sleep for a sampled delay."""
+        delay = self.sample()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class FaultInjector:
+    """
+    Random failures of sandbox vault calls.
+
+    Attributes:
+        error_rate (float): Probability of answering with `error_status`.
+        error_status (int): The HTTP status of injected errors.
+        timeout_rate (float): Probability of raising a read timeout.
+        operations (Optional[Set[str]]): The client methods affected, None for all of them.
+        injected_errors (int): Errors injected so far.
+        injected_timeouts (int): Timeouts injected so far.
+    """
+
+    def __init__(self, error_rate: float = 0.0, error_status: int = 503, timeout_rate: float = 0.0,
+                 operations: Optional[Set[str]] = None, seed: Optional[int] = None):
+        """
+        Initializes the injector.
+
+        Args:
+            error_rate (float, optional): Probability of an HTTP error. Defaults to 0.0.
+            error_status (int, optional): The HTTP status of injected errors. Defaults to 503.
+            timeout_rate (float, optional): Probability of a read timeout. Defaults to 0.0.
+            operations (Set[str], optional): The client methods affected. Defaults to None (all).
+            seed (int, optional): Seed of the random generator, for reproducible runs. Defaults to None.
+        """
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.timeout_rate = timeout_rate
+        self.operations = set(operations) if operations else None
+        self.injected_errors = 0
+        self.injected_timeouts = 0
+        self._random = random.Random(seed)
+
+    def inject(self, operation: str, request: httpx.Request):
+        """
+        Fail the call at random, according to the configured rates.
+
+        Args:
+            operation (str): The client method name.
+            request (httpx.Request): The simulated request.
+
+        Raises:
+            httpx.ReadTimeout: When a timeout is injected.
+            httpx.HTTPStatusError: When an error is injected.
+        """
+        if self.operations is not None and operation not in self.operations:
+            return
+
+        draw = self._random.random()
+        if draw < self.timeout_rate:
+            self.injected_timeouts += 1
+            raise httpx.ReadTimeout("Sandbox: injected timeout", request=request)
+        if draw < self.timeout_rate + self.error_rate:
+            self.injected_errors += 1
+            response = httpx.Response(self.error_status, request=request)
+            raise httpx.HTTPStatusError("Sandbox: injected error", request=request, response=response)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the number of injected faults, for monitoring.
+
+        Returns:
+            Dict[str, int]: Injected errors and timeouts.
+        """
+        return {"injected_errors": self.injected_errors, "injected_timeouts": self.injected_timeouts}
+
+class SandboxStore:
+    """
+    In-memory document store behaving like the vault collections API.
+
+    Documents keep their insertion order, values of the wrong field type are
+    rejected with a 400, unique indexes reject duplicates with a 409, every write gets a new transaction ID and searches opened with
+    `keep_open` page over a consistent snapshot until they are evicted.
+
+    Attributes:
+        auto_create (bool): Create (and seed) unknown collections on first use.
+        seed_documents (List[Dict]): The documents stored in auto-created collections.
+        max_open_searches (int): Open searches kept before evicting the oldest.
+    """
+
+    def __init__(self, auto_create: bool = True, seed_documents: Optional[List[Dict]] = None,
+                 max_open_searches: int = 1000):
+        """
+        Initializes an empty store.
+
+        Args:
+            auto_create (bool, optional): Create unknown collections on first use. Defaults to True.
+            seed_documents (List[Dict], optional): The documents stored in auto-created
+                collections. Defaults to SEED_DOCUMENTS.
+            max_open_searches (int, optional): Open searches kept. Defaults to 1000.
+        """
+        self.auto_create = auto_create
+        self.seed_documents = SEED_DOCUMENTS if seed_documents is None else seed_documents
+        self.max_open_searches = max_open_searches
+        self._collections: Dict[str, Dict[str, Any]] = {}
+        self._searches: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        self._transactions = itertools.count(37)
+        self._documents = itertools.count(1)
+
+    def _collection(self, name: str) -> Dict[str, Any]:
+        collection = self._collections.get(name)
+        if collection is None:
+            if not self.auto_create:
+                raise SandboxError(404, f"Collection {name} not found")
+            collection = self.create_collection(name, DEFAULT_COLLECTION_SCHEMA)
+            self._insert(collection, copy.deepcopy(self.seed_documents))
+        return collection
+
+    def _transaction_id(self) -> str:
+        return str(next(self._transactions))
+
+    def _document_id(self) -> str:
+        return f"{int(time.time()):08x}{next(self._documents):016x}{uuid.uuid4().hex[:8]}"
+
+    def _index_keys(self, collection: Dict[str, Any], document: Dict) -> List[tuple]:
+        return [
+            (position, tuple(document.get(field) for field in fields))
+            for position, fields in enumerate(collection["unique"])
+        ]
+
+    def _check_types(self, collection: Dict[str, Any], document: Dict):
+        # Like the vault, coerce integral numbers of INTEGER fields and reject other mismatches
+        for field in collection["fields"]:
+            name = field["name"]
+            value = document.get(name)
+            if value is None or "." in name:
+                continue
+            if field["type"] == "INTEGER" and isinstance(value, float) and value.is_integer():
+                document[name] = int(value)
+            elif not FIELD_TYPES.get(field["type"], lambda value: True)(value):
+                raise SandboxError(400, f"Field {name} must be of type {field['type']}")
+
+    def _insert(self, collection: Dict[str, Any], documents: List[Dict]) -> List[str]:
+        for document in documents:
+            self._check_types(collection, document)
+
+        # Check every unique key first, so a rejected batch leaves the collection untouched
+        pending = set()
+        for document in documents:
+            for key in self._index_keys(collection, document):
+                if key in collection["keys"] or key in pending:
+                    raise SandboxError(409, "Document violates a unique index")
+                pending.add(key)
+
+        document_ids = []
+        for document in documents:
+            document.setdefault("_id", self._document_id())
+            document.setdefault("_vault_md", {"creator": "a:sandbox", "ts": int(time.time())})
+            collection["documents"].append(document)
+            collection["keys"].update(self._index_keys(collection, document))
+            document_ids.append(document["_id"])
+        return document_ids
+
+    def create_collection(self, name: str, schema: Any) -> Dict[str, Any]:
+        """
+        Create a collection.
+
+        Args:
+            name (str): The collection name.
+            schema (Any): The collection schema (`fields` and `indexes`).
+
+        Returns:
+            Dict[str, Any]: The internal collection record.
+
+        Raises:
+            SandboxError: 409 if the collection already exists.
+        """
+        if name in self._collections:
+            raise SandboxError(409, f"Collection {name} already exists")
+
+        schema = schema or {}
+        collection = {
+            "fields": SYSTEM_FIELDS + list(schema.get("fields", [])),
+            "indexes": SYSTEM_INDEXES + list(schema.get("indexes", [])),
+            "unique": [index["fields"] for index in schema.get("indexes", []) if index.get("isUnique")],
+            "documents": [],
+            "keys": set()
+        }
+        self._collections[name] = collection
+        return collection
+
+    def create_index(self, name: str, index: Dict[str, Any]):
+        """
+        Add an index to an existing collection.
+
+        Args:
+            name (str): The collection name.
+            index (Dict[str, Any]): The index (`fields` and `isUnique`).
+
+        Raises:
+            SandboxError: 400 if a field is unknown, 409 if the index already exists
+                or the documents violate a new unique index.
+        """
+        collection = self._collection(name)
+        fields = list(index.get("fields") or [])
+        known = {field["name"] for field in collection["fields"]}
+        if not fields or any(field not in known for field in fields):
+            raise SandboxError(400, f"Invalid index fields: {fields}")
+        if any(existing["fields"] == fields for existing in collection["indexes"]):
+            raise SandboxError(409, f"Index on {fields} already exists")
+
+        is_unique = bool(index.get("isUnique"))
+        if is_unique:
+            values = [tuple(document.get(field) for field in fields) for document in collection["documents"]]
+            if len(set(values)) != len(values):
+                raise SandboxError(409, "Documents violate the unique index")
+            position = len(collection["unique"])
+            collection["unique"].append(fields)
+            collection["keys"].update((position, value) for value in values)
+
+        collection["indexes"].append({"fields": fields, "isUnique": is_unique})
+
+    def delete_collection(self, name: str):
+        """
+        Delete a collection and its documents.
+
+        Args:
+            name (str): The collection name.
+        """
+        self._collection(name)
+        del self._collections[name]
+
+    def collection_details(self, name: str) -> Dict[str, Any]:
+        """
+        Describe a collection like the vault does.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            Dict[str, Any]: The fields, the indexes, the ID field and the name.
+        """
+        collection = self._collection(name)
+        return {
+            "fields": copy.deepcopy(collection["fields"]),
+            "idFieldName": "_id",
+            "indexes": copy.deepcopy(collection["indexes"]),
+            "name": name
+        }
+
+    def count(self, name: str) -> Dict[str, Any]:
+        """
+        Count the documents of a collection.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            Dict[str, Any]: The collection name and its document count.
+        """
+        return {"collection": name, "count": len(self._collection(name)["documents"])}
+
+    def search(self, name: str, page: int, per_page: int, search_id: Optional[str] = None,
+               keep_open: bool = False, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Return a page of the documents matching a query, in insertion order
+        unless the query has an `orderBy`.
+
+        Args:
+            name (str): The collection name.
+            page (int): The page number, starting from 1.
+            per_page (int): The number of documents per page.
+            search_id (str, optional): The ID of an open search to continue; the
+                query of the open search is kept.
+            keep_open (bool, optional): Keep the search open for the following pages.
+            query (Dict[str, Any], optional): The vault search query (see `query.matches`
+                and `query.sort_documents`). Every document matches when omitted.
+
+        Returns:
+            Dict[str, Any]: The page, in the vault search response format.
+
+        Raises:
+            SandboxError: 400 for an invalid page or query, 404 for an unknown or evicted search.
+        """
+        if page < 1 or per_page < 1:
+            raise SandboxError(400, "Invalid page or perPage")
+
+        if search_id:
+            documents = self._searches.get(search_id)
+            if documents is None:
+                raise SandboxError(404, f"Search {search_id} not found")
+            self._searches.move_to_end(search_id)
+        else:
+            try:
+                documents = sort_documents(
+                    [document for document in self._collection(name)["documents"] if matches(document, query)],
+                    query
+                )
+            except ValueError as e:
+                raise SandboxError(400, f"Invalid query: {e}")
+            if keep_open:
+                search_id = uuid.uuid4().hex
+                self._searches[search_id] = documents
+                while len(self._searches) > self.max_open_searches:
+                    self._searches.popitem(last=False)
+
+        start = (page - 1) * per_page
+        return {
+            "page": page,
+            "perPage": per_page,
+            "revisions": [
+                {"document": dict(document), "revision": "", "transactionId": ""}
+                for document in documents[start:start + per_page]
+            ],
+            "searchId": search_id or ""
+        }
+
+    def insert(self, name: str, document: Dict) -> Dict[str, Any]:
+        """
+        Insert one document.
+
+        Args:
+            name (str): The collection name.
+            document (Dict): The document.
+
+        Returns:
+            Dict[str, Any]: The document ID and the transaction ID.
+
+        Raises:
+            SandboxError: 400 if a field has the wrong type, 409 if the document
+                violates a unique index.
+        """
+        document_ids = self._insert(self._collection(name), [dict(document)])
+        return {"documentId": document_ids[0], "transactionId": self._transaction_id()}
+
+    def insert_many(self, name: str, documents: List[Dict]) -> Dict[str, Any]:
+        """
+        Insert documents atomically, in a single transaction.
+
+        Args:
+            name (str): The collection name.
+            documents (List[Dict]): The documents.
+
+        Returns:
+            Dict[str, Any]: The document IDs and the transaction ID.
+
+        Raises:
+            SandboxError: 400 if a field has the wrong type, 409 if a document violates
+                a unique index; nothing is inserted.
+        """
+        document_ids = self._insert(self._collection(name), [dict(document) for document in documents])
+        return {"documentIds": document_ids, "transactionId": self._transaction_id()}
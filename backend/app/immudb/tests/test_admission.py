@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.immudb.admission import AdmissionController, AdmissionTimeoutError, TokenBucket, parse_retry_after
+from app.immudb.client import Client
+
+class TestAdmissionController(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrency_cap_queues_and_times_out(self):
+        controller = AdmissionController(max_concurrency=1, queue_timeout=0.05)
+
+        async with controller.admit("getData"):
+            with self.assertRaises(AdmissionTimeoutError):
+                async with controller.admit("getData"):
+                    pass
+
+        stats = controller.stats()
+        self.assertEqual((stats["admitted"], stats["rejected"], stats["in_flight"]), (1, 1, 0))
+
+    async def test_operation_cap(self):
+        controller = AdmissionController(max_concurrency=10, operation_limits={"setData": 1}, queue_timeout=0.05)
+
+        async with controller.admit("setData"):
+            async with controller.admit("getData"):
+                pass
+            with self.assertRaises(AdmissionTimeoutError):
+                async with controller.admit("setData"):
+                    pass
+
+    async def test_throttle_delays_admission(self):
+        controller = AdmissionController(queue_timeout=1)
+        controller.throttle(0.05)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with controller.admit("getData"):
+            pass
+
+        self.assertGreaterEqual(loop.time() - started, 0.04)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=10, burst=1)
+
+        self.assertEqual(bucket.reserve(0), 0)
+        self.assertIsNone(bucket.reserve(0.01))
+        self.assertAlmostEqual(bucket.reserve(1), 0.1, places=2)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+class TestProductionClientThrottling(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.admission = AdmissionController()
+        self.client = Client("test_ledger", "http://example.com", "test_api_key", False, admission=self.admission)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    @patch('httpx.AsyncClient.put', new_callable=AsyncMock)
+    async def test_429_honors_retry_after(self, mock_put):
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "0.01"})
+        ok = MagicMock(status_code=200)
+        ok.content = b'{"transactionId": "1"}'
+        mock_put.side_effect = [throttled, ok]
+
+        self.assertEqual(await self.client.setData("test", {}), {"transactionId": "1"})
+        self.assertEqual(self.admission.stats()["throttled"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import httpx
+import unittest
+from app.immudb.admission import AdmissionController
+from app.immudb.client import Client
+from app.immudb.connection_pool import ConnectionPool
+from app.immudb.fake_vault import create_app, generate_accounts
+from app.immudb.hooks import ClientHook
+from app.immudb.resilience import ResiliencePolicy
+from app.immudb.sandbox import FaultInjector, SandboxStore
+
+class TestFakeVault(unittest.IsolatedAsyncioTestCase):
+
+    def make_client(self, app, **kwargs):
+        pool = ConnectionPool(transport=httpx.ASGITransport(app=app))
+        client = Client("test_ledger", "http://fake-vault", "test_api_key", False, pool=pool, **kwargs)
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def test_production_client_round_trip(self):
+        app = create_app(store=SandboxStore(seed_documents=generate_accounts(25, seed=1)), api_key="test_api_key")
+        client = self.make_client(app)
+
+        self.assertEqual((await client.countCollection("accounts"))["count"], 25)
+        details = await client.getCollectionDetails("accounts")
+        self.assertIn({"fields": ["account_number"], "isUnique": True}, details["indexes"])
+
+        documents = [document async for document in client.iterDocuments("accounts", page_size=10)]
+        self.assertEqual([document["account_number"] for document in documents], list(range(1, 26)))
+
+        result = await client.setData("accounts", {"account_number": 100})
+        self.assertTrue(result["transactionId"])
+        results = await client.setDataBulk("accounts", [{"account_number": 101}, {"account_number": 1}], chunk_size=1)
+        self.assertEqual([item.get("code") for item in results], [None, 409])
+        self.assertEqual(app.state.stats["setDataBulk 409"], 1)
+
+    async def test_search_query(self):
+        client = self.make_client(create_app(store=SandboxStore(seed_documents=generate_accounts(50, seed=1))))
+        query = {"expressions": [{"fieldComparisons": [{"field": "type", "operator": "EQ", "value": "receiving"}]}]}
+
+        page = await client.getData("accounts", 1, 100, query=query)
+
+        self.assertTrue(page["revisions"])
+        self.assertTrue(all(r["document"]["type"] == "receiving" for r in page["revisions"]))
+        self.assertLess(len(page["revisions"]), 50)
+
+    async def test_client_hooks(self):
+        events = []
+
+        class RecordingHook(ClientHook):
+            def before_call(self, call):
+                events.append(("before", call.operation))
+
+            def after_call(self, call):
+                events.append(("after", call.operation, call.outcome, call.status, call.attempts,
+                               call.request_bytes > 0, call.response_bytes > 0))
+
+            def on_error(self, call, error):
+                events.append(("error", call.operation, call.outcome, call.status))
+
+        app = create_app(api_key="test_api_key")
+        client = self.make_client(app, resilience=ResiliencePolicy(max_attempts=1))
+        client.add_hook(RecordingHook())
+
+        await client.countCollection("accounts")
+        with self.assertRaises(httpx.HTTPStatusError):
+            await client.createCollection("accounts", {})
+
+        self.assertEqual(events, [
+            ("before", "countCollection"),
+            ("after", "countCollection", "success", 200, 1, True, True),
+            ("before", "createCollection"),
+            ("error", "createCollection", "error", 409)
+        ])
+
+    async def test_invalid_api_key(self):
+        client = self.make_client(create_app(api_key="another_key"))
+
+        with self.assertRaises(httpx.HTTPStatusError) as context:
+            await client.countCollection("accounts")
+        self.assertEqual(context.exception.response.status_code, 403)
+
+    async def test_injected_errors_are_retried(self):
+        faults = FaultInjector(error_rate=1.0, error_status=503)
+        app = create_app(faults=faults)
+        client = self.make_client(app, resilience=ResiliencePolicy(max_attempts=3, base_delay=0, max_delay=0))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await client.getData("accounts", 1, 10)
+        self.assertEqual(app.state.stats["getData 503"], 3)
+
+    async def test_throttling_answers_429_with_retry_after(self):
+        app = create_app(rate_limit=100, burst=1)
+        admission = AdmissionController()
+        client = self.make_client(app, admission=admission)
+
+        await client.countCollection("accounts")
+        await client.countCollection("accounts")
+
+        self.assertGreaterEqual(app.state.stats.get("countCollection 429", 0), 1)
+        self.assertGreaterEqual(admission.stats()["throttled"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
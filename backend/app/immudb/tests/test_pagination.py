@@ -0,0 +1,53 @@
+import asyncio
+import unittest
+from app.immudb._pagination import iter_documents
+
+class FakeSearch:
+    """In-memory search over `total` documents honoring page, count and searchId."""
+
+    def __init__(self, total: int, delay: float = 0.0):
+        self.documents = [{"n": i} for i in range(total)]
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch(self, page, count, search_id, keep_open):
+        self.calls.append((page, count, search_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        start = (page - 1) * count
+        revisions = [{"document": d} for d in self.documents[start:start + count]]
+        return {"revisions": revisions, "searchId": "search-1"}
+
+class TestIterDocuments(unittest.IsolatedAsyncioTestCase):
+
+    async def test_yields_every_document_in_order(self):
+        search = FakeSearch(95, delay=0.001)
+
+        documents = [d async for d in iter_documents(search.fetch, 10, 4)]
+
+        self.assertEqual(documents, search.documents)
+        self.assertLessEqual(search.max_in_flight, 4)
+        self.assertTrue(all(call[2] == "search-1" for call in search.calls[1:]))
+
+    async def test_stops_after_exact_last_page(self):
+        search = FakeSearch(20)
+
+        documents = [d async for d in iter_documents(search.fetch, 10, 1)]
+
+        self.assertEqual(len(documents), 20)
+        self.assertEqual(len(search.calls), 3)
+
+    async def test_adaptive_page_size(self):
+        search = FakeSearch(500)
+
+        documents = [d async for d in iter_documents(search.fetch, 10, 2, adaptive=True)]
+
+        self.assertEqual(documents, search.documents)
+        self.assertGreater(max(call[1] for call in search.calls), 10)
+
+if __name__ == '__main__':
+    unittest.main()
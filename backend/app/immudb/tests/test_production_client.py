@@ -1,16 +1,23 @@
+import httpx
 import unittest
 from unittest.mock import patch, ANY, AsyncMock, MagicMock
+from app import json_backend
 from app.immudb.client import Client
+from app.immudb.connection_pool import ConnectionPool
 
 class TestProductionClient(unittest.IsolatedAsyncioTestCase):
 
     async def asyncSetUp(self):
         self.client = Client("test_ledger", "http://example.com", "test_api_key", False)
 
+    async def asyncTearDown(self):
+        await self.client.close()
+
     @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
     async def test_getCollectionDetails(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{}'
         mock_request.return_value = mock_response
 
         collection_name = "test"
@@ -36,6 +43,7 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
     async def test_countCollection(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{}'
         mock_post.return_value = mock_response
 
         collection_name = "test"
@@ -48,13 +56,15 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
                 'X-API-Key': 'test_api_key',
                 'Content-Type': 'application/json'
             },
-            json={}
+            timeout=ANY,
+            content=b'{}'
         )
 
     @patch('httpx.AsyncClient.request', new_callable=AsyncMock)
     async def test_createCollection(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{}'
         mock_request.return_value = mock_response
 
         collection_name = "test"
@@ -69,8 +79,8 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
                 'X-API-Key': 'test_api_key',
                 'Content-Type': 'application/json'
             },
-            json=collection_schema,
-            content=None,
+            json=None,
+            content=json_backend.dumps(collection_schema),
             data=None,
             files=None,
             params=None,
@@ -85,6 +95,7 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
     async def test_deleteCollection(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{}'
         mock_request.return_value = mock_response
 
         collection_name = "test"
@@ -110,6 +121,7 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
     async def test_getData(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{}'
         mock_request.return_value = mock_response
 
         collection_name = "test"
@@ -125,8 +137,8 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
                 'X-API-Key': 'test_api_key',
                 'Content-Type': 'application/json'
             },
-            json=ANY,
-            content=None,
+            json=None,
+            content=ANY,
             data=None,
             files=None,
             params=None,
@@ -141,6 +153,7 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
     async def test_setData(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{}'
         mock_request.return_value = mock_response
 
         collection_name = "test"
@@ -156,8 +169,8 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
                 'X-API-Key': 'test_api_key',
                 'Content-Type': 'application/json'
             },
-            json=ANY,
-            content=None,
+            json=None,
+            content=ANY,
             data=None,
             files=None,
             cookies=None,
@@ -167,5 +180,79 @@ class TestProductionClient(unittest.IsolatedAsyncioTestCase):
             extensions=None
         )
 
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_connection_pool_is_reused(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{}'
+        mock_post.return_value = mock_response
+
+        await self.client.countCollection("test")
+        first_client = self.client.pool.get_client()
+        await self.client.countCollection("test")
+
+        self.assertIs(self.client.pool.get_client(), first_client)
+        self.assertEqual(mock_post.call_count, 2)
+
+    async def test_connection_pool_close(self):
+        await self.client.open()
+        self.assertTrue(self.client.pool.is_open)
+
+        await self.client.close()
+        self.assertFalse(self.client.pool.is_open)
+
+    async def test_connection_pool_operation_timeout(self):
+        pool = ConnectionPool(timeout=10.0, operation_timeouts={"setData": 30.0})
+
+        self.assertEqual(pool.timeout_for("setData").read, 30.0)
+        self.assertEqual(pool.timeout_for("getData").read, 10.0)
+
+    @patch('httpx.AsyncClient.put', new_callable=AsyncMock)
+    async def test_setDataBulk_chunks(self, mock_put):
+        mock_put.side_effect = [
+            MagicMock(status_code=200, content=b'{"documentIds": ["a", "b"], "transactionId": "1"}'),
+            MagicMock(status_code=200, content=b'{"documentIds": ["c"], "transactionId": "2"}')
+        ]
+
+        documents = [{"n": 1}, {"n": 2}, {"n": 3}]
+        results = await self.client.setDataBulk("test", documents, chunk_size=2, concurrency=1)
+
+        self.assertEqual(mock_put.call_count, 2)
+        mock_put.assert_any_call(
+            "http://example.com/ledger/test_ledger/collection/test/documents",
+            headers=ANY,
+            timeout=ANY,
+            content=json_backend.dumps({"documents": [{"n": 1}, {"n": 2}]})
+        )
+        self.assertEqual([r["documentId"] for r in results], ["a", "b", "c"])
+        self.assertEqual([r["transactionId"] for r in results], ["1", "1", "2"])
+
+    @patch('httpx.AsyncClient.put', new_callable=AsyncMock)
+    async def test_setDataBulk_chunk_error(self, mock_put):
+        mock_response = MagicMock()
+        mock_response.status_code = 409
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Conflict", request=MagicMock(), response=MagicMock(status_code=409)
+        )
+        mock_put.return_value = mock_response
+
+        results = await self.client.setDataBulk("test", [{"n": 1}, {"n": 2}])
+
+        self.assertEqual([r["code"] for r in results], [409, 409])
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_getData_continues_search(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{}'
+        mock_post.return_value = mock_response
+
+        await self.client.getData("test", 2, 10, search_id="search-1", keep_open=True)
+
+        self.assertEqual(
+            json_backend.loads(mock_post.await_args.kwargs["content"]),
+            {"page": 2, "perPage": 10, "searchId": "search-1", "keepOpen": True}
+        )
+
 if __name__ == '__main__':
     unittest.main()
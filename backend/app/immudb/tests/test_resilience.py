@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+import httpx
+from app.immudb.client import Client
+from app.immudb.resilience import CircuitBreaker, CircuitOpenError, ResiliencePolicy
+
+def make_response(status_code: int) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "error", request=MagicMock(), response=response
+    )
+    return response
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_after_threshold_and_half_opens(self):
+        breaker = CircuitBreaker("getData", failure_threshold=2, reset_timeout=10)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+        with patch("app.immudb.resilience.time.monotonic", return_value=breaker.opened_at + 11):
+            self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+            self.assertTrue(breaker.before_call())
+            with self.assertRaises(CircuitOpenError):
+                breaker.before_call()
+
+            breaker.release_probe()
+            self.assertTrue(breaker.before_call())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+class TestProductionClientResilience(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.policy = ResiliencePolicy(max_attempts=3, base_delay=0, max_delay=0, failure_threshold=3)
+        self.client = Client("test_ledger", "http://example.com", "test_api_key", False, resilience=self.policy)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_reads_are_retried(self, mock_post):
+        ok = make_response(200)
+        ok.content = b'{"count": 1}'
+        mock_post.side_effect = [httpx.ReadTimeout("slow"), make_response(503), ok]
+
+        self.assertEqual(await self.client.countCollection("test"), {"count": 1})
+        self.assertEqual(mock_post.await_count, 3)
+
+    @patch('httpx.AsyncClient.put', new_callable=AsyncMock)
+    async def test_writes_are_not_retried_once_sent(self, mock_put):
+        mock_put.side_effect = httpx.ReadTimeout("slow")
+
+        with self.assertRaises(httpx.ReadTimeout):
+            await self.client.setData("test", {})
+        self.assertEqual(mock_put.await_count, 1)
+
+    @patch('httpx.AsyncClient.put', new_callable=AsyncMock)
+    async def test_writes_are_retried_when_not_sent(self, mock_put):
+        ok = make_response(200)
+        ok.content = b'{"transactionId": "1"}'
+        mock_put.side_effect = [httpx.ConnectError("refused"), ok]
+
+        self.assertEqual(await self.client.setData("test", {}), {"transactionId": "1"})
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_breaker_fails_fast(self, mock_post):
+        mock_post.return_value = make_response(500)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.countCollection("test")
+        with self.assertRaises(CircuitOpenError):
+            await self.client.countCollection("test")
+
+        self.assertEqual(mock_post.await_count, 3)
+        self.assertEqual(self.client.getStats()["circuit_breakers"]["countCollection"]["state"], "open")
+
+    @patch('httpx.AsyncClient.post', new_callable=AsyncMock)
+    async def test_throttled_probe_is_released(self, mock_post):
+        mock_post.return_value = make_response(500)
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.countCollection("test")
+
+        breaker = self.policy.breaker("countCollection")
+        breaker.opened_at -= breaker.reset_timeout
+        throttled = make_response(429)
+        throttled.headers = {"Retry-After": "0"}
+        mock_post.return_value = throttled
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.client.countCollection("test")
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+
+        ok = make_response(200)
+        ok.content = b'{"count": 1}'
+        mock_post.return_value = ok
+        self.assertEqual(await self.client.countCollection("test"), {"count": 1})
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+if __name__ == '__main__':
+    unittest.main()
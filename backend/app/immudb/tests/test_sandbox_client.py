@@ -1,6 +1,9 @@
+import httpx
 import unittest
 from unittest.mock import patch, AsyncMock
 from app.immudb.client import Client
+from app.metrics import REGISTRY
+from app.immudb.sandbox import FaultInjector, LatencyModel, SandboxError, SandboxStore
 
 class TestSandboxClient(unittest.IsolatedAsyncioTestCase): 
 
@@ -86,5 +89,165 @@ class TestSandboxClient(unittest.IsolatedAsyncioTestCase):
             response = await self.client.setData(collection_name, data)
             self.assertEqual(response, expected_response)
 
+    async def test_setDataBulk(self):
+        documents = [{"account_number": i} for i in range(5)]
+
+        results = await self.client.setDataBulk("test", documents, chunk_size=2)
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all("transactionId" in result for result in results))
+
+class TestSandboxStore(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.store = SandboxStore()
+        self.client = Client("test_ledger", "http://example.com", "test_api_key", True,
+                             store=self.store, latency=LatencyModel(distribution="none"))
+
+    async def test_writes_are_visible(self):
+        before = await self.client.countCollection("test")
+        result = await self.client.setData("test", {"account_number": 1})
+        after = await self.client.countCollection("test")
+
+        self.assertEqual(before["count"], 2)
+        self.assertEqual(after["count"], 3)
+        self.assertTrue(result["documentId"])
+        page = await self.client.getData("test", 1, 10)
+        self.assertEqual(page["revisions"][-1]["document"]["_id"], result["documentId"])
+
+    async def test_unique_index_conflict(self):
+        await self.client.setData("test", {"account_number": 1})
+
+        with self.assertRaises(httpx.HTTPStatusError) as context:
+            await self.client.setData("test", {"account_number": 1})
+        self.assertEqual(context.exception.response.status_code, 409)
+
+    async def test_bulk_chunks_are_atomic(self):
+        documents = [{"account_number": 1}, {"account_number": 2}, {"account_number": 2}, {"account_number": 3}]
+
+        results = await self.client.setDataBulk("test", documents, chunk_size=2, concurrency=1)
+
+        self.assertEqual([result.get("code") for result in results], [None, None, 409, 409])
+        self.assertEqual(results[0]["transactionId"], results[1]["transactionId"])
+        self.assertEqual((await self.client.countCollection("test"))["count"], 4)
+
+    async def test_pagination_and_search_snapshot(self):
+        await self.client.setDataBulk("test", [{"account_number": i} for i in range(10)])
+
+        first = await self.client.getData("test", 1, 5, keep_open=True)
+        await self.client.setData("test", {"account_number": 100})
+        last = await self.client.getData("test", 3, 5, search_id=first["searchId"], keep_open=True)
+
+        self.assertEqual(len(first["revisions"]), 5)
+        self.assertEqual([r["document"]["account_number"] for r in last["revisions"]], [8, 9])
+
+        with self.assertRaises(httpx.HTTPStatusError) as context:
+            await self.client.getData("test", 2, 5, search_id="unknown")
+        self.assertEqual(context.exception.response.status_code, 404)
+
+    async def test_field_types(self):
+        await self.client.setData("test", {"account_number": 1, "amount": 10.0})
+        page = await self.client.getData("test", 1, 10, query={"expressions": [
+            {"fieldComparisons": [{"field": "account_number", "operator": "EQ", "value": 1}]}
+        ]})
+        self.assertEqual(page["revisions"][0]["document"]["amount"], 10)
+        self.assertIsInstance(page["revisions"][0]["document"]["amount"], int)
+
+        for document in ({"account_number": 2, "amount": 10.5}, {"account_number": "3"}, {"account_number": 4, "iban": 4}):
+            with self.assertRaises(SandboxError) as context:
+                self.store.insert_many("test", [{"account_number": 5}, document])
+            self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual((await self.client.countCollection("test"))["count"], 3)
+
+    async def test_create_index(self):
+        await self.client.setDataBulk("test", [{"account_number": i, "type": "sending"} for i in range(3)])
+
+        await self.client.createIndex("test", ["type"])
+        details = await self.client.getCollectionDetails("test")
+        self.assertIn({"fields": ["type"], "isUnique": False}, details["indexes"])
+
+        # The seed documents share their IBAN
+        for fields, unique, status in ((["type"], False, 409), (["unknown"], False, 400), (["iban"], True, 409)):
+            with self.assertRaises(httpx.HTTPStatusError) as context:
+                await self.client.createIndex("test", fields, unique)
+            self.assertEqual(context.exception.response.status_code, status)
+
+        await self.client.createCollection("empty", {"fields": [{"name": "iban", "type": "STRING"}]})
+        await self.client.createIndex("empty", ["iban"], True)
+        await self.client.setData("empty", {"iban": "IT1"})
+        with self.assertRaises(httpx.HTTPStatusError) as context:
+            await self.client.setData("empty", {"iban": "IT1"})
+        self.assertEqual(context.exception.response.status_code, 409)
+
+    async def test_search_query(self):
+        await self.client.setDataBulk("test", [
+            {"account_number": i, "amount": i * 10, "type": "sending" if i % 2 else "receiving"} for i in range(1, 11)
+        ])
+        query = {"expressions": [
+            {"fieldComparisons": [
+                {"field": "type", "operator": "EQ", "value": "sending"},
+                {"field": "amount", "operator": "GE", "value": 50}
+            ]},
+            {"fieldComparisons": [{"field": "account_number", "operator": "EQ", "value": 2}]}
+        ]}
+
+        first = await self.client.getData("test", 1, 2, keep_open=True, query=query)
+        second = await self.client.getData("test", 2, 2, search_id=first["searchId"])
+
+        numbers = [r["document"]["account_number"] for r in first["revisions"] + second["revisions"]]
+        self.assertEqual(numbers, [2, 5, 7, 9])
+
+        with self.assertRaises(httpx.HTTPStatusError) as context:
+            await self.client.getData("test", 1, 2, query={"expressions": [{"fieldComparisons": [
+                {"field": "amount", "operator": "BETWEEN", "value": 1}
+            ]}]})
+        self.assertEqual(context.exception.response.status_code, 400)
+
+    async def test_search_order_by(self):
+        store = SandboxStore(seed_documents=[
+            {"account_number": 1, "amount": 30, "_vault_md": {"ts": 3}},
+            {"account_number": 2, "amount": 10, "_vault_md": {"ts": 1}},
+            {"account_number": 3, "amount": 30, "_vault_md": {"ts": 2}},
+            {"account_number": 4}
+        ])
+
+        def numbers(query):
+            return [r["document"]["account_number"] for r in store.search("test", 1, 10, query=query)["revisions"]]
+
+        self.assertEqual(numbers({"orderBy": [{"field": "amount", "desc": True}]}), [1, 3, 2, 4])
+        self.assertEqual(numbers({"orderBy": [{"field": "amount", "desc": False}]}), [4, 2, 1, 3])
+        # Document 4 gets the current time as its write timestamp
+        self.assertEqual(numbers({"orderBy": [{"field": "_vault_md.ts", "desc": False}]}), [2, 3, 1, 4])
+        self.assertEqual(numbers({
+            "expressions": [{"fieldComparisons": [{"field": "amount", "operator": "GE", "value": 20}]}],
+            "orderBy": [{"field": "amount", "desc": True}, {"field": "account_number", "desc": True}]
+        }), [3, 1])
+
+    async def test_fault_injection(self):
+        client = Client("test_ledger", "http://example.com", "test_api_key", True,
+                        latency=LatencyModel(distribution="none"),
+                        faults=FaultInjector(error_rate=1.0, error_status=500, operations={"getData"}))
+
+        with self.assertRaises(httpx.HTTPStatusError) as context:
+            await client.getData("test", 1, 10)
+        self.assertEqual(context.exception.response.status_code, 500)
+        self.assertEqual((await client.countCollection("test"))["count"], 2)
+        self.assertEqual(client.getStats()["sandbox"]["injected_errors"], 1)
+        self.assertIn(
+            'vault_call_duration_seconds_count{operation="getData",outcome="error",status="500"}',
+            REGISTRY.render()
+        )
+
+    def test_latency_distributions(self):
+        for distribution in LatencyModel.DISTRIBUTIONS:
+            model = LatencyModel(mean=0.05, distribution=distribution, seed=1)
+            samples = [model.sample() for _ in range(2000)]
+            self.assertTrue(all(sample >= 0 for sample in samples))
+            if distribution != "none":
+                self.assertAlmostEqual(sum(samples) / len(samples), 0.05, delta=0.01)
+
+        with self.assertRaises(ValueError):
+            LatencyModel(distribution="pareto")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+import json
+from typing import Any
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Name of the JSON library in use, for monitoring and tests
+BACKEND = "orjson" if orjson is not None else "json"
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise; both produce the same compact output for plain JSON data.
+
+    Args:
+        data (Any): The JSON-serializable data.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def loads(data: Any) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data (bytes | str): The JSON document.
+
+    Returns:
+        Any: The decoded data.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with the fastest available JSON backend.
+
+    Drop-in replacement for starlette's JSONResponse, used as the default
+    response class of the API routers.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(content)
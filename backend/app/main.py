@@ -1,10 +1,37 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers.operations import operations_router
+from app.adapters.immudb_adapter_singleton import ImmuDBAdapterSingleton
+from app.routers.operations import operations_router, get_immudb_adapter
+from app.routers.monitoring import monitoring_router
+from app.routers.metrics import metrics_router
 from app.settings import Settings
 
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: the vault adapter is created and verified once at
+    startup, before serving requests, and closed with its connections on shutdown.
+
+    If the vault is not available at startup the application still starts: the
+    readiness endpoint reports the error and the adapter is created on the
+    first request instead.
+    """
+    try:
+        await get_immudb_adapter()
+    except HTTPException as e:
+        logger.warning("Vault adapter not ready at startup: %s", e.detail)
+
+    yield
+
+    await ImmuDBAdapterSingleton.close_instance()
+
 # Fast API config
 app = FastAPI(
+    lifespan=lifespan,
     title="BragApp",
     description="It's full of things but ... hey, it's just a showoff 🤷🏻‍♂️",
     version="0.0.1989",
@@ -27,7 +54,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  
     allow_headers=["*"], 
+    expose_headers=["X-Next-Cursor", "X-Trace-Id"],
 )
 
 # Include the router from the operations endpoint
-app.include_router(operations_router)
\ No newline at end of file
+app.include_router(operations_router)
+
+# Include the router from the monitoring endpoint
+app.include_router(monitoring_router)
+
+# Include the router from the metrics endpoint
+app.include_router(metrics_router)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import time
+from typing import Callable
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from app.metrics import REGISTRY
+from app.tracing import TRACES
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Duration of API requests, until the response is ready to be sent.",
+    ("method", "route")
+)
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests",
+    "API requests, by route and HTTP status.",
+    ("method", "route", "status")
+)
+
+class InstrumentedRoute(APIRoute):
+    """
+    API route recording its latency and response statuses, and tracing the
+    requests sampled by `TRACES`.
+
+    Routes are labelled with their path template (e.g. `/accounts/`), never
+    with the actual URL, to keep the number of series bounded. For streaming
+    responses the duration covers the time to the first byte only. Sampled
+    responses carry their trace ID in the `X-Trace-Id` header.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        method = ",".join(sorted(self.methods))
+        route = self.path_format
+
+        async def instrumented_handler(request: Request) -> Response:
+            started = time.perf_counter()
+            trace = TRACES.start(f"{method} {route}")
+            status = 500
+            try:
+                response = await handler(request)
+                status = response.status_code
+                if trace is not None:
+                    response.headers["X-Trace-Id"] = trace[0].trace_id
+                return response
+            except HTTPException as e:
+                status = e.status_code
+                raise
+            except RequestValidationError:
+                status = 422
+                raise
+            finally:
+                if trace is not None:
+                    TRACES.finish(trace, status)
+                HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, method=method, route=route)
+                HTTP_REQUESTS.inc(method=method, route=route, status=status)
+
+        return instrumented_handler
@@ -0,0 +1,88 @@
+# app/routers/metrics.py
+
+from typing import Iterable, List, Tuple
+from fastapi import APIRouter, Response
+from app.adapters.immudb_adapter_singleton import ImmuDBAdapterSingleton
+from app.metrics import CONTENT_TYPE, REGISTRY, Sample
+
+# Init the router
+metrics_router = APIRouter(tags=["monitoring"])
+
+BREAKER_STATES = ("closed", "open", "half_open")
+
+# Adapter caches exported, by the prefix of their statistics key
+CACHES = ("page", "account")
+
+def collect_adapter_metrics() -> Iterable[Tuple[str, str, str, List[Sample]]]:
+    """
+    Turn the statistics of the running vault adapter into metric families.
+
+    Called at scrape time only; nothing is collected before the adapter exists.
+    """
+    adapter = ImmuDBAdapterSingleton.peek_instance()
+    if adapter is None:
+        return []
+
+    stats = adapter.get_vault_stats().data
+    client = stats.get("client", {})
+    families = []
+
+    pool = client.get("connection_pool")
+    if pool is not None:
+        families.append(("vault_pool_connections", "gauge", "Pooled vault connections, by state.", [
+            ("vault_pool_connections", {"state": "active"}, pool["active"]),
+            ("vault_pool_connections", {"state": "idle"}, pool["idle"])
+        ]))
+        families.append(("vault_pool_max_connections", "gauge", "Maximum pooled vault connections.", [
+            ("vault_pool_max_connections", {}, pool["max_connections"])
+        ]))
+
+    admission = client.get("admission")
+    if admission is not None:
+        families.append(("vault_admission_queued", "gauge", "Vault calls waiting to be admitted.", [
+            ("vault_admission_queued", {}, admission["queued"])
+        ]))
+        families.append(("vault_admission_rejected", "counter", "Vault calls rejected by the admission queue.", [
+            ("vault_admission_rejected_total", {}, admission["rejected"])
+        ]))
+
+    breakers = client.get("circuit_breakers")
+    if breakers:
+        families.append(("vault_circuit_breaker_state", "gauge", "Circuit breaker state of each vault operation (1 for the current state).", [
+            ("vault_circuit_breaker_state", {"operation": operation, "state": state}, int(breaker["state"] == state))
+            for operation, breaker in breakers.items() for state in BREAKER_STATES
+        ]))
+
+    caches = {name: stats[f"{name}_cache"] for name in CACHES if f"{name}_cache" in stats}
+    if caches:
+        families.append(("cache_hit_ratio", "gauge", "Hit ratio of the adapter caches.", [
+            ("cache_hit_ratio", {"cache": name}, cache["hit_ratio"]) for name, cache in caches.items()
+        ]))
+        families.append(("cache_requests", "counter", "Lookups of the adapter caches, by result.", [
+            ("cache_requests_total", {"cache": name, "result": result}, cache[key])
+            for name, cache in caches.items() for result, key in (("hit", "hits"), ("miss", "misses"))
+        ]))
+        families.append(("cache_entries", "gauge", "Entries of the adapter caches.", [
+            ("cache_entries", {"cache": name}, cache["size"]) for name, cache in caches.items()
+        ]))
+
+    single_flight = stats.get("single_flight", {})
+    families.append(("vault_single_flight_shared", "counter", "Vault reads served by an identical read already in flight.", [
+        ("vault_single_flight_shared_total", {}, single_flight.get("shared", 0))
+    ]))
+
+    return families
+
+REGISTRY.add_collector(collect_adapter_metrics)
+
+
+@metrics_router.get("/metrics",
+                    summary="Get the application metrics in the Prometheus text format.",
+                    response_class=Response,
+                    response_description="The metrics, in the Prometheus text exposition format.")
+async def metrics():
+    """
+    Expose the endpoint latencies, the vault call metrics, the connection pool
+    usage and the cache statistics for Prometheus to scrape.
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,61 @@
+# app/routers/monitoring.py
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from typing import Any, Dict, List
+from app.adapters.immudb_adapter import ImmuDBAdapter
+from app.adapters.immudb_adapter_singleton import ImmuDBAdapterSingleton
+from app.routers.operations import get_immudb_adapter
+from app.tracing import TRACES
+
+# Init the router
+monitoring_router = APIRouter(prefix="/monitoring", tags=["monitoring"])
+
+
+@monitoring_router.get("/ready",
+                       summary="Check whether the backend is ready to serve requests.",
+                       response_model=Dict[str, Any],
+                       response_description="Readiness details; the status is 503 when not ready.")
+async def readiness():
+    """
+    Report whether the vault and the collection have been verified.
+
+    This endpoint never connects to the vault itself.
+    """
+    immudbAdapter = ImmuDBAdapterSingleton.peek_instance()
+
+    if immudbAdapter is None:
+        return JSONResponse(
+            status_code=503,
+            content={"ready": False, "error": ImmuDBAdapterSingleton.last_error or "Starting."}
+        )
+
+    result = immudbAdapter.get_readiness()
+    if result.status:
+        return result.data
+    return JSONResponse(status_code=result.code, content=result.data)
+
+
+@monitoring_router.get("/vault",
+                       summary="Get runtime statistics of the vault client.",
+                       response_model=Dict[str, Any],
+                       response_description="Circuit breaker states and cache statistics.")
+async def vault_stats(immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapter)):
+    """
+    Retrieve the circuit breaker states and cache statistics of the vault adapter.
+    """
+    return immudbAdapter.get_vault_stats().data
+
+
+@monitoring_router.get("/traces",
+                       summary="Get the slowest recently traced requests.",
+                       response_model=List[Dict[str, Any]],
+                       response_description="The traces, slowest first, with their span timings.")
+async def slowest_traces(limit: int = 10):
+    """
+    Dump the slowest of the recently sampled request traces, with the time spent
+    in each span (vault queueing, encoding, network, decoding, validation, serialization).
+
+    Tracing is opt-in: nothing is recorded unless `IMMUDB_TRACE_SAMPLE_EVERY` is set.
+    """
+    return TRACES.slowest(limit)
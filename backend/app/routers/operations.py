@@ -1,15 +1,29 @@
 # app/api/operations_router.py
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, Body, HTTPException, Depends, Query, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from typing import List, Optional
 from app.schemas.account import Account
+from app.schemas.account_filter import AccountFilter
+from app.schemas.account_lookup import AccountLookupResult
+from app.schemas.account_sort import AccountSort
+from app.schemas.account_batch import AccountBatchResult
+from app.schemas.export_format import ExportFormat
+from app.schemas.operation_type import OperationType
+from app.adapters.account_codec import dump_accounts
+from app.adapters.account_export import MEDIA_TYPES
 from app.adapters.immudb_adapter import ImmuDBAdapter
 from app.adapters.immudb_adapter_singleton import ImmuDBAdapterSingleton  
+from app.json_backend import FastJSONResponse
+from app.routers.instrumented_route import InstrumentedRoute
 from app.settings import Settings
+from app.tracing import span
 
 # Init the router
 settings = Settings()
-operations_router = APIRouter()
+operations_router = APIRouter(default_response_class=FastJSONResponse, route_class=InstrumentedRoute)
 
 async def get_immudb_adapter():
     """
@@ -23,6 +37,31 @@ async def get_immudb_adapter():
         api_key=settings.IMMUDB_VAULT_API_KEY
     )
 
+def _filter_query(field: str):
+    """Query parameter of an AccountFilter field, documented by the model."""
+    return Query(None, description=AccountFilter.model_fields[field].description)
+
+async def get_account_filter(type: Optional[OperationType] = _filter_query("type"),
+                             amount_min: Optional[float] = _filter_query("amount_min"),
+                             amount_max: Optional[float] = _filter_query("amount_max"),
+                             account_name: Optional[str] = _filter_query("account_name"),
+                             iban_country: Optional[str] = _filter_query("iban_country")):
+    """
+    Dependency collecting the account filters from the query string.
+
+    The limits of the filters are declared by AccountFilter only; a violation
+    is reported like any other invalid query parameter (422), with the input
+    as a string like it was received (`nan` is not valid JSON).
+    """
+    try:
+        return AccountFilter(type=type, amount_min=amount_min, amount_max=amount_max,
+                             account_name=account_name, iban_country=iban_country)
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("query",) + tuple(error["loc"]), "input": str(error["input"])}
+            for error in e.errors(include_url=False)
+        ])
+
 
 @operations_router.get("/accounts/count",
                        summary="Get the number of accounts in the vault.",
@@ -40,15 +79,85 @@ async def count_accounts(immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapt
         raise HTTPException(status_code=result.code, detail=result.error)
 
 
+@operations_router.get("/accounts/export",
+                       summary="Export every account in the vault.",
+                       response_class=StreamingResponse,
+                       response_description="A stream of all the accounts, as NDJSON or CSV.")
+async def export_accounts(format: ExportFormat = ExportFormat.NDJSON,
+                          immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapter)):
+    """
+    Stream every account of the vault collection, with constant memory usage.
+    """
+    result = await immudbAdapter.export_accounts(format)
+
+    if result.status:
+        return StreamingResponse(
+            result.data,
+            media_type=MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="accounts.{format.value}"'}
+        )
+    else:
+        raise HTTPException(status_code=result.code, detail=result.error)
+
+
 @operations_router.get("/accounts/",
                        summary="Get a list of all account numbers in the vault.",
                        response_model=List[Account],
                        response_description="A list of all account numbers in the vault collection.")
-async def get_accounts(page: int = 1, count: int = 10, immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapter)):
+async def get_accounts(page: int = 1, count: int = 10, cursor: Optional[str] = None,
+                       sort: Optional[AccountSort] = None,
+                       filters: AccountFilter = Depends(get_account_filter),
+                       immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapter)):
     """
     Retrieve a paginated list of accounts from the vault.
+
+    Filter by `type`, `amount_min`/`amount_max`, `account_name` prefix or
+    `iban_country`: the filters are evaluated by the vault, so only the matching
+    accounts are fetched. Sort with `sort` (`amount`, `account_number` or `created`,
+    prefixed by `-` for descending order): the vault returns the accounts in order
+    across pages, so e.g. `sort=-amount&count=10` is the top 10 balances. With
+    cursors, pass the same filters and sort order on every page.
+
+    Pass `cursor` (an empty value for the first page) to use cursor-based pagination
+    instead of `page`: the cursor of the next page is returned in the `X-Next-Cursor`
+    header, which is omitted on the last page.
+
+    The accounts were validated when read from the vault, so they are serialized
+    directly instead of being validated again against the response model.
     """
-    result = await immudbAdapter.get_accounts(page, count)
+    headers = {}
+
+    if cursor is not None:
+        result = await immudbAdapter.get_accounts_page(cursor, count, filters, sort)
+
+        if not result.status:
+            raise HTTPException(status_code=result.code, detail=result.error)
+        if result.data.next_cursor:
+            headers["X-Next-Cursor"] = result.data.next_cursor
+        accounts = result.data.accounts
+    else:
+        result = await immudbAdapter.get_accounts(page, count, filters, sort)
+
+        if not result.status:
+            raise HTTPException(status_code=result.code, detail=result.error)
+        accounts = result.data
+
+    with span("response.serialize"):
+        content = dump_accounts(accounts)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+# Declared after the other GET /accounts/... routes, so that they take precedence
+@operations_router.get("/accounts/{account_number}",
+                       summary="Get one account by its account number.",
+                       response_model=Account,
+                       response_description="The account.")
+async def get_account(account_number: int, immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapter)):
+    """
+    Retrieve one account with an exact-match lookup on the unique account number
+    index, served from the account cache when possible.
+    """
+    result = await immudbAdapter.get_account(account_number)
 
     if result.status:
         return result.data
@@ -70,3 +179,38 @@ async def set_account(account: Account, immudbAdapter: ImmuDBAdapter = Depends(g
         return result.data
     else:
         raise HTTPException(status_code=result.code, detail=result.error)
+
+
+@operations_router.post("/accounts/batch",
+                        summary="Add many new account transactions to the vault.",
+                        response_model=List[AccountBatchResult],
+                        response_description="The outcome of every account, in request order")
+async def set_accounts_batch(accounts: List[Account], immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapter)):
+    """
+    Add many new account transactions to the vault with as few vault calls as possible.
+    """
+    result = await immudbAdapter.set_accounts_bulk(accounts)
+
+    if result.status:
+        return result.data
+    else:
+        raise HTTPException(status_code=result.code, detail=result.error)
+
+
+@operations_router.post("/accounts/lookup",
+                        summary="Get many accounts by their account numbers.",
+                        response_model=List[AccountLookupResult],
+                        response_description="One result per account number, in request order")
+async def lookup_accounts(account_numbers: List[int] = Body(..., max_length=1000),
+                          immudbAdapter: ImmuDBAdapter = Depends(get_immudb_adapter)):
+    """
+    Retrieve up to 1000 accounts at once. Accounts not in the account cache are
+    fetched with a few batched vault searches; missing accounts are reported
+    with `found` set to false.
+    """
+    result = await immudbAdapter.get_accounts_by_number(account_numbers)
+
+    if result.status:
+        return result.data
+    else:
+        raise HTTPException(status_code=result.code, detail=result.error)
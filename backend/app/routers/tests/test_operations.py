@@ -0,0 +1,132 @@
+import csv
+import io
+import json
+import unittest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.tracing import TRACES
+
+class TestOperationsRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        self.client.__enter__()
+        self.addCleanup(self.client.__exit__, None, None, None)
+
+    def test_get_accounts_with_cursor(self):
+        response = self.client.get("/accounts/", params={"cursor": "", "count": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+        self.assertIn("X-Next-Cursor", response.headers)
+
+    def test_get_accounts_with_filters(self):
+        response = self.client.get("/accounts/", params={"type": "sending", "iban_country": "IT", "amount_min": 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(account["type"] == "sending" for account in response.json()))
+
+        response = self.client.get("/accounts/", params={"amount_min": 1000000000})
+        self.assertEqual(response.json(), [])
+
+        response = self.client.get("/accounts/", params={"iban_country": "italy"})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["loc"], ["query", "iban_country"])
+
+        response = self.client.get("/accounts/", params={"amount_min": -1})
+        self.assertEqual(response.status_code, 422)
+
+    def test_get_accounts_with_non_finite_amounts(self):
+        for pagination in ({}, {"cursor": ""}):
+            for field in ("amount_min", "amount_max"):
+                for value in ("inf", "-inf", "nan"):
+                    response = self.client.get("/accounts/", params={**pagination, field: value})
+                    self.assertEqual(response.status_code, 422, (pagination, field, value))
+                    self.assertEqual(response.json()["detail"][0]["loc"], ["query", field])
+
+    def test_get_accounts_sorted(self):
+        response = self.client.get("/accounts/", params={"sort": "-account_number"})
+        numbers = [account["account_number"] for account in response.json()]
+        self.assertEqual(numbers, sorted(numbers, reverse=True))
+
+        response = self.client.get("/accounts/", params={"sort": "iban"})
+        self.assertEqual(response.status_code, 422)
+
+    def test_get_account(self):
+        response = self.client.get("/accounts/1234")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["account_number"], 1234)
+
+        self.assertEqual(self.client.get("/accounts/999999999").status_code, 404)
+        self.assertEqual(self.client.get("/accounts/count").status_code, 200)
+
+    def test_lookup_accounts(self):
+        response = self.client.post("/accounts/lookup", json=[12345, 999999999, 1234])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["found"] for item in response.json()], [True, False, True])
+        self.assertEqual(response.json()[2]["account"]["account_number"], 1234)
+        self.assertIsNone(response.json()[1]["account"])
+
+        self.assertEqual(self.client.post("/accounts/lookup", json=list(range(1001))).status_code, 422)
+
+    def test_get_accounts_with_invalid_cursor(self):
+        response = self.client.get("/accounts/", params={"cursor": "garbage"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_accounts_ndjson(self):
+        response = self.client.get("/accounts/export", params={"format": "ndjson"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        lines = response.text.splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["account_number"], 1234)
+
+    def test_export_accounts_csv(self):
+        response = self.client.get("/accounts/export", params={"format": "csv"})
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        self.assertEqual(rows[0][0], "account_number")
+        self.assertEqual(len(rows), 3)
+
+    def test_vault_stats(self):
+        self.client.get("/accounts/", params={"page": 1, "count": 2})
+        response = self.client.get("/monitoring/vault")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("page_cache", response.json())
+
+    def test_readiness(self):
+        response = self.client.get("/monitoring/ready")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["ready"])
+
+    def test_metrics(self):
+        self.client.get("/accounts/count")
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn('http_requests_total{method="GET",route="/accounts/count",status="200"}', response.text)
+        self.assertIn('vault_call_duration_seconds_count{operation="countCollection",outcome="success",status="200"}', response.text)
+
+    def test_traces(self):
+        sample_every = TRACES.sample_every
+        TRACES.sample_every = 1
+        self.addCleanup(setattr, TRACES, "sample_every", sample_every)
+
+        response = self.client.get("/accounts/", params={"cursor": "", "count": 2})
+        trace_id = response.headers["X-Trace-Id"]
+        traces = self.client.get("/monitoring/traces", params={"limit": 50}).json()
+
+        trace = next(trace for trace in traces if trace["trace_id"] == trace_id)
+        self.assertEqual(trace["name"], "GET /accounts/")
+        self.assertEqual(trace["status"], 200)
+        self.assertIn("vault.getData", trace["breakdown_ms"])
+        self.assertIn("accounts.validate", trace["breakdown_ms"])
+        self.assertIn("response.serialize", trace["breakdown_ms"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,6 +32,20 @@ account_schema = {
         {
             "fields": ["account_number"],
             "isUnique": True
+        },
+        # Secondary indexes serving the filters of GET /accounts/,
+        # added to existing collections by app.adapters.schema_migration
+        {
+            "fields": ["type"],
+            "isUnique": False
+        },
+        {
+            "fields": ["amount"],
+            "isUnique": False
+        },
+        {
+            "fields": ["iban"],
+            "isUnique": False
         }
     ]
 }
@@ -0,0 +1,22 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+class AccountBatchResult(BaseModel):
+    """
+    Outcome of a single account of a batch insert.
+
+    Attributes:
+        index (int): Position of the account in the submitted batch.
+        account_number (int): Account number of the submitted account.
+        transaction_id (Optional[str]): Vault transaction ID, if the insert succeeded.
+        document_id (Optional[str]): Vault document ID, if the insert succeeded.
+        error (Optional[str]): Error message, if the insert failed.
+        code (int): HTTP-like status code of the insert.
+    """
+
+    index: int = Field(..., description="Position of the account in the submitted batch")
+    account_number: int = Field(..., description="Account number of the submitted account")
+    transaction_id: Optional[str] = Field(None, description="Vault transaction ID")
+    document_id: Optional[str] = Field(None, description="Vault document ID")
+    error: Optional[str] = Field(None, description="Error message, if the insert failed")
+    code: int = Field(200, description="HTTP-like status code of the insert")
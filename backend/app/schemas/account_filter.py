@@ -0,0 +1,27 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from app.schemas.operation_type import OperationType
+
+class AccountFilter(BaseModel):
+    """
+    Filters of an accounts listing, evaluated by the vault.
+
+    Attributes:
+        type (Optional[OperationType]): Only accounts of this type.
+        amount_min (Optional[float]): Only accounts with at least this amount.
+        amount_max (Optional[float]): Only accounts with at most this amount.
+        account_name (Optional[str]): Only accounts whose name starts with this prefix.
+        iban_country (Optional[str]): Only accounts whose IBAN has this country code.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Optional[OperationType] = Field(None, description="Type of account: sending or receiving")
+    amount_min: Optional[float] = Field(None, ge=0, allow_inf_nan=False, description="Minimum amount, inclusive")
+    amount_max: Optional[float] = Field(None, ge=0, allow_inf_nan=False, description="Maximum amount, inclusive")
+    account_name: Optional[str] = Field(None, min_length=1, max_length=100, description="Prefix of the account name")
+    iban_country: Optional[str] = Field(None, pattern=r'^[A-Z]{2}$', description="Country code of the IBAN")
+
+    def is_empty(self) -> bool:
+        """Whether no filter is set."""
+        return all(value is None for value in self.model_dump().values())
@@ -0,0 +1,17 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+from app.schemas.account import Account
+
+class AccountLookupResult(BaseModel):
+    """
+    Outcome of a single account number of a batched lookup.
+
+    Attributes:
+        account_number (int): The account number looked up.
+        found (bool): Whether the account exists.
+        account (Optional[Account]): The account, if it exists.
+    """
+
+    account_number: int = Field(..., description="The account number looked up")
+    found: bool = Field(..., description="Whether the account exists")
+    account: Optional[Account] = Field(None, description="The account, if it exists")
@@ -0,0 +1,15 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from app.schemas.account import Account
+
+class AccountPage(BaseModel):
+    """
+    A page of accounts read with cursor-based pagination.
+
+    Attributes:
+        accounts (List[Account]): The accounts of the page.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
+    """
+
+    accounts: List[Account] = Field(..., description="The accounts of the page")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, None on the last page")
@@ -0,0 +1,22 @@
+from enum import Enum
+
+class AccountSort(str, Enum):
+    """
+    Enumeration for the order of an accounts listing. A leading `-` sorts in
+    descending order.
+
+    Attributes:
+        AMOUNT (str): By amount, smallest first.
+        AMOUNT_DESC (str): By amount, largest first.
+        ACCOUNT_NUMBER (str): By account number, ascending.
+        ACCOUNT_NUMBER_DESC (str): By account number, descending.
+        CREATED (str): By creation time in the vault, oldest first.
+        CREATED_DESC (str): By creation time in the vault, newest first.
+    """
+
+    AMOUNT = 'amount'
+    AMOUNT_DESC = '-amount'
+    ACCOUNT_NUMBER = 'account_number'
+    ACCOUNT_NUMBER_DESC = '-account_number'
+    CREATED = 'created'
+    CREATED_DESC = '-created'
@@ -0,0 +1,13 @@
+from enum import Enum
+
+class ExportFormat(str, Enum):
+    """
+    Enumeration for the format of an accounts export.
+
+    Attributes:
+        NDJSON (str): One JSON object per line.
+        CSV (str): Comma-separated values with a header row.
+    """
+
+    NDJSON = 'ndjson'
+    CSV = 'csv'
@@ -1,5 +1,6 @@
 import os
-from app.utils import str_to_bool
+import tempfile
+from app.utils import str_to_bool, str_to_int_map
 
 class Settings:
     """
@@ -43,4 +44,80 @@ class Settings:
         self.IMMUDB_VAULT_COLLECTION_NAME = os.getenv("IMMUDB_VAULT_COLLECTION_NAME", "accounts")
         self.IMMUDB_VAULT_BASEURL = os.getenv("IMMUD_DB_URL", "https://vault.immudb.io/ics/api/v1")
         self.IMMUDB_VAULT_API_KEY = os.getenv("IMMUD_DB_API_KEY", "XXXXXXXXXXXXXXXXX")
-        self.FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:8080")
\ No newline at end of file
+        self.FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:8080")
+
+        # Sandbox vault (latency in seconds, rates between 0 and 1)
+        self.IMMUDB_SANDBOX_LATENCY = float(os.getenv("IMMUDB_SANDBOX_LATENCY", "0.1"))
+        self.IMMUDB_SANDBOX_LATENCY_DISTRIBUTION = os.getenv("IMMUDB_SANDBOX_LATENCY_DISTRIBUTION", "fixed")
+        self.IMMUDB_SANDBOX_LATENCY_JITTER = float(os.getenv("IMMUDB_SANDBOX_LATENCY_JITTER", "0.5"))
+        self.IMMUDB_SANDBOX_ERROR_RATE = float(os.getenv("IMMUDB_SANDBOX_ERROR_RATE", "0"))
+        self.IMMUDB_SANDBOX_ERROR_STATUS = int(os.getenv("IMMUDB_SANDBOX_ERROR_STATUS", "503"))
+        self.IMMUDB_SANDBOX_TIMEOUT_RATE = float(os.getenv("IMMUDB_SANDBOX_TIMEOUT_RATE", "0"))
+        stringSandboxSeed = os.getenv("IMMUDB_SANDBOX_SEED", "")
+        self.IMMUDB_SANDBOX_SEED = int(stringSandboxSeed) if stringSandboxSeed else None
+
+        # Vault connection pool
+        self.IMMUDB_VAULT_MAX_CONNECTIONS = int(os.getenv("IMMUDB_VAULT_MAX_CONNECTIONS", "100"))
+        self.IMMUDB_VAULT_MAX_KEEPALIVE = int(os.getenv("IMMUDB_VAULT_MAX_KEEPALIVE", "20"))
+        self.IMMUDB_VAULT_KEEPALIVE_EXPIRY = float(os.getenv("IMMUDB_VAULT_KEEPALIVE_EXPIRY", "30"))
+        self.IMMUDB_VAULT_HTTP2 = str_to_bool(os.getenv("IMMUDB_VAULT_HTTP2", "0"))
+        self.IMMUDB_VAULT_CONNECT_TIMEOUT = float(os.getenv("IMMUDB_VAULT_CONNECT_TIMEOUT", "5"))
+        self.IMMUDB_VAULT_READ_TIMEOUT = float(os.getenv("IMMUDB_VAULT_READ_TIMEOUT", "10"))
+        self.IMMUDB_VAULT_WRITE_TIMEOUT = float(os.getenv("IMMUDB_VAULT_WRITE_TIMEOUT", "30"))
+
+        # Vault bulk inserts
+        self.IMMUDB_VAULT_BULK_CHUNK_SIZE = int(os.getenv("IMMUDB_VAULT_BULK_CHUNK_SIZE", "100"))
+        self.IMMUDB_VAULT_BULK_CHUNK_BYTES = int(os.getenv("IMMUDB_VAULT_BULK_CHUNK_BYTES", "1048576"))
+        self.IMMUDB_VAULT_BULK_CONCURRENCY = int(os.getenv("IMMUDB_VAULT_BULK_CONCURRENCY", "4"))
+
+        # Write-behind batching of single account inserts
+        self.IMMUDB_WRITE_BATCHING = str_to_bool(os.getenv("IMMUDB_WRITE_BATCHING", "0"))
+        self.IMMUDB_WRITE_BATCH_MAX_SIZE = int(os.getenv("IMMUDB_WRITE_BATCH_MAX_SIZE", "100"))
+        self.IMMUDB_WRITE_BATCH_MAX_DELAY_MS = float(os.getenv("IMMUDB_WRITE_BATCH_MAX_DELAY_MS", "5"))
+
+        # Read-through cache of account pages (a TTL of 0 disables it)
+        self.IMMUDB_PAGE_CACHE_SIZE = int(os.getenv("IMMUDB_PAGE_CACHE_SIZE", "256"))
+        self.IMMUDB_PAGE_CACHE_TTL = float(os.getenv("IMMUDB_PAGE_CACHE_TTL", "5"))
+
+        # Single account lookup cache (a TTL of 0 disables it)
+        self.IMMUDB_ACCOUNT_CACHE_SIZE = int(os.getenv("IMMUDB_ACCOUNT_CACHE_SIZE", "10000"))
+        self.IMMUDB_ACCOUNT_CACHE_TTL = float(os.getenv("IMMUDB_ACCOUNT_CACHE_TTL", "60"))
+
+        # Batched account lookups (account numbers per vault search, searches in parallel)
+        self.IMMUDB_LOOKUP_CHUNK_SIZE = int(os.getenv("IMMUDB_LOOKUP_CHUNK_SIZE", "50"))
+        self.IMMUDB_LOOKUP_CONCURRENCY = int(os.getenv("IMMUDB_LOOKUP_CONCURRENCY", "4"))
+
+        # Locally maintained account count (a staleness of 0 always asks the vault)
+        self.IMMUDB_COUNT_MAX_STALENESS = float(os.getenv("IMMUDB_COUNT_MAX_STALENESS", "30"))
+
+        # Streaming export
+        self.IMMUDB_EXPORT_PAGE_SIZE = int(os.getenv("IMMUDB_EXPORT_PAGE_SIZE", "100"))
+        self.IMMUDB_EXPORT_CONCURRENCY = int(os.getenv("IMMUDB_EXPORT_CONCURRENCY", "4"))
+
+        # Vault retries and circuit breakers
+        self.IMMUDB_VAULT_RETRY_ATTEMPTS = int(os.getenv("IMMUDB_VAULT_RETRY_ATTEMPTS", "3"))
+        self.IMMUDB_VAULT_RETRY_BASE_DELAY = float(os.getenv("IMMUDB_VAULT_RETRY_BASE_DELAY", "0.1"))
+        self.IMMUDB_VAULT_RETRY_MAX_DELAY = float(os.getenv("IMMUDB_VAULT_RETRY_MAX_DELAY", "2"))
+        self.IMMUDB_VAULT_BREAKER_THRESHOLD = int(os.getenv("IMMUDB_VAULT_BREAKER_THRESHOLD", "5"))
+        self.IMMUDB_VAULT_BREAKER_RESET_TIMEOUT = float(os.getenv("IMMUDB_VAULT_BREAKER_RESET_TIMEOUT", "30"))
+
+        # Vault outbound admission (a rate of 0 means unlimited)
+        self.IMMUDB_VAULT_MAX_CONCURRENCY = int(os.getenv("IMMUDB_VAULT_MAX_CONCURRENCY", "50"))
+        self.IMMUDB_VAULT_OPERATION_CONCURRENCY = str_to_int_map(os.getenv("IMMUDB_VAULT_OPERATION_CONCURRENCY", ""))
+        self.IMMUDB_VAULT_RATE_LIMIT = float(os.getenv("IMMUDB_VAULT_RATE_LIMIT", "0"))
+        self.IMMUDB_VAULT_RATE_BURST = int(os.getenv("IMMUDB_VAULT_RATE_BURST", "20"))
+        self.IMMUDB_VAULT_QUEUE_TIMEOUT = float(os.getenv("IMMUDB_VAULT_QUEUE_TIMEOUT", "5"))
+
+        # Request tracing (trace 1 request every N, 0 disables it)
+        self.IMMUDB_TRACE_SAMPLE_EVERY = int(os.getenv("IMMUDB_TRACE_SAMPLE_EVERY", "0"))
+        self.IMMUDB_TRACE_MAX = int(os.getenv("IMMUDB_TRACE_MAX", "256"))
+
+        # Persisted schema verification (a TTL of 0 always verifies at startup)
+        self.IMMUDB_SCHEMA_CACHE_PATH = os.getenv(
+            "IMMUDB_SCHEMA_CACHE_PATH",
+            os.path.join(tempfile.gettempdir(), "bragapp_schema_fingerprint.json")
+        )
+        self.IMMUDB_SCHEMA_CACHE_TTL = float(os.getenv("IMMUDB_SCHEMA_CACHE_TTL", "3600"))
+
+        # Schema migration (add the missing secondary indexes at startup)
+        self.IMMUDB_SCHEMA_MIGRATE = str_to_bool(os.getenv("IMMUDB_SCHEMA_MIGRATE", "1"))
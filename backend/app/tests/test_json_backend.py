@@ -0,0 +1,32 @@
+import unittest
+from unittest.mock import patch
+from app import json_backend
+from app.json_backend import FastJSONResponse
+
+class TestJsonBackend(unittest.TestCase):
+
+    def test_round_trip(self):
+        data = {"account_number": "IT60X0542811101000000123456", "amount": 12.5, "name": "Zoë"}
+
+        encoded = json_backend.dumps(data)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json_backend.loads(encoded), data)
+
+    def test_standard_library_fallback(self):
+        data = {"documents": [{"n": 1}], "name": "Zoë"}
+
+        with patch.object(json_backend, "orjson", None):
+            encoded = json_backend.dumps(data)
+            rendered = FastJSONResponse(data).body
+
+        self.assertEqual(encoded, '{"documents":[{"n":1}],"name":"Zoë"}'.encode("utf-8"))
+        self.assertEqual(json_backend.loads(encoded), data)
+        self.assertEqual(json_backend.loads(rendered), data)
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValueError):
+            json_backend.loads(b"{not json")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from app.metrics import Registry
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = Registry()
+
+    def test_counter_and_gauge(self):
+        requests = self.registry.counter("requests", "Requests.", ("status",))
+        in_flight = self.registry.gauge("in_flight", "In flight.")
+
+        requests.inc(status=200)
+        requests.inc(2, status=200)
+        in_flight.inc()
+        in_flight.inc()
+        in_flight.dec()
+
+        text = self.registry.render()
+        self.assertIn("# TYPE requests counter", text)
+        self.assertIn('requests_total{status="200"} 3', text)
+        self.assertIn("in_flight 1", text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        latency = self.registry.histogram("latency", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            latency.observe(value, route="/a")
+
+        text = self.registry.render()
+        self.assertIn('latency_bucket{route="/a",le="0.1"} 2', text)
+        self.assertIn('latency_bucket{route="/a",le="1"} 3', text)
+        self.assertIn('latency_bucket{route="/a",le="+Inf"} 4', text)
+        self.assertIn('latency_count{route="/a"} 4', text)
+        self.assertIn('latency_sum{route="/a"} 2.65', text)
+
+    def test_labels_are_validated_and_escaped(self):
+        counter = self.registry.counter("errors", "Errors.", ("message",))
+
+        with self.assertRaises(ValueError):
+            counter.inc()
+        counter.inc(message='say "hi"\n')
+
+        self.assertIn('errors_total{message="say \\"hi\\"\\n"} 1', self.registry.render())
+
+    def test_collectors_and_duplicates(self):
+        self.registry.add_collector(lambda: [("pool_size", "gauge", "Pool size.", [("pool_size", {}, 4)])])
+        self.registry.gauge("unique", "Unique.")
+
+        self.assertIn("pool_size 4", self.registry.render())
+        with self.assertRaises(ValueError):
+            self.registry.gauge("unique", "Again.")
+
+if __name__ == '__main__':
+    unittest.main()
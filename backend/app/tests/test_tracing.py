@@ -0,0 +1,48 @@
+import asyncio
+import unittest
+from app.tracing import TraceRecorder, current_trace, span
+
+class TestTracing(unittest.IsolatedAsyncioTestCase):
+
+    def test_sampling(self):
+        recorder = TraceRecorder(sample_every=3)
+
+        sampled = []
+        for _ in range(6):
+            started = recorder.start("GET /accounts/")
+            sampled.append(started is not None)
+            if started is not None:
+                recorder.finish(started, 200)
+
+        self.assertEqual(sampled, [True, False, False, True, False, False])
+        self.assertEqual(len(recorder.slowest(10)), 2)
+        self.assertIsNone(current_trace())
+
+    def test_disabled(self):
+        recorder = TraceRecorder(sample_every=0)
+
+        self.assertIsNone(recorder.start("GET /accounts/"))
+        with span("ignored"):
+            pass
+        self.assertEqual(recorder.slowest(), [])
+
+    async def test_spans_follow_the_request_context(self):
+        recorder = TraceRecorder(sample_every=1, max_traces=2)
+
+        async def request(name: str, delay: float):
+            started = recorder.start(name)
+            with span("work", delay=delay):
+                await asyncio.sleep(delay)
+            recorder.finish(started, 200)
+
+        await asyncio.gather(request("fast", 0.001), request("slow", 0.02), request("slowest", 0.03))
+
+        traces = recorder.slowest(10)
+        self.assertEqual([trace["name"] for trace in traces], ["slowest", "slow"])
+        for trace in traces:
+            self.assertEqual(len(trace["spans"]), 1)
+            self.assertEqual(trace["spans"][0]["name"], "work")
+            self.assertIn("work", trace["breakdown_ms"])
+
+if __name__ == '__main__':
+    unittest.main()
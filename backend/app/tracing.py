@@ -0,0 +1,167 @@
+import itertools
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Tuple
+from app.settings import Settings
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+
+class Trace:
+    """
+    Span timings of one sampled API request.
+
+    The trace is bound to the request context, so every coroutine awaited by
+    the request (router, adapter, vault client) adds its spans to it.
+
+    Attributes:
+        trace_id (str): The trace identifier, returned in the `X-Trace-Id` header.
+        name (str): The traced route, e.g. "GET /accounts/".
+        started_at (float): Monotonic start time (`time.perf_counter()`).
+        timestamp (float): Wall-clock start time.
+        duration (Optional[float]): Total seconds, set when the trace is finished.
+        status (Optional[int]): The response HTTP status.
+        spans (List[Tuple[str, float, float, Dict[str, Any]]]): Name, start and
+            duration (seconds, relative to the trace start) and attributes of each span.
+    """
+
+    def __init__(self, name: str):
+        self.trace_id = uuid.uuid4().hex
+        self.name = name
+        self.started_at = time.perf_counter()
+        self.timestamp = time.time()
+        self.duration: Optional[float] = None
+        self.status: Optional[int] = None
+        self.spans: List[Tuple[str, float, float, Dict[str, Any]]] = []
+
+    def add_span(self, name: str, started_at: float, duration: float, **attributes):
+        """
+        Record a span.
+
+        Args:
+            name (str): The span name, e.g. "vault.network".
+            started_at (float): Monotonic start time of the span.
+            duration (float): Seconds spent in the span.
+            **attributes: Extra details, e.g. the HTTP status or the payload size.
+        """
+        self.spans.append((name, started_at - self.started_at, duration, attributes))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the trace in a JSON-friendly form, with times in milliseconds.
+
+        Returns:
+            Dict[str, Any]: The trace details, its spans and the total time per span name.
+        """
+        breakdown: Dict[str, float] = {}
+        for name, _, duration, _ in self.spans:
+            breakdown[name] = breakdown.get(name, 0.0) + duration * 1000
+
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "timestamp": self.timestamp,
+            "duration_ms": (self.duration or 0.0) * 1000,
+            "status": self.status,
+            "breakdown_ms": breakdown,
+            "spans": [
+                {"name": name, "start_ms": start * 1000, "duration_ms": duration * 1000, **attributes}
+                for name, start, duration, attributes in self.spans
+            ]
+        }
+
+def current_trace() -> Optional[Trace]:
+    """Return the trace of the current request, or None when it is not sampled."""
+    return _current_trace.get()
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Time a block as a span of the current trace; a no-op when the request is not sampled.
+
+    Args:
+        name (str): The span name.
+        **attributes: Extra details of the span.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, started_at, time.perf_counter() - started_at, **attributes)
+
+class TraceRecorder:
+    """
+    Samples 1 in `sample_every` requests and keeps the most recent traces.
+
+    Attributes:
+        sample_every (int): Trace one request every `sample_every`; 0 disables tracing.
+        max_traces (int): Finished traces kept.
+    """
+
+    def __init__(self, sample_every: int = 0, max_traces: int = 256):
+        """
+        Initializes the recorder.
+
+        Args:
+            sample_every (int, optional): Trace one request every `sample_every`,
+                0 disables tracing. Defaults to 0.
+            max_traces (int, optional): Finished traces kept. Defaults to 256.
+        """
+        self.sample_every = sample_every
+        self.max_traces = max_traces
+        self._requests = itertools.count()
+        self._traces: deque = deque(maxlen=max(1, max_traces))
+
+    def start(self, name: str) -> Optional[Tuple[Trace, Token]]:
+        """
+        Start a trace for the current request if it is sampled.
+
+        Args:
+            name (str): The traced route.
+
+        Returns:
+            Optional[Tuple[Trace, Token]]: The trace and the context token to pass
+            to `finish()`, or None when the request is not sampled.
+        """
+        if self.sample_every <= 0 or next(self._requests) % self.sample_every:
+            return None
+        trace = Trace(name)
+        return trace, _current_trace.set(trace)
+
+    def finish(self, started: Tuple[Trace, Token], status: int):
+        """
+        Finish a trace started by `start()` and keep it.
+
+        Args:
+            started (Tuple[Trace, Token]): The value returned by `start()`.
+            status (int): The response HTTP status.
+        """
+        trace, token = started
+        trace.duration = time.perf_counter() - trace.started_at
+        trace.status = status
+        _current_trace.reset(token)
+        self._traces.append(trace)
+
+    def slowest(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Return the slowest of the recent traces.
+
+        Args:
+            limit (int, optional): Maximum number of traces. Defaults to 10.
+
+        Returns:
+            List[Dict[str, Any]]: The traces, slowest first.
+        """
+        traces = sorted(self._traces, key=lambda trace: trace.duration or 0.0, reverse=True)
+        return [trace.to_dict() for trace in traces[:max(0, limit)]]
+
+# Traces of the API requests, served by GET /monitoring/traces
+settings = Settings()
+TRACES = TraceRecorder(settings.IMMUDB_TRACE_SAMPLE_EVERY, settings.IMMUDB_TRACE_MAX)
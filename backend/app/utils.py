@@ -16,4 +16,29 @@ def str_to_bool(stringValue, default=True):
         bool: The boolean value corresponding to the input string.
     """
     
-    return stringValue.lower() in ('1', 'true', 'yes', 'on')
\ No newline at end of file
+    return stringValue.lower() in ('1', 'true', 'yes', 'on')
+
+def str_to_int_map(stringValue):
+    """
+    Converts a comma-separated list of `key=value` pairs to a dictionary of integers.
+
+    Empty entries are ignored, so an empty string returns an empty dictionary.
+    For example, "getData=20,setDataBulk=4" returns {"getData": 20, "setDataBulk": 4}.
+
+    Args:
+        stringValue (str): The string to convert.
+
+    Returns:
+        dict: The parsed dictionary.
+
+    Raises:
+        ValueError: If an entry is not a `key=integer` pair.
+    """
+
+    result = {}
+    for entry in stringValue.split(","):
+        entry = entry.strip()
+        if entry:
+            key, value = entry.split("=", 1)
+            result[key.strip()] = int(value)
+    return result
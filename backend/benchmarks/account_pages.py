@@ -0,0 +1,94 @@
+"""
+Per-page CPU cost of turning vault revisions into a GET /accounts/ response body.
+
+Compares the previous path (one `Account` per document, then FastAPI validating
+the list again against `response_model` and rendering it with the standard
+JSON encoder) with the current one (one batch validation, then direct
+serialization).
+
+Usage, from the backend directory:
+
+    python -m benchmarks.account_pages [--sizes 10 100 1000] [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, Dict, List
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from app.adapters.account_codec import accounts_from_revisions, dump_accounts
+from app.schemas.account import Account
+
+RESPONSE_FIELD = create_model_field(name="Response_get_accounts", type_=List[Account], mode="serialization")
+
+def make_revisions(size: int) -> List[Dict]:
+    """Build `size` vault revisions shaped like the ones returned by a search."""
+    return [
+        {
+            "document": {
+                "_id": f"66fae08a{index:016x}",
+                "_vault_md": {"creator": "a:bench", "ts": 1727717514},
+                "account_number": index,
+                "account_name": f"Account {index}",
+                "iban": "IT60X0542811101000000123456",
+                "address": "Via Roma 1, Milano",
+                "amount": 100 + index,
+                "type": "sending" if index % 2 else "receiving"
+            },
+            "revision": "",
+            "transactionId": ""
+        }
+        for index in range(size)
+    ]
+
+async def previous_path(revisions: List[Dict]) -> bytes:
+    """One model per document, validated again by FastAPI before rendering."""
+    accounts = []
+    for revision in revisions:
+        document = revision.get("document", {})
+        accounts.append(Account(
+            account_number=document.get("account_number"),
+            account_name=document.get("account_name"),
+            iban=document.get("iban"),
+            address=document.get("address"),
+            amount=document.get("amount"),
+            type=document.get("type")
+        ))
+
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=accounts)
+    return JSONResponse(content).body
+
+async def current_path(revisions: List[Dict]) -> bytes:
+    """Batch validation and direct serialization."""
+    return dump_accounts(accounts_from_revisions(revisions))
+
+def measure(path: Callable, revisions: List[Dict], repeat: int) -> float:
+    """Return the average CPU milliseconds of one call of `path`."""
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(path(revisions))  # warm up
+        started = time.process_time()
+        for _ in range(repeat):
+            loop.run_until_complete(path(revisions))
+        return (time.process_time() - started) * 1000 / repeat
+    finally:
+        loop.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Page sizes to measure")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls measured per page size")
+    args = parser.parse_args()
+
+    print(f"{'page size':>10} {'previous ms':>12} {'current ms':>11} {'speedup':>8}")
+    for size in args.sizes:
+        revisions = make_revisions(size)
+        repeat = max(1, args.repeat * 10 // max(size, 10))
+        previous = measure(previous_path, revisions, repeat)
+        current = measure(current_path, revisions, repeat)
+        print(f"{size:>10} {previous:>12.3f} {current:>11.3f} {previous / current:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Endpoint benchmark: throughput, latency percentiles, memory and vault calls per request.
+
+Drives `GET /accounts/`, `GET /accounts/count` and `POST /accounts/` through
+the ASGI app (no HTTP server in between) at a given concurrency, against the
+sandbox vault or the fake vault HTTP server, and saves the results as JSON.
+With `--baseline`, the results are compared to a previous run and the exit
+status is 1 if any scenario regressed beyond `--tolerance`.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.endpoints --requests 500 --concurrency 20 --output results.json
+    python -m benchmarks.endpoints --fake-vault --latency 0.002 --baseline results.json
+
+Memory is measured with tracemalloc, which slows the application down; pass
+`--no-memory` when only latency matters.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Client methods counted as vault calls
+VAULT_OPERATIONS = ("getCollectionDetails", "countCollection", "getData", "setData", "setDataBulk")
+
+# Metrics compared with the baseline, and whether higher values are better
+GATED_METRICS = {
+    "throughput": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "vault_calls_per_request": False
+}
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+def count_vault_calls(client) -> Dict[str, int]:
+    """Wrap the vault client methods to count their calls; returns the live counters."""
+    counters = {operation: 0 for operation in VAULT_OPERATIONS}
+
+    def wrap(operation: str, method: Callable[..., Awaitable[Any]]):
+        async def counted(*args, **kwargs):
+            counters[operation] += 1
+            return await method(*args, **kwargs)
+        return counted
+
+    for operation in VAULT_OPERATIONS:
+        setattr(client, operation, wrap(operation, getattr(client, operation)))
+    return counters
+
+async def run_scenario(http, name: str, send: Callable[[Any, int], Awaitable[Any]], requests: int,
+                       concurrency: int, counters: Dict[str, int], measure_memory: bool) -> Dict[str, Any]:
+    """Send `requests` requests with at most `concurrency` in flight and summarize them."""
+    latencies: List[float] = []
+    errors = 0
+    sequence = itertools.count()
+    calls_before = sum(counters.values())
+
+    async def worker():
+        nonlocal errors
+        while True:
+            index = next(sequence)
+            if index >= requests:
+                return
+            started = time.perf_counter()
+            response = await send(http, index)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    if measure_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    peak = 0
+    if measure_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "memory_peak_kb": peak / 1024 if measure_memory else None,
+        "vault_calls_per_request": (sum(counters.values()) - calls_before) / requests
+    }
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    List the regressions of `results` against `baseline`.
+
+    A metric regresses when it is worse than the baseline by more than
+    `tolerance` (a fraction, e.g. 0.1 for 10%).
+    """
+    regressions = []
+    for scenario, metrics in results["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(scenario)
+        if reference is None:
+            continue
+        for metric, higher_is_better in GATED_METRICS.items():
+            current, previous = metrics.get(metric), reference.get(metric)
+            if current is None or previous is None:
+                continue
+            if higher_is_better:
+                regressed = current < previous * (1 - tolerance)
+            else:
+                regressed = current > previous * (1 + tolerance) and current - previous > 1e-9
+            if regressed:
+                regressions.append(f"{scenario}.{metric}: {previous:.3f} -> {current:.3f}")
+    return regressions
+
+def start_fake_vault(port: int, documents: int, latency: float) -> subprocess.Popen:
+    """Launch the fake vault HTTP server and wait until it answers."""
+    import httpx
+
+    process = subprocess.Popen([
+        sys.executable, "-m", "app.immudb.fake_vault",
+        "--port", str(port), "--documents", str(documents), "--latency", str(latency), "--seed", "1"
+    ])
+    url = f"http://127.0.0.1:{port}/ledger/default/collection/accounts/documents/count"
+    for _ in range(100):
+        try:
+            httpx.post(url, json={})
+            return process
+        except httpx.TransportError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("The fake vault did not start.")
+
+async def benchmark(args) -> Dict[str, Any]:
+    import httpx
+    from app.adapters.immudb_adapter_singleton import ImmuDBAdapterSingleton
+    from app.main import app
+    from app.routers.operations import get_immudb_adapter
+
+    adapter = await get_immudb_adapter()
+    counters = count_vault_calls(adapter.client)
+    account_numbers = itertools.count(10 ** 9)
+
+    def new_account() -> Dict[str, Any]:
+        number = next(account_numbers)
+        return {
+            "account_number": number,
+            "account_name": f"Benchmark {number}",
+            "iban": "IT60X0542811101000000123456",
+            "address": "Via Roma 1, Milano",
+            "amount": 100,
+            "type": "sending"
+        }
+
+    scenarios = {
+        "list": lambda http, i: http.get("/accounts/", params={"page": i % args.pages + 1, "count": args.page_size}),
+        "count": lambda http, i: http.get("/accounts/count"),
+        "create": lambda http, i: http.post("/accounts/", json=new_account())
+    }
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        for name in args.scenarios:
+            send = scenarios[name]
+            await run_scenario(http, name, send, args.warmup, args.concurrency, counters, False)
+            results[name] = await run_scenario(
+                http, name, send, args.requests, args.concurrency, counters, args.memory
+            )
+
+    await ImmuDBAdapterSingleton.close_instance()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", default=["list", "count", "create"],
+                        choices=["list", "count", "create"], help="Endpoints to benchmark")
+    parser.add_argument("--requests", type=int, default=300, help="Requests measured per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Requests sent before measuring")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight")
+    parser.add_argument("--page-size", type=int, default=100, help="Accounts per GET /accounts/ page")
+    parser.add_argument("--pages", type=int, default=5, help="Distinct pages requested by GET /accounts/")
+    parser.add_argument("--latency", type=float, default=0.005, help="Simulated vault latency, in seconds")
+    parser.add_argument("--fake-vault", action="store_true", help="Use the fake vault HTTP server instead of the sandbox")
+    parser.add_argument("--fake-vault-port", type=int, default=8181, help="Port of the fake vault HTTP server")
+    parser.add_argument("--documents", type=int, default=1000, help="Accounts seeded in the fake vault")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Skip the tracemalloc measurement")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed regression, as a fraction")
+    args = parser.parse_args()
+
+    # Settings are read once, when the application is imported
+    fake_vault = None
+    if args.fake_vault:
+        fake_vault = start_fake_vault(args.fake_vault_port, args.documents, args.latency)
+        os.environ["IMMUDB_VAULT_SANDBOX"] = "0"
+        os.environ["IMMUD_DB_URL"] = f"http://127.0.0.1:{args.fake_vault_port}"
+        os.environ["IMMUDB_SCHEMA_CACHE_TTL"] = "0"
+    else:
+        os.environ["IMMUDB_VAULT_SANDBOX"] = "1"
+        os.environ["IMMUDB_SANDBOX_LATENCY"] = str(args.latency)
+        os.environ.setdefault("IMMUDB_SANDBOX_SEED", "1")
+
+    try:
+        scenarios = asyncio.run(benchmark(args))
+    finally:
+        if fake_vault is not None:
+            fake_vault.terminate()
+            fake_vault.wait()
+
+    results = {
+        "meta": {
+            "vault": "fake" if args.fake_vault else "sandbox",
+            "latency": args.latency,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "page_size": args.page_size,
+            "python": platform.python_version(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "scenarios": scenarios
+    }
+
+    print(f"{'scenario':<8} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KB':>9} {'calls/req':>9} {'errors':>6}")
+    for name, metrics in scenarios.items():
+        peak = f"{metrics['memory_peak_kb']:.0f}" if metrics["memory_peak_kb"] is not None else "-"
+        print(f"{name:<8} {metrics['throughput']:>9.1f} {metrics['p50_ms']:>8.2f} {metrics['p95_ms']:>8.2f} "
+              f"{metrics['p99_ms']:>8.2f} {peak:>9} {metrics['vault_calls_per_request']:>9.2f} {metrics['errors']:>6}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        if regressions:
+            print("Regressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regression against the baseline.")
+
+if __name__ == "__main__":
+    main()